@@ -33,12 +33,40 @@ from .graphe_op import (
     Arrete,
     Poids
 )
+from .graphe_csr import GrapheCSR
 from .linprog_graph import LinprogGraph
+from .solution import (
+    Solution,
+    Coupe,
+    Verification,
+    SolutionMultiProduits,
+    CourbeParametrique
+)
+from .gomory_hu import ArbreGomoryHu
+from .reduction import Reduction
+from .instrumentation import Statistiques
+from .lot import resout_lot
+from .scenarios import resout_scenarios
+from .multi_produits import FlotMultiProduits
+from .parametrique import courbe_parametrique
 
 __all__ = [
     "GrapheOP",
     "Sommet",
     "Arrete",
     "Poids",
-    "LinprogGraph"
+    "GrapheCSR",
+    "LinprogGraph",
+    "Solution",
+    "Coupe",
+    "Verification",
+    "SolutionMultiProduits",
+    "CourbeParametrique",
+    "ArbreGomoryHu",
+    "Reduction",
+    "Statistiques",
+    "resout_lot",
+    "resout_scenarios",
+    "FlotMultiProduits",
+    "courbe_parametrique"
 ]
\ No newline at end of file
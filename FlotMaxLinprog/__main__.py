@@ -1,18 +1,215 @@
 """Description.
 
-Exemple de fonctionnement du module FlotMaxLinprog.
+Exemple de fonctionnement du module FlotMaxLinprog, et résolution en
+continu d'instances en ligne de commande.
+
+Sans argument, l'exemple à quatre sommets est résolu et affiché. Sinon
+chaque instance lue est résolue dans le même processus et son résultat
+écrit aussitôt sur la sortie standard, une ligne JSON par instance :
+
+    python -m FlotMaxLinprog --methode dinic instances.jsonl reseaux/
+    producteur | python -m FlotMaxLinprog - > resultats.jsonl
+
+Une entrée est `-` (l'entrée standard), un fichier .jsonl, un répertoire
+(tous ses fichiers et graphes sauvegardés) ou une liste d'arrêtes
+`départ arrivée capacité`. Une ligne JSON décrit une instance par
+`arretes` ([départ, arrivée, capacité] ou [départ, arrivée, capacité,
+coût]) ou `voisinage`, avec `id`, `source`, `puits` et `couts` (de même
+forme que `voisinage`) facultatifs. Une instance invalide ou qui échoue
+donne une ligne `{"id", "erreur"}` et le traitement continue.
 """
+import argparse
+import json
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+import numpy as np
 
-from .graphe_op import (
-    GrapheOP,
-    Sommet,
-    Arrete,
-    Poids
-)
+from .graphe_csr import GrapheCSR
+from .graphe_op import GrapheOP
 from .linprog_graph import LinprogGraph
 
-grapheOP = GrapheOP(voisinage={'A': {'B': 4, 'C': 5}, 'B': {'D': 5}, 'C': {'B': 2, 'D': 4}, 'D': {}})
-print(grapheOP)
-exemple = LinprogGraph(grapheOP)
-exemple.affiche_solution()
-exemple.genere_graphique()
\ No newline at end of file
+Instance = Tuple[Any, Optional[GrapheOP], Dict[str, Any]]
+
+
+def exemple():
+    """Exemple historique à quatre sommets."""
+    grapheOP = GrapheOP(voisinage={'A': {'B': 4, 'C': 5}, 'B': {'D': 5}, 'C': {'B': 2, 'D': 4}, 'D': {}})
+    print(grapheOP)
+    linprog_exemple = LinprogGraph(grapheOP)
+    linprog_exemple.affiche_solution()
+    linprog_exemple.genere_graphique()
+
+
+def _verifie_voisinage(donnees: Dict[str, Any], cle: str):
+    """Vérifie que `donnees[cle]`, s'il est donné, est un objet d'objets JSON."""
+    valeur = donnees.get(cle)
+    if valeur is not None and not (
+        isinstance(valeur, dict)
+        and all(isinstance(voisins, dict) for voisins in valeur.values())
+    ):
+        raise ValueError(f"`{cle}` est un objet {{départ: {{arrivée: valeur}}}}.")
+
+
+def _instance_json(ligne: str, defaut: Any) -> Instance:
+    """Graphe et options d'une ligne JSON, dont la forme est vérifiée."""
+    donnees = json.loads(ligne)
+    if not isinstance(donnees, dict):
+        raise ValueError("Une instance est un objet JSON.")
+    identifiant = donnees.get("id", defaut)
+    _verifie_voisinage(donnees, "voisinage")
+    _verifie_voisinage(donnees, "couts")
+    couts = donnees.get("couts")
+    if "voisinage" in donnees:
+        graphe = GrapheOP(voisinage=donnees["voisinage"], couts=couts)
+    elif "arretes" in donnees:
+        if not isinstance(donnees["arretes"], list) or not all(
+            isinstance(arrete, list) and len(arrete) in (3, 4)
+            for arrete in donnees["arretes"]
+        ):
+            raise ValueError(
+                "`arretes` est une liste de [départ, arrivée, capacité] ou "
+                "[départ, arrivée, capacité, coût]."
+            )
+        arretes = [tuple(arrete) for arrete in donnees["arretes"]]
+        for depart, arrivee, _, *cout in arretes:
+            if cout:
+                couts = couts or dict()
+                couts.setdefault(depart, dict())[arrivee] = cout[0]
+        graphe = GrapheOP.par_sommets_arretes(
+            sommets=[], arretes=[arrete[:3] for arrete in arretes], couts=couts
+        )
+    else:
+        raise ValueError("Une instance demande `arretes` ou `voisinage`.")
+    options = {cle: donnees[cle] for cle in ("source", "puits") if cle in donnees}
+    return identifiant, graphe, options
+
+
+def _instances_jsonl(fichier: IO[str], nom: str) -> Iterator[Instance]:
+    """Instances d'un flux JSON Lines, les lignes vides étant ignorées.
+
+    Le graphe est None, avec l'erreur dans les options, si la ligne est invalide.
+    """
+    for numero, ligne in enumerate(fichier, start=1):
+        if not ligne.strip():
+            continue
+        defaut = f"{nom}:{numero}"
+        try:
+            instance = _instance_json(ligne, defaut)
+        except Exception as erreur:
+            instance = defaut, None, {"erreur": str(erreur)}
+        yield instance
+
+
+def _instances(entrees: List[str], format_entree: str) -> Iterator[Instance]:
+    """Instances de toutes les entrées, dans l'ordre."""
+    for entree in entrees:
+        if entree == "-":
+            if format_entree == "jsonl":
+                yield from _instances_jsonl(sys.stdin, "-")
+                continue
+            try:
+                instance = "-", GrapheCSR.par_flux(sys.stdin).en_grapheOP(), dict()
+            except Exception as erreur:
+                instance = "-", None, {"erreur": str(erreur)}
+            yield instance
+            continue
+        chemin = Path(entree)
+        if chemin.is_dir() and not GrapheCSR.est_sauvegarde(chemin):
+            chemins = sorted(
+                fils for fils in chemin.iterdir()
+                if fils.is_file() or GrapheCSR.est_sauvegarde(fils)
+            )
+        else:
+            chemins = [chemin]
+        for fils in chemins:
+            if fils.suffix == ".jsonl":
+                with open(fils) as fichier:
+                    yield from _instances_jsonl(fichier, str(fils))
+                continue
+            try:
+                if GrapheCSR.est_sauvegarde(fils):
+                    graphe = GrapheOP.charge(fils)
+                else:
+                    graphe = GrapheCSR.par_fichier(fils).en_grapheOP()
+                instance = str(fils), graphe, dict()
+            except Exception as erreur:
+                instance = str(fils), None, {"erreur": str(erreur)}
+            yield instance
+
+
+def resout(
+    identifiant: Any,
+    graphe: GrapheOP,
+    options: Dict[str, Any],
+    methode: str,
+    creux: bool,
+    reduction: bool,
+    flots: bool
+) -> Dict[str, Any]:
+    """Résultat sérialisable d'une instance."""
+    debut = perf_counter()
+    linprog_graph = LinprogGraph(
+        graphe, creux=creux, methode=methode, reduction=reduction, **options
+    )
+    solution = linprog_graph.solution
+    resultat: Dict[str, Any] = {
+        "id": identifiant,
+        "valeur": (
+            solution.valeur.item() if isinstance(solution.valeur, np.generic)
+            else solution.valeur
+        ),
+        "statut": int(solution.statut),
+        "message": str(solution.message),
+    }
+    if flots and solution.flots is not None:
+        resultat["flots"] = [
+            [depart, arrivee, flot]
+            for (depart, arrivee), flot in solution.en_liste()
+        ]
+    resultat["temps"] = dict(solution.temps, total=perf_counter() - debut)
+    return resultat
+
+
+def main(arguments: Optional[List[str]] = None):
+    """Point d'entrée en ligne de commande."""
+    arguments = sys.argv[1:] if arguments is None else arguments
+    if not arguments:
+        exemple()
+        return
+    analyseur = argparse.ArgumentParser(
+        prog="python -m FlotMaxLinprog", description=__doc__.splitlines()[2]
+    )
+    analyseur.add_argument(
+        "entrees", nargs="+",
+        help="fichiers .jsonl, listes d'arrêtes, répertoires, ou - pour l'entrée standard"
+    )
+    analyseur.add_argument(
+        "--format", dest="format_entree", choices=("jsonl", "arretes"), default="jsonl",
+        help="format de l'entrée standard"
+    )
+    analyseur.add_argument("--methode", choices=LinprogGraph.methodes, default="highs")
+    analyseur.add_argument("--creux", action="store_true", help="matrices creuses pour HiGHS")
+    analyseur.add_argument("--reduction", action="store_true", help="réduire le réseau avant de le résoudre")
+    analyseur.add_argument("--sans-flots", action="store_true", help="ne pas écrire le flot de chaque arrête")
+    options = analyseur.parse_args(arguments)
+    for identifiant, graphe, donnees in _instances(options.entrees, options.format_entree):
+        if graphe is None:
+            resultat = {"id": identifiant, "erreur": donnees["erreur"]}
+        else:
+            try:
+                resultat = resout(
+                    identifiant, graphe, donnees,
+                    methode=options.methode,
+                    creux=options.creux,
+                    reduction=options.reduction,
+                    flots=not options.sans_flots
+                )
+            except Exception as erreur:
+                resultat = {"id": identifiant, "erreur": str(erreur)}
+        print(json.dumps(resultat), flush=True)
+
+
+if __name__ == "__main__":
+    main()
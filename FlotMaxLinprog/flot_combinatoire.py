@@ -0,0 +1,433 @@
+"""Description.
+
+Algorithmes combinatoires de flot maximal (Dinic et push-relabel) et de
+flot maximal de coût minimal (plus courts chemins successifs) sur un graphe
+résiduel stocké dans des tableaux.
+
+Exemple :
+
+>>> import numpy as np
+>>> reseau = ReseauResiduel(
+...     n_sommets=4,
+...     departs=np.array([0, 0, 1, 2, 2]),
+...     arrivees=np.array([1, 2, 3, 1, 3]),
+...     capacites=np.array([4., 5., 5., 2., 4.])
+... )
+>>> reseau.dinic(source=0, puits=3)
+9.0
+>>> reseau.flots()
+array([4., 5., 5., 1., 4.])
+"""
+from collections import deque
+from heapq import heappop, heappush
+from typing import List, Optional, Tuple
+import numpy as np
+
+
+class ReseauResiduel:
+    """Graphe résiduel en tableaux.
+
+    L'arc 2i porte la capacité résiduelle de l'arrête i et l'arc 2i + 1
+    l'arc retour, dont la capacité résiduelle est le flot de l'arrête i.
+    Les arcs sont rangés par sommet de départ (format CSR).
+    """
+
+    def __init__(
+        self,
+        n_sommets: int,
+        departs: np.array,
+        arrivees: np.array,
+        capacites: np.array,
+        flots: Optional[np.array] = None
+    ):
+        """Initialise avec un flot donné, nul par défaut."""
+        n_arretes = len(departs)
+        queues = np.empty(2 * n_arretes, dtype=np.int64)
+        queues[0::2] = departs
+        queues[1::2] = arrivees
+        tetes = np.empty(2 * n_arretes, dtype=np.int64)
+        tetes[0::2] = arrivees
+        tetes[1::2] = departs
+        ordre = np.argsort(queues, kind="stable")
+        self._n = n_sommets
+        self._debut: List[int] = np.searchsorted(
+            queues[ordre], np.arange(n_sommets + 1)
+        ).tolist()
+        self._arcs: List[int] = ordre.tolist()
+        self._tete: List[int] = tetes.tolist()
+        self._capacites = np.asarray(capacites)
+        residu = np.zeros(2 * n_arretes, dtype=self._capacites.dtype)
+        residu[0::2] = self._capacites
+        if flots is not None:
+            flots = np.clip(flots, 0, self._capacites).astype(self._capacites.dtype)
+            residu[0::2] -= flots
+            residu[1::2] = flots
+        self._residu: list = residu.tolist()
+        self._queues: List[int] = queues.tolist()
+        self.iterations = 0
+        self._eps = self._tolerance(self._capacites)
+
+    @staticmethod
+    def _tolerance(capacites: np.array) -> float:
+        """Résidu en dessous duquel un arc est considéré saturé."""
+        if np.issubdtype(capacites.dtype, np.integer):
+            return 0
+        return 1e-12 * max(1.0, float(np.abs(capacites).max(initial=0)))
+
+    def flots(self) -> np.array:
+        """Flot courant sur chaque arrête."""
+        return np.array(self._residu[1::2], dtype=self._capacites.dtype)
+
+    def reinitialise(
+        self,
+        capacites: Optional[np.array] = None,
+        flots: Optional[np.array] = None
+    ):
+        """Remet le flot à zéro, ou à `flots`, sans reconstruire les tableaux.
+
+        De nouvelles capacités, dans l'ordre des arrêtes, peuvent être données ;
+        le flot de départ est ramené entre 0 et ces capacités.
+        """
+        if capacites is not None:
+            capacites = np.asarray(capacites)
+            if capacites.shape != self._capacites.shape:
+                raise ValueError(
+                    f"Il faut {len(self._capacites)} capacités, pas {len(capacites)}."
+                )
+            self._capacites = capacites
+            self._eps = self._tolerance(capacites)
+        residu = np.zeros(len(self._residu), dtype=self._capacites.dtype)
+        residu[0::2] = self._capacites
+        if flots is not None:
+            flots = np.clip(flots, 0, self._capacites).astype(self._capacites.dtype)
+            residu[0::2] -= flots
+            residu[1::2] = flots
+        self._residu = residu.tolist()
+
+    def atteignables(self, source: int) -> np.array:
+        """Masque des sommets atteignables depuis la source dans le graphe résiduel."""
+        return np.array(self._niveaux(source)) >= 0
+
+    def _niveaux(self, source: int) -> List[int]:
+        """Distances en nombre d'arcs depuis la source dans le graphe résiduel."""
+        debut, arcs, tete, residu, eps = (
+            self._debut, self._arcs, self._tete, self._residu, self._eps
+        )
+        niveau = [-1] * self._n
+        niveau[source] = 0
+        file = [source]
+        for u in file:
+            for i in range(debut[u], debut[u + 1]):
+                a = arcs[i]
+                v = tete[a]
+                if residu[a] > eps and niveau[v] < 0:
+                    niveau[v] = niveau[u] + 1
+                    file.append(v)
+        return niveau
+
+    def _flot_bloquant(
+        self, source: int, puits: int, niveau: List[int], limite: Optional[float]
+    ):
+        """Flot bloquant du graphe de niveaux par parcours en profondeur itératif."""
+        debut, arcs, tete, residu, eps = (
+            self._debut, self._arcs, self._tete, self._residu, self._eps
+        )
+        courant = debut[:-1]
+        chemin: List[int] = []
+        total = 0
+        u = source
+        while True:
+            if u == puits:
+                delta = min(residu[a] for a in chemin)
+                if limite is not None:
+                    delta = min(delta, limite - total)
+                for a in chemin:
+                    residu[a] -= delta
+                    residu[a ^ 1] += delta
+                total += delta
+                if limite is not None and total >= limite:
+                    return total
+                k = next(
+                    (k for k, a in enumerate(chemin) if residu[a] <= eps),
+                    len(chemin) - 1
+                )
+                u = tete[chemin[k] ^ 1]
+                del chemin[k:]
+                continue
+            i, fin = courant[u], debut[u + 1]
+            while i < fin:
+                a = arcs[i]
+                if residu[a] > eps and niveau[tete[a]] == niveau[u] + 1:
+                    break
+                i += 1
+            courant[u] = i
+            if i < fin:
+                a = arcs[i]
+                chemin.append(a)
+                u = tete[a]
+            elif u == source:
+                return total
+            else:
+                niveau[u] = -1
+                a = chemin.pop()
+                u = tete[a ^ 1]
+                courant[u] += 1
+
+    def dinic(self, source: int, puits: int, limite: Optional[float] = None):
+        """Augmente le flot courant par l'algorithme de Dinic, renvoie le flot ajouté."""
+        total = 0
+        self.iterations = 0
+        if source == puits:
+            return total
+        while limite is None or total < limite:
+            niveau = self._niveaux(source)
+            if niveau[puits] < 0:
+                break
+            self.iterations += 1
+            total += self._flot_bloquant(
+                source, puits, niveau,
+                None if limite is None else limite - total
+            )
+        return total
+
+    def push_relabel(self, source: int, puits: int):
+        """Flot maximal par push-relabel FIFO, renvoie le flot ajouté.
+
+        La première phase pousse l'excès vers le puits, les sommets qui ne
+        peuvent plus l'atteindre étant écartés (hauteur n) ; la seconde
+        renvoie l'excès restant vers la source.
+        """
+        self.iterations = 0
+        if source == puits:
+            return 0
+        debut, arcs, tete, residu, eps = (
+            self._debut, self._arcs, self._tete, self._residu, self._eps
+        )
+        exces = [0] * self._n
+        for i in range(debut[source], debut[source + 1]):
+            a = arcs[i]
+            delta = residu[a]
+            if delta > eps:
+                residu[a] -= delta
+                residu[a ^ 1] += delta
+                exces[tete[a]] += delta
+                exces[source] -= delta
+        self._pousse(exces, cible=puits, exclu=source)
+        valeur = exces[puits]
+        self._pousse(exces, cible=source, exclu=puits)
+        return valeur
+
+    def _hauteurs(self, cible: int, exclu: int) -> List[int]:
+        """Distances à la cible dans le graphe résiduel, n si elle est inatteignable."""
+        n, debut, arcs, tete, residu, eps = (
+            self._n, self._debut, self._arcs, self._tete, self._residu, self._eps
+        )
+        hauteur = [n] * n
+        hauteur[cible] = 0
+        file = [cible]
+        for v in file:
+            for i in range(debut[v], debut[v + 1]):
+                a = arcs[i]
+                u = tete[a]
+                if residu[a ^ 1] > eps and hauteur[u] == n and u != exclu:
+                    hauteur[u] = hauteur[v] + 1
+                    file.append(u)
+        return hauteur
+
+    def _pousse(self, exces: List[float], cible: int, exclu: int):
+        """Pousse l'excès des sommets actifs vers la cible, sans passer par `exclu`.
+
+        Les hauteurs sont recalculées exactement par un parcours en largeur
+        depuis la cible toutes les n remontées. `effectifs[h]` compte les
+        sommets de hauteur h et `etages[h]` les liste, avec d'éventuels
+        sommets déjà remontés : quand un étage se vide, seuls les étages
+        supérieurs sont parcourus et leurs sommets passent à la hauteur n
+        (heuristique du trou). Chaque entrée d'étage est parcourue au plus
+        une fois.
+        """
+        n, debut, arcs, tete, residu, eps = (
+            self._n, self._debut, self._arcs, self._tete, self._residu, self._eps
+        )
+
+        def etages_de(hauteur: List[int]) -> Tuple[List[int], List[List[int]]]:
+            effectifs = [0] * (n + 1)
+            etages: List[List[int]] = [[] for _ in range(n)]
+            for v, h in enumerate(hauteur):
+                effectifs[h] += 1
+                if h < n:
+                    etages[h].append(v)
+            return effectifs, etages
+
+        hauteur = self._hauteurs(cible, exclu)
+        effectifs, etages = etages_de(hauteur)
+        plus_haut = max((h for h in hauteur if h < n), default=0)
+        actifs = deque(
+            u for u in range(n)
+            if exces[u] > eps and hauteur[u] < n and u != cible and u != exclu
+        )
+        est_actif = [False] * n
+        for u in actifs:
+            est_actif[u] = True
+        courant = debut[:-1]
+        remontees = 0
+        while actifs:
+            u = actifs.popleft()
+            est_actif[u] = False
+            while exces[u] > eps and hauteur[u] < n:
+                i = courant[u]
+                if i == debut[u + 1]:
+                    ancienne = hauteur[u]
+                    nouvelle = min(
+                        (
+                            hauteur[tete[arcs[j]]] + 1
+                            for j in range(debut[u], debut[u + 1])
+                            if residu[arcs[j]] > eps
+                        ),
+                        default=n
+                    )
+                    hauteur[u] = min(nouvelle, n)
+                    effectifs[ancienne] -= 1
+                    effectifs[hauteur[u]] += 1
+                    if hauteur[u] < n:
+                        etages[hauteur[u]].append(u)
+                        plus_haut = max(plus_haut, hauteur[u])
+                    courant[u] = debut[u]
+                    self.iterations += 1
+                    remontees += 1
+                    if effectifs[ancienne] == 0:
+                        etages[ancienne] = []
+                        for h in range(ancienne + 1, plus_haut + 1):
+                            for v in etages[h]:
+                                if hauteur[v] == h:
+                                    hauteur[v] = n
+                                    effectifs[h] -= 1
+                                    effectifs[n] += 1
+                            etages[h] = []
+                        plus_haut = max(ancienne - 1, 0)
+                    if remontees >= n:
+                        remontees = 0
+                        hauteur = self._hauteurs(cible, exclu)
+                        effectifs, etages = etages_de(hauteur)
+                        plus_haut = max((h for h in hauteur if h < n), default=0)
+                        courant = debut[:-1]
+                    continue
+                a = arcs[i]
+                v = tete[a]
+                if residu[a] > eps and hauteur[u] == hauteur[v] + 1:
+                    delta = min(exces[u], residu[a])
+                    residu[a] -= delta
+                    residu[a ^ 1] += delta
+                    exces[u] -= delta
+                    exces[v] += delta
+                    if not est_actif[v] and v != cible and v != exclu:
+                        est_actif[v] = True
+                        actifs.append(v)
+                else:
+                    courant[u] = i + 1
+
+    def _potentiels_initiaux(self, source: int, couts_arcs: np.array) -> List[float]:
+        """Distances depuis la source par Bellman-Ford vectorisé, nulles si tous les coûts sont positifs."""
+        if not (couts_arcs < 0).any():
+            return [0] * self._n
+        actifs = np.array(self._residu) > self._eps
+        queues = np.array(self._queues)[actifs]
+        tetes = np.array(self._tete)[actifs]
+        couts = couts_arcs[actifs]
+        distances = np.full(self._n, np.inf)
+        distances[source] = 0
+        for _ in range(self._n):
+            nouvelles = distances.copy()
+            np.minimum.at(nouvelles, tetes, distances[queues] + couts)
+            if np.array_equal(nouvelles, distances):
+                break
+            distances = nouvelles
+        else:
+            raise ValueError("Le graphe contient un cycle de coût négatif.")
+        distances[np.isinf(distances)] = 0
+        return distances.tolist()
+
+    def cout_minimal(self, source: int, puits: int, couts: np.array) -> Tuple[float, float]:
+        """Flot maximal de coût minimal par plus courts chemins successifs.
+
+        Les plus courts chemins sont calculés par Dijkstra sur les coûts
+        réduits par des potentiels, qui restent positifs d'une itération à
+        l'autre. Part du flot courant, supposé nul. Renvoie le flot et le
+        coût ajoutés.
+        """
+        n, debut, arcs, tete, residu, eps = (
+            self._n, self._debut, self._arcs, self._tete, self._residu, self._eps
+        )
+        couts_arcs = np.empty(len(residu))
+        couts_arcs[0::2] = couts
+        couts_arcs[1::2] = -np.asarray(couts)
+        potentiel = self._potentiels_initiaux(source, couts_arcs)
+        couts_arcs = couts_arcs.tolist()
+        flot_total, cout_total = 0, 0
+        self.iterations = 0
+        while True:
+            distance = [float("inf")] * n
+            precedent = [-1] * n
+            distance[source] = 0
+            tas = [(0, source)]
+            while tas:
+                d, u = heappop(tas)
+                if d > distance[u]:
+                    continue
+                for i in range(debut[u], debut[u + 1]):
+                    a = arcs[i]
+                    if residu[a] > eps:
+                        v = tete[a]
+                        nouvelle = d + couts_arcs[a] + potentiel[u] - potentiel[v]
+                        if nouvelle < distance[v]:
+                            distance[v] = nouvelle
+                            precedent[v] = a
+                            heappush(tas, (nouvelle, v))
+            if precedent[puits] < 0:
+                break
+            for v in range(n):
+                if precedent[v] >= 0 or v == source:
+                    potentiel[v] += distance[v]
+            delta = float("inf")
+            v = puits
+            while v != source:
+                a = precedent[v]
+                delta = min(delta, residu[a])
+                v = tete[a ^ 1]
+            v = puits
+            while v != source:
+                a = precedent[v]
+                residu[a] -= delta
+                residu[a ^ 1] += delta
+                cout_total += delta * couts_arcs[a]
+                v = tete[a ^ 1]
+            flot_total += delta
+            self.iterations += 1
+        return flot_total, cout_total
+
+    def modifie_capacite(self, arrete: int, capacite, source: int, puits: int):
+        """Change la capacité d'une arrête et répare le flot maximal.
+
+        Une hausse augmente le flot à partir du flot courant. Une baisse sous
+        le flot courant redirige d'abord le surplus autour de l'arrête, puis
+        renvoie le reste vers la source et retire le même flot du puits.
+        Renvoie la variation de la valeur du flot.
+        """
+        a = 2 * arrete
+        flot = self._residu[a + 1]
+        variation = 0
+        if capacite >= flot:
+            self._residu[a] = capacite - flot
+        else:
+            surplus = flot - capacite
+            self._residu[a] = 0
+            self._residu[a + 1] = capacite
+            depart, arrivee = self._queues[a], self._queues[a + 1]
+            reste = surplus - self.dinic(depart, arrivee, limite=surplus)
+            if reste > self._eps:
+                if depart != source:
+                    self.dinic(depart, source, limite=reste)
+                if arrivee != puits:
+                    self.dinic(puits, arrivee, limite=reste)
+                variation -= reste
+        variation += self.dinic(source, puits)
+        return variation
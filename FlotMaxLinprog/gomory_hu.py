@@ -0,0 +1,122 @@
+"""Description.
+
+Arbre de Gomory-Hu d'un graphe symétrique : après V - 1 calculs de flot
+maximal, la coupe minimale entre deux sommets quelconques se lit sur le
+chemin qui les relie dans l'arbre.
+
+Exemple :
+
+>>> graphe = GrapheOP(voisinage={
+...     'A': {'B': 3, 'C': 1},
+...     'B': {'A': 3, 'C': 2},
+...     'C': {'A': 1, 'B': 2, 'D': 4},
+...     'D': {'C': 4}
+... })
+>>> arbre = ArbreGomoryHu(graphe)
+>>> arbre.valeur_coupe('A', 'D')
+3.0
+>>> coupe = arbre.coupe_min('A', 'D')
+>>> sorted(coupe.cote_source), coupe.arretes
+(['A', 'B'], [('A', 'C'), ('B', 'C')])
+"""
+from typing import List, Tuple
+import numpy as np
+
+from .flot_combinatoire import ReseauResiduel
+from .graphe_csr import GrapheCSR
+from .graphe_op import GrapheOP, Sommet, Poids
+from .solution import Coupe
+
+
+class ArbreGomoryHu:
+    """Arbre des coupes minimales de toutes les paires de sommets (algorithme de Gusfield)."""
+
+    def __init__(self, grapheOP: GrapheOP):
+        """Construit l'arbre avec V - 1 appels à l'algorithme de Dinic."""
+        if grapheOP.est_ordonne:
+            raise ValueError(
+                "L'arbre de Gomory-Hu demande un graphe symétrique."
+            )
+        self._csr = GrapheCSR.par_grapheOP(grapheOP)
+        n = self._csr.n_sommets
+        departs, arrivees, capacites = self._csr.arretes
+        reseau = ReseauResiduel(n, departs, arrivees, capacites.astype(float))
+        parent = np.zeros(n, dtype=np.int64)
+        poids = np.zeros(n)
+        for sommet in range(1, n):
+            cible = parent[sommet]
+            reseau.reinitialise()
+            valeur = reseau.dinic(sommet, cible)
+            poids[sommet] = valeur
+            cote = reseau.atteignables(sommet)
+            deplaces = cote & (parent == cible)
+            deplaces[sommet] = False
+            parent[deplaces] = sommet
+            if cote[parent[cible]]:
+                parent[sommet] = parent[cible]
+                parent[cible] = sommet
+                poids[sommet] = poids[cible]
+                poids[cible] = valeur
+        self._parent = parent
+        self._poids = poids
+        self._profondeur = self._calcule_profondeurs()
+
+    def _calcule_profondeurs(self) -> np.array:
+        """Profondeur de chaque sommet, la racine étant le sommet 0."""
+        profondeur = np.full(len(self._parent), -1)
+        profondeur[0] = 0
+        for sommet in range(len(self._parent)):
+            chemin = []
+            while profondeur[sommet] < 0:
+                chemin.append(sommet)
+                sommet = self._parent[sommet]
+            for precedent in reversed(chemin):
+                profondeur[precedent] = profondeur[sommet] + 1
+                sommet = precedent
+        return profondeur
+
+    @property
+    def arretes(self) -> List[Tuple[Sommet, Sommet, Poids]]:
+        """Arrêtes de l'arbre avec la valeur de la coupe associée."""
+        noms = self._csr.noms.tolist()
+        return [
+            (noms[sommet], noms[self._parent[sommet]], float(self._poids[sommet]))
+            for sommet in range(1, len(noms))
+        ]
+
+    def _arrete_minimale(self, x: Sommet, y: Sommet) -> int:
+        """Sommet fils de l'arrête de poids minimal sur le chemin de x à y."""
+        u, v = self._csr.identifiant(x), self._csr.identifiant(y)
+        if u == v:
+            raise ValueError("La source et le puits doivent être distincts.")
+        meilleur = -1
+        while u != v:
+            if self._profondeur[u] < self._profondeur[v]:
+                u, v = v, u
+            if meilleur < 0 or self._poids[u] < self._poids[meilleur]:
+                meilleur = u
+            u = self._parent[u]
+        return meilleur
+
+    def valeur_coupe(self, x: Sommet, y: Sommet) -> Poids:
+        """Capacité de la coupe minimale entre x et y."""
+        return float(self._poids[self._arrete_minimale(x, y)])
+
+    def coupe_min(self, x: Sommet, y: Sommet) -> Coupe:
+        """Coupe minimale entre x et y, le côté source contenant x."""
+        fils = self._arrete_minimale(x, y)
+        sous_arbre = np.zeros(len(self._parent), dtype=bool)
+        sous_arbre[fils] = True
+        for sommet in np.argsort(self._profondeur, kind="stable"):
+            if sommet != 0 and sous_arbre[self._parent[sommet]]:
+                sous_arbre[sommet] = True
+        if not sous_arbre[self._csr.identifiant(x)]:
+            sous_arbre = ~sous_arbre
+        departs, arrivees, _ = self._csr.arretes
+        noms = self._csr.noms
+        coupees = sous_arbre[departs] & ~sous_arbre[arrivees]
+        return Coupe(
+            cote_source=set(noms[sous_arbre].tolist()),
+            arretes=list(zip(noms[departs[coupees]].tolist(), noms[arrivees[coupees]].tolist())),
+            capacite=float(self._poids[fils])
+        )
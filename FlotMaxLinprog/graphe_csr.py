@@ -0,0 +1,398 @@
+"""Description.
+
+Stockage compact d'un graphe orienté pondéré :
+    - les noms des sommets sont internés en identifiants entiers (int32),
+    - les arrêtes sont rangées par sommet de départ dans des tableaux CSR.
+
+Sur disque, un graphe est un répertoire de fichiers .npy (`noms`, `indptr`,
+`indices`, `capacites`) relus en mémoire projetée : l'ouverture ne lit rien
+et plusieurs processus partagent les mêmes pages.
+"""
+import gzip
+import warnings
+from itertools import chain, islice
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Tuple, Union
+import numpy as np
+
+from .graphe_op import GrapheOP, Sommet, Poids
+
+
+class GrapheCSR:
+    """Graphe orienté pondéré en tableaux `indptr` / `indices` / `capacites`.
+
+    Exemple :
+
+    >>> exemple = GrapheCSR.par_voisinage(
+    ...     {'A': {'B': 4, 'C': 5}, 'B': {'D': 5}, 'C': {'B': 2, 'D': 4}, 'D': {}}
+    ... )
+    >>> exemple
+    GrapheCSR(n_sommets=4, n_arretes=5)
+    >>> exemple.noms
+    array(['A', 'B', 'C', 'D'], dtype='<U1')
+    >>> exemple.indptr
+    array([0, 2, 3, 5, 5], dtype=int32)
+    >>> exemple.indices
+    array([1, 2, 3, 1, 3], dtype=int32)
+    >>> exemple.capacites
+    array([4, 5, 5, 2, 4])
+    >>> exemple["C"]
+    {'B': 2, 'D': 4}
+    >>> exemple.adjacence.toarray()
+    array([[0, 4, 5, 0],
+           [0, 0, 0, 5],
+           [0, 2, 0, 4],
+           [0, 0, 0, 0]])
+    >>> exemple.en_grapheOP() == GrapheOP.par_str_ordonne('''
+    ... A B 4
+    ... A C 5
+    ... B D 5
+    ... C B 2
+    ... C D 4
+    ... ''')
+    True
+    """
+
+    def __init__(
+        self,
+        noms: np.array,
+        indptr: np.array,
+        indices: np.array,
+        capacites: np.array
+    ):
+        """Initialise par les tableaux CSR, sans copie si les types conviennent."""
+        n_arretes = len(indices)
+        type_index = np.int32 if n_arretes < 2**31 else np.int64
+        self._noms = np.asarray(noms)
+        self._indptr = np.asarray(indptr, dtype=type_index)
+        self._indices = np.asarray(indices, dtype=np.int32)
+        self._capacites = np.asarray(capacites)
+        if len(self._indptr) != len(self._noms) + 1 or len(self._capacites) != n_arretes:
+            raise ValueError("Les tableaux CSR ne sont pas cohérents.")
+        self._departs: Optional[np.array] = None
+        self._identifiants: Optional[Dict[Sommet, int]] = None
+
+    def __eq__(self, autre: Any) -> bool:
+        """Egalite des tableaux."""
+        if type(self) != type(autre):
+            return False
+        return (
+            np.array_equal(self._noms, autre._noms)
+            and np.array_equal(self._indptr, autre._indptr)
+            and np.array_equal(self._indices, autre._indices)
+            and np.array_equal(self._capacites, autre._capacites)
+        )
+
+    def __repr__(self):
+        """Repr pour débug."""
+        return f"GrapheCSR(n_sommets={self.n_sommets}, n_arretes={self.n_arretes})"
+
+    @property
+    def n_sommets(self) -> int:
+        """Nombre de sommets."""
+        return len(self._noms)
+
+    @property
+    def n_arretes(self) -> int:
+        """Nombre d'arrêtes."""
+        return len(self._indices)
+
+    @property
+    def noms(self) -> np.array:
+        """Nom de chaque identifiant de sommet."""
+        return self._noms
+
+    @property
+    def indptr(self) -> np.array:
+        """Début des arrêtes de chaque sommet de départ."""
+        return self._indptr
+
+    @property
+    def indices(self) -> np.array:
+        """Identifiant du sommet d'arrivée de chaque arrête."""
+        return self._indices
+
+    @property
+    def capacites(self) -> np.array:
+        """Capacité de chaque arrête."""
+        return self._capacites
+
+    @property
+    def sommets(self) -> np.array:
+        """Noms des sommets, sans copie."""
+        return self._noms
+
+    @property
+    def departs(self) -> np.array:
+        """Identifiant du sommet de départ de chaque arrête, calculé une fois."""
+        if self._departs is None:
+            self._departs = np.repeat(
+                np.arange(self.n_sommets, dtype=np.int32), np.diff(self._indptr)
+            )
+        return self._departs
+
+    @property
+    def arretes(self) -> Tuple[np.array, np.array, np.array]:
+        """Tableaux (départs, arrivées, capacités) ; les deux derniers sans copie."""
+        return self.departs, self._indices, self._capacites
+
+    @property
+    def adjacence(self):
+        """Matrice d'adjacence creuse partageant la mémoire des tableaux CSR."""
+        from scipy import sparse
+        return sparse.csr_matrix(
+            (self._capacites, self._indices.astype(self._indptr.dtype, copy=False), self._indptr),
+            shape=(self.n_sommets, self.n_sommets),
+            copy=False
+        )
+
+    def identifiant(self, sommet: Sommet) -> int:
+        """Identifiant entier d'un sommet."""
+        if self._identifiants is None:
+            self._identifiants = {
+                nom: i for i, nom in enumerate(self._noms.tolist())
+            }
+        return self._identifiants[sommet]
+
+    def __getitem__(self, sommet: Sommet) -> Dict[Sommet, Poids]:
+        """Renvoit le voisinage du sommet."""
+        i = self.identifiant(sommet)
+        debut, fin = self._indptr[i], self._indptr[i + 1]
+        return dict(
+            zip(
+                self._noms[self._indices[debut:fin]].tolist(),
+                self._capacites[debut:fin].tolist()
+            )
+        )
+
+    @classmethod
+    def par_voisinage(cls, voisinage: Dict[Sommet, Dict[Sommet, Poids]]) -> "GrapheCSR":
+        """Constructeur par dictionnaire de voisinage."""
+        noms = list(voisinage)
+        identifiants = {nom: i for i, nom in enumerate(noms)}
+        for voisins in voisinage.values():
+            for arrivee in voisins:
+                if arrivee not in identifiants:
+                    identifiants[arrivee] = len(noms)
+                    noms.append(arrivee)
+        degres = np.zeros(len(noms) + 1, dtype=np.int64)
+        degres[1:len(voisinage) + 1] = [len(voisins) for voisins in voisinage.values()]
+        n_arretes = int(degres.sum())
+        indices = np.fromiter(
+            (identifiants[arrivee] for voisins in voisinage.values() for arrivee in voisins),
+            dtype=np.int32,
+            count=n_arretes
+        )
+        capacites = np.array(
+            list(chain.from_iterable(voisins.values() for voisins in voisinage.values()))
+        )
+        return cls(
+            noms=np.array(noms, dtype=str),
+            indptr=np.cumsum(degres),
+            indices=indices,
+            capacites=capacites
+        )
+
+    @classmethod
+    def par_grapheOP(cls, graphe: GrapheOP) -> "GrapheCSR":
+        """Constructeur à partir d'un graphe orienté pondéré."""
+        return cls.par_voisinage(graphe._voisinage)
+
+    @classmethod
+    def par_fichier(
+        cls,
+        chemin: Union[str, Path],
+        separateur: Optional[str] = None,
+        taille_bloc: int = 1_000_000
+    ) -> "GrapheCSR":
+        """Lit une liste d'arrêtes `départ arrivée capacité` par blocs de lignes.
+
+        Le séparateur par défaut est l'espace (sinon par exemple ","), les
+        lignes commençant par # sont ignorées et un fichier .gz est décompressé
+        à la volée. Les sommets sont numérotés par ordre d'apparition.
+        """
+        chemin = Path(chemin)
+        ouvre = gzip.open if chemin.suffix == ".gz" else open
+        with ouvre(chemin, "rt") as fichier:
+            return cls.par_flux(fichier, separateur=separateur, taille_bloc=taille_bloc)
+
+    @classmethod
+    def par_flux(
+        cls,
+        fichier: IO[str],
+        separateur: Optional[str] = None,
+        taille_bloc: int = 1_000_000
+    ) -> "GrapheCSR":
+        """Comme `par_fichier`, sur un flux de texte déjà ouvert (par exemple sys.stdin)."""
+        identifiants: Dict[Sommet, int] = dict()
+        departs: List[np.array] = []
+        arrivees: List[np.array] = []
+        capacites: List[np.array] = []
+        while lignes := list(islice(fichier, taille_bloc)):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                bloc = np.loadtxt(
+                    lignes, dtype=str, delimiter=separateur, comments="#", ndmin=2
+                )
+            if bloc.shape[0] == 0:
+                continue
+            if bloc.shape[1] != 3:
+                raise ValueError(
+                    f"Il faut trois colonnes par ligne dans {getattr(fichier, 'name', fichier)}, "
+                    f"pas {bloc.shape[1]}."
+                )
+            identifiants_bloc = cls._interne(bloc[:, :2].ravel(), identifiants)
+            departs.append(identifiants_bloc[0::2])
+            arrivees.append(identifiants_bloc[1::2])
+            try:
+                capacites.append(bloc[:, 2].astype(np.int64))
+            except ValueError:
+                capacites.append(bloc[:, 2].astype(np.float64))
+        noms = np.array(list(identifiants), dtype=str)
+        return cls._par_arretes(
+            noms=noms,
+            departs=np.concatenate(departs or [np.empty(0, dtype=np.int32)]),
+            arrivees=np.concatenate(arrivees or [np.empty(0, dtype=np.int32)]),
+            capacites=np.concatenate(capacites or [np.empty(0, dtype=np.int64)])
+        )
+
+    aggregations = ("somme", "max", "erreur")
+
+    @classmethod
+    def par_tableaux(
+        cls,
+        departs: np.array,
+        arrivees: np.array,
+        capacites: np.array,
+        aggregation: str = "somme"
+    ) -> "GrapheCSR":
+        """Constructeur par tableaux parallèles d'arrêtes, sans boucle par arrête.
+
+        Les arrêtes parallèles (même départ, même arrivée) sont fusionnées
+        selon `aggregation` : somme ou maximum des capacités, ou ValueError
+        avec "erreur". Une arrête fusionnée garde la place de sa première
+        occurrence et les sommets sont numérotés par ordre d'apparition.
+        """
+        if aggregation not in cls.aggregations:
+            raise ValueError(
+                f"Agrégation {aggregation} inconnue, choisir parmi {cls.aggregations}."
+            )
+        departs, arrivees = np.asarray(departs), np.asarray(arrivees)
+        capacites = np.asarray(capacites)
+        if not departs.ndim == arrivees.ndim == capacites.ndim == 1 or not (
+            len(departs) == len(arrivees) == len(capacites)
+        ):
+            raise ValueError(
+                "Il faut trois tableaux à une dimension de même longueur, pas "
+                f"{departs.shape}, {arrivees.shape} et {capacites.shape}."
+            )
+        # Les noms sont internés dans leur type d'origine ; seuls les sommets
+        # distincts sont ensuite convertis en chaînes.
+        identifiants: Dict[Sommet, int] = dict()
+        codes = cls._interne(np.stack((departs, arrivees), axis=1).ravel(), identifiants)
+        noms = np.array(list(identifiants)).astype(str)
+        departs, arrivees = codes[0::2], codes[1::2]
+        if aggregation != "erreur" and len(capacites):
+            cles = departs.astype(np.int64) * len(noms) + arrivees
+            ordre = np.argsort(cles, kind="stable")
+            cles_triees = cles[ordre]
+            debuts = np.flatnonzero(np.r_[True, cles_triees[1:] != cles_triees[:-1]])
+            operation = np.add if aggregation == "somme" else np.maximum
+            capacites = operation.reduceat(capacites[ordre], debuts)
+            # Le tri stable met la première occurrence de chaque arrête en tête de son groupe.
+            premieres = ordre[debuts]
+            rangs = np.argsort(premieres)
+            departs, arrivees = departs[premieres[rangs]], arrivees[premieres[rangs]]
+            capacites = capacites[rangs]
+        return cls._par_arretes(
+            noms=noms, departs=departs, arrivees=arrivees, capacites=capacites
+        )
+
+    @staticmethod
+    def _interne(noms: np.array, identifiants: Dict[Sommet, int]) -> np.array:
+        """Identifiants des noms, les nouveaux étant numérotés par ordre d'apparition."""
+        uniques, premiers, inverse = np.unique(
+            noms, return_index=True, return_inverse=True
+        )
+        ordre = np.argsort(premiers, kind="stable")
+        codes = np.empty(len(uniques), dtype=np.int32)
+        codes[ordre] = np.fromiter(
+            (identifiants.setdefault(nom, len(identifiants)) for nom in uniques[ordre].tolist()),
+            dtype=np.int32,
+            count=len(uniques)
+        )
+        return codes[inverse.ravel()]
+
+    @classmethod
+    def _par_arretes(
+        cls,
+        noms: np.array,
+        departs: np.array,
+        arrivees: np.array,
+        capacites: np.array
+    ) -> "GrapheCSR":
+        """Range des arrêtes sans doublon par sommet de départ, en gardant leur ordre."""
+        n_sommets = len(noms)
+        cles = departs.astype(np.int64) * n_sommets + arrivees
+        cles_triees = np.sort(cles)
+        doublons = cles_triees[1:][cles_triees[1:] == cles_triees[:-1]]
+        if len(doublons):
+            depart, arrivee = divmod(int(doublons[0]), n_sommets)
+            raise ValueError(
+                f"L'arrête {noms[depart]} {noms[arrivee]} est présente deux fois."
+            )
+        ordre = np.argsort(departs, kind="stable")
+        indptr = np.zeros(n_sommets + 1, dtype=np.int64)
+        np.cumsum(np.bincount(departs, minlength=n_sommets), out=indptr[1:])
+        return cls(
+            noms=noms,
+            indptr=indptr,
+            indices=arrivees[ordre],
+            capacites=capacites[ordre]
+        )
+
+    @property
+    def voisinage(self) -> Dict[Sommet, Dict[Sommet, Poids]]:
+        """Dictionnaire de voisinage équivalent."""
+        noms = self._noms.tolist()
+        arrivees = self._noms[self._indices].tolist()
+        capacites = self._capacites.tolist()
+        indptr = self._indptr.tolist()
+        return {
+            nom: dict(zip(arrivees[indptr[i]:indptr[i + 1]], capacites[indptr[i]:indptr[i + 1]]))
+            for i, nom in enumerate(noms)
+        }
+
+    _fichiers = ("noms", "indptr", "indices", "capacites")
+
+    def sauvegarde(self, repertoire: Union[str, Path]):
+        """Ecrit les tableaux dans un répertoire, un fichier .npy par tableau."""
+        repertoire = Path(repertoire)
+        repertoire.mkdir(parents=True, exist_ok=True)
+        for nom, tableau in zip(
+            self._fichiers, (self._noms, self._indptr, self._indices, self._capacites)
+        ):
+            np.save(repertoire / f"{nom}.npy", tableau, allow_pickle=False)
+
+    @classmethod
+    def charge(cls, repertoire: Union[str, Path], projete: bool = True) -> "GrapheCSR":
+        """Relit un graphe sauvegardé, en mémoire projetée en lecture seule par défaut."""
+        repertoire = Path(repertoire)
+        manquants = [
+            nom for nom in cls._fichiers if not (repertoire / f"{nom}.npy").is_file()
+        ]
+        if manquants:
+            raise ValueError(f"Le répertoire {repertoire} n'a pas les tableaux {manquants}.")
+        return cls(*(
+            np.load(repertoire / f"{nom}.npy", mmap_mode="r" if projete else None)
+            for nom in cls._fichiers
+        ))
+
+    @staticmethod
+    def est_sauvegarde(chemin: Union[str, Path]) -> bool:
+        """Vrai si le chemin est un répertoire écrit par `sauvegarde`."""
+        return (Path(chemin) / "indptr.npy").is_file()
+
+    def en_grapheOP(self) -> GrapheOP:
+        """Conversion vers le graphe orienté pondéré."""
+        return GrapheOP(voisinage=self.voisinage)
@@ -5,8 +5,12 @@ Graphes pondérés et orientés avec
     - des poids entiers ou flottants.
 """
 import re
-from typing import Any, Dict, Iterator, List, Tuple, Union
-import networkx as nx
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import numpy as np
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 Sommet = str
 Poids = Union[int, float]
@@ -48,6 +52,11 @@ class GrapheOP:
     {'B': 4, 'C': 5}
     >>> import numpy as np
     >>> np.array(exemple.adjacence)
+    array([[0, 4, 5, 0],
+           [0, 0, 0, 5],
+           [0, 2, 0, 4],
+           [0, 0, 0, 0]])
+    >>> exemple.adjacence_creuse.toarray()
     array([[0, 4, 5, 0],
            [0, 0, 0, 5],
            [0, 2, 0, 4],
@@ -85,20 +94,34 @@ class GrapheOP:
     AdjacencyView({'A': {'B': {'capacité': 4}, 'C': {'capacité': 5}}, 'B': {'D': {'capacité': 5}}, 'C':
     {'B': {'capacité': 2}, 'D': {'capacité': 4}}, 'D': {}})
     """
-    _motif = re.compile(r"^\s?(\w+)\s(\w+)\s(\d+|\d+.\d+)\s?$")
+    _motif = re.compile(r"^\s?(\w+)\s(\w+)\s(\d+|\d+.\d+)(?:\s(-?\d+|-?\d+\.\d+))?\s?$")
 
-    def __init__(self, voisinage=Dict[Sommet, Dict[Sommet, Poids]]):
-        """Initialise par dictionnaire de voisinage."""
+    def __init__(
+        self,
+        voisinage=Dict[Sommet, Dict[Sommet, Poids]],
+        couts: Optional[Dict[Sommet, Dict[Sommet, Poids]]] = None
+    ):
+        """Initialise par dictionnaire de voisinage.
+
+        `couts` donne éventuellement le coût unitaire de chaque arrête, avec la
+        même forme que `voisinage` ; une arrête absente a un coût nul.
+        """
         self._voisinage = voisinage
+        self._couts = couts
+        self._version = 0
+        self._caches: Dict[str, Any] = dict()
+        self._version_caches = 0
 
     def __eq__(self, autre: Any) -> bool:
         """Egalite parfaite pas isomorphisme."""
         if type(self) != type(autre):
             return False
-        return self._voisinage == autre._voisinage
+        return self._voisinage == autre._voisinage and self._couts == autre._couts
 
     def __repr__(self):
         """Repr pour débug."""
+        if self._couts is not None:
+            return f"GrapheOP(voisinage={self._voisinage}, couts={self._couts})"
         return f"GrapheOP(voisinage={self._voisinage})"
     
     def __str__(self):
@@ -106,7 +129,12 @@ class GrapheOP:
         return f"Problème de flot maximal \nSource : {self.sommets[0]} \nPuit : {self.sommets[-1]}" 
 
     @classmethod
-    def par_sommets_arretes(cls, sommets: List[Sommet], arretes: List[Arrete]):
+    def par_sommets_arretes(
+        cls,
+        sommets: List[Sommet],
+        arretes: List[Arrete],
+        couts: Optional[Dict[Sommet, Dict[Sommet, Poids]]] = None
+    ):
         """Constructeur alternatif par sommets et arretes."""
         voisinage: Dict[Sommet, Dict[Sommet, Poids]] = dict()
         for (depart, arrivee, poids) in arretes:
@@ -124,7 +152,7 @@ class GrapheOP:
             if sommet not in voisinage:
                 voisinage[sommet] = dict()
 
-        return cls(voisinage=voisinage)
+        return cls(voisinage=voisinage, couts=couts)
 
     @property
     def sommets(self) -> List[Sommet]:
@@ -146,7 +174,10 @@ class GrapheOP:
     
     @property
     def adjacence(self) -> List[List[Poids]]:
-        """Renvoie une matrice d'adjacence."""
+        """Renvoie une matrice d'adjacence.
+
+        Forme dense en O(V²), gardée pour compatibilité ; voir `adjacence_creuse`.
+        """
         resultat = list()
         for depart in self.sommets:
             ligne = list()
@@ -157,44 +188,201 @@ class GrapheOP:
                     ligne.append(0)
             resultat.append(ligne)
         return resultat
-    
+
+    def _en_cache(self, nom: str, calcule: Callable[[], Any]) -> Any:
+        """Valeur calculée une fois par version du graphe."""
+        if self._version_caches != self._version:
+            self._caches = dict()
+            self._version_caches = self._version
+        if nom not in self._caches:
+            self._caches[nom] = calcule()
+        return self._caches[nom]
+
+    @property
+    def adjacence_creuse(self):
+        """Matrice d'adjacence CSR, en O(E), gardée jusqu'au prochain `ajoute_arrete`.
+
+        Les lignes et colonnes suivent l'ordre de `sommets`, puis les sommets
+        qui ne sont qu'arrivées, dans l'ordre où ils apparaissent : c'est
+        l'ordre de `GrapheCSR.par_grapheOP(graphe).noms`. La matrice est
+        partagée entre les appels : ne pas la modifier.
+        """
+        from .graphe_csr import GrapheCSR
+        return self._en_cache(
+            "adjacence_creuse", lambda: GrapheCSR.par_grapheOP(self).adjacence
+        )
+
     def __getitem__(self, sommet: Sommet) -> Dict[Sommet, Poids]:
         """Renvoit le voisinage du sommet."""
         return self._voisinage[sommet]
 
+    @property
+    def couts(self) -> Optional[Dict[Sommet, Dict[Sommet, Poids]]]:
+        """Coûts unitaires des arrêtes, None si le graphe n'en a pas."""
+        return self._couts
+
+    def cout(self, depart: Sommet, arrivee: Sommet) -> Poids:
+        """Coût unitaire d'une arrête, nul par défaut."""
+        if self._couts is None:
+            return 0
+        return self._couts.get(depart, dict()).get(arrivee, 0)
+
+    @property
+    def version(self) -> int:
+        """Compteur des modifications faites par `ajoute_arrete`."""
+        return self._version
+
+    def ajoute_arrete(
+        self,
+        depart: Sommet,
+        arrivee: Sommet,
+        poids: Poids,
+        cout: Optional[Poids] = None
+    ):
+        """Ajoute l'arrête ou remplace sa capacité, et son coût s'il est donné.
+
+        Les modifications directes du dictionnaire renvoyé par `graphe[sommet]`
+        ne sont pas suivies par `version`.
+        """
+        self._voisinage.setdefault(depart, dict())[arrivee] = poids
+        self._voisinage.setdefault(arrivee, dict())
+        if cout is not None:
+            if self._couts is None:
+                self._couts = dict()
+            self._couts.setdefault(depart, dict())[arrivee] = cout
+        self._version += 1
+
     @classmethod
     def par_str_ordonne(cls, graphe: str) -> "GrapheOP":
-        """Permet de construire par chaine de caractère."""
+        """Permet de construire par chaine de caractère.
+
+        Une quatrième colonne facultative donne le coût unitaire de l'arrête.
+        """
         arretes = list()
+        couts: Dict[Sommet, Dict[Sommet, Poids]] = dict()
         for ligne in graphe.strip().splitlines():
             if (resultat := cls._motif.match(ligne)) is not None:
-                depart, arrivee, poids = resultat.groups()
+                depart, arrivee, poids, cout = resultat.groups()
             else:
                 raise ValueError(
                     f"Il y a un problème sur cette ligne>>\n{ligne}"
                 )
-            try:
-                poids_numerique: Poids = int(poids)
-            except ValueError:
-                poids_numerique = float(poids)
-            arretes.append((depart, arrivee, poids_numerique))
+            arretes.append((depart, arrivee, cls._nombre(poids)))
+            if cout is not None:
+                couts.setdefault(depart, dict())[arrivee] = cls._nombre(cout)
         sommets = list(set([depart for (depart, _, _) in arretes]))
         for _, arrivee, _ in arretes:
             if arrivee not in sommets:
                 sommets.append(arrivee)
-        return cls.par_sommets_arretes(sommets=sommets, arretes=arretes)
+        return cls.par_sommets_arretes(
+            sommets=sommets, arretes=arretes, couts=couts or None
+        )
+
+    @staticmethod
+    def _nombre(texte: str) -> Poids:
+        """Entier si possible, flottant sinon."""
+        try:
+            return int(texte)
+        except ValueError:
+            return float(texte)
+
+    @classmethod
+    def par_fichier(
+        cls,
+        chemin: str,
+        separateur: Optional[str] = None,
+        taille_bloc: int = 1_000_000
+    ) -> "GrapheOP":
+        """Construit à partir d'un fichier de liste d'arrêtes lu par blocs.
+
+        Voir `GrapheCSR.par_fichier` pour le format accepté.
+        """
+        from .graphe_csr import GrapheCSR
+        return GrapheCSR.par_fichier(
+            chemin, separateur=separateur, taille_bloc=taille_bloc
+        ).en_grapheOP()
+
+    @classmethod
+    def par_tableaux(
+        cls,
+        depart: np.array,
+        arrivee: Optional[np.array] = None,
+        capacite: Optional[np.array] = None,
+        aggregation: str = "somme"
+    ) -> "GrapheOP":
+        """Construit à partir de tableaux NumPy, les arrêtes parallèles étant fusionnées.
+
+        `depart` peut aussi être un tableau structuré à champs `depart`,
+        `arrivee` et `capacite`. Voir `GrapheCSR.par_tableaux` pour
+        `aggregation` ("somme", "max" ou "erreur").
+        """
+        from .graphe_csr import GrapheCSR
+        if arrivee is None and capacite is None:
+            tableau = np.asarray(depart)
+            champs = ("depart", "arrivee", "capacite")
+            if tableau.dtype.names is None or not set(champs) <= set(tableau.dtype.names):
+                raise ValueError(f"Il faut un tableau structuré à champs {champs}.")
+            depart, arrivee, capacite = (tableau[champ] for champ in champs)
+        elif arrivee is None or capacite is None:
+            raise ValueError("Il faut les tableaux des départs, des arrivées et des capacités.")
+        return GrapheCSR.par_tableaux(
+            depart, arrivee, capacite, aggregation=aggregation
+        ).en_grapheOP()
+
+    def sauvegarde(self, repertoire: Union[str, Path]):
+        """Ecrit le graphe en binaire dans un répertoire de tableaux .npy.
+
+        Voir `GrapheCSR.sauvegarde` ; les coûts éventuels sont rangés dans
+        `couts.npy`, dans l'ordre des arrêtes CSR.
+        """
+        from .graphe_csr import GrapheCSR
+        csr = GrapheCSR.par_grapheOP(self)
+        csr.sauvegarde(repertoire)
+        if self._couts is not None:
+            departs, arrivees, _ = csr.arretes
+            noms = csr.noms.tolist()
+            couts = np.array([
+                self.cout(noms[depart], noms[arrivee])
+                for depart, arrivee in zip(departs.tolist(), arrivees.tolist())
+            ])
+            np.save(Path(repertoire) / "couts.npy", couts, allow_pickle=False)
+
+    @classmethod
+    def charge(cls, repertoire: Union[str, Path]) -> "GrapheOP":
+        """Relit un graphe écrit par `sauvegarde`, sans analyse de texte.
+
+        Les coûts nuls, valeur par défaut, ne sont pas remis dans `couts`.
+        """
+        from .graphe_csr import GrapheCSR
+        csr = GrapheCSR.charge(repertoire)
+        graphe = csr.en_grapheOP()
+        if (Path(repertoire) / "couts.npy").is_file():
+            departs, arrivees, _ = csr.arretes
+            couts: Dict[Sommet, Dict[Sommet, Poids]] = dict()
+            for depart, arrivee, cout in zip(
+                csr.noms[departs].tolist(),
+                csr.noms[arrivees].tolist(),
+                np.load(Path(repertoire) / "couts.npy").tolist()
+            ):
+                if cout != 0:
+                    couts.setdefault(depart, dict())[arrivee] = cout
+            graphe._couts = couts
+        return graphe
 
     @property
     def est_ordonne(self) -> bool:
-        """Vérifie que la matrice d'adjacence n'est pas symétrique."""
-        matrice = self.adjacence
-        return matrice != [
-            [matrice[j][i] for j, _ in enumerate(ligne)]
-            for i, ligne in enumerate(matrice)
-        ]
+        """Vérifie que la matrice d'adjacence n'est pas symétrique, en O(E).
+
+        Recalculé à chaque appel : les modifications faites par
+        `graphe[sommet]` ne changent pas `version`.
+        """
+        from .graphe_csr import GrapheCSR
+        matrice = GrapheCSR.par_grapheOP(self).adjacence
+        return (matrice != matrice.T).nnz > 0
     
-    def convertit_nx_graphe(self) -> nx.DiGraph:
+    def convertit_nx_graphe(self) -> "nx.DiGraph":
         """Transforme le graphe orienté pondéré en un objet networkx."""
+        import networkx as nx
         res = nx.DiGraph()
         res.add_weighted_edges_from(
             [
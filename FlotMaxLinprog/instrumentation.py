@@ -0,0 +1,107 @@
+"""Description.
+
+Instrumentation des résolutions : temps de chaque phase, taille des
+matrices construites et compte rendu du solveur.
+
+Un rappel `rappel(evenement, donnees)` peut recevoir chaque mesure au
+moment où elle est prise, par exemple pour l'envoyer à un système de
+métriques.
+
+Exemple :
+
+>>> statistiques = Statistiques()
+>>> with statistiques.phase("A_eq"):
+...     matrice = np.eye(3)
+>>> statistiques.matrice("A_eq", matrice)
+>>> statistiques.matrices["A_eq"]
+{'forme': (3, 3), 'nnz': 3, 'octets': 72}
+>>> sorted(statistiques.metriques())
+['matrice.A_eq.nnz', 'matrice.A_eq.octets', 'phase.A_eq.s']
+"""
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, Optional
+import numpy as np
+
+Rappel = Callable[[str, Dict[str, Any]], None]
+
+
+class Statistiques:
+    """Mesures d'une résolution, exportables en dictionnaire."""
+
+    def __init__(self, rappel: Optional[Rappel] = None):
+        """Initialise des mesures vides."""
+        self.phases: Dict[str, float] = dict()
+        self.matrices: Dict[str, Dict[str, Any]] = dict()
+        self.solveur: Dict[str, Any] = dict()
+        self._rappel = rappel
+
+    def __repr__(self):
+        """Repr pour débug."""
+        return f"Statistiques({self.en_dict()})"
+
+    def _notifie(self, evenement: str, donnees: Dict[str, Any]):
+        """Transmet la mesure au rappel éventuel."""
+        if self._rappel is not None:
+            self._rappel(evenement, donnees)
+
+    @contextmanager
+    def phase(self, nom: str) -> Iterator[None]:
+        """Chronomètre le bloc ; les durées d'une même phase s'additionnent."""
+        debut = perf_counter()
+        try:
+            yield
+        finally:
+            self.ajoute_temps(nom, perf_counter() - debut)
+
+    def ajoute_temps(self, nom: str, duree: float):
+        """Enregistre une durée mesurée ailleurs."""
+        self.phases[nom] = self.phases.get(nom, 0.0) + duree
+        self._notifie("phase", {"nom": nom, "duree": duree})
+
+    def matrice(self, nom: str, matrice: Any):
+        """Forme, nombre de coefficients non nuls et mémoire d'une matrice dense ou creuse."""
+        if hasattr(matrice, "nnz"):
+            nnz = int(matrice.nnz)
+            octets = sum(
+                getattr(matrice, tableau).nbytes
+                for tableau in ("data", "indices", "indptr", "row", "col")
+                if hasattr(matrice, tableau)
+            )
+        else:
+            matrice = np.asarray(matrice)
+            nnz = int(np.count_nonzero(matrice))
+            octets = int(matrice.nbytes)
+        self.matrices[nom] = {"forme": tuple(matrice.shape), "nnz": nnz, "octets": octets}
+        self._notifie("matrice", {"nom": nom, **self.matrices[nom]})
+
+    def compte_rendu(self, **donnees: Any):
+        """Statut, nombre d'itérations et autres informations du solveur."""
+        self.solveur.update(donnees)
+        self._notifie("solveur", donnees)
+
+    @property
+    def octets(self) -> int:
+        """Mémoire totale des matrices construites."""
+        return sum(matrice["octets"] for matrice in self.matrices.values())
+
+    def en_dict(self) -> Dict[str, Any]:
+        """Forme imbriquée, sérialisable en JSON."""
+        return {
+            "phases": dict(self.phases),
+            "matrices": {nom: dict(matrice) for nom, matrice in self.matrices.items()},
+            "solveur": dict(self.solveur),
+        }
+
+    def metriques(self) -> Dict[str, float]:
+        """Forme à plat des mesures numériques, une clé par série."""
+        resultat: Dict[str, float] = dict()
+        for nom, duree in self.phases.items():
+            resultat[f"phase.{nom}.s"] = duree
+        for nom, matrice in self.matrices.items():
+            resultat[f"matrice.{nom}.nnz"] = matrice["nnz"]
+            resultat[f"matrice.{nom}.octets"] = matrice["octets"]
+        for nom, valeur in self.solveur.items():
+            if isinstance(valeur, (int, float)) and not isinstance(valeur, bool):
+                resultat[f"solveur.{nom}"] = valeur
+        return resultat
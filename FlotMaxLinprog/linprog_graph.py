@@ -31,15 +31,24 @@ Puit : D
 from .graphe_op import (
     GrapheOP,
     Sommet,
-    Arrete,
     Poids
 )
-from scipy.optimize import linprog
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from scipy import sparse
 import numpy as np
-import networkx as nx
-from networkx.drawing.nx_agraph import graphviz_layout
-import matplotlib.pyplot as plt
-from rich.table import Table
+from .flot_combinatoire import ReseauResiduel
+from .instrumentation import Rappel, Statistiques
+from .reduction import Reduction
+from .solution import Coupe, Solution, Verification
+
+# networkx, matplotlib, graphviz, rich et scipy.optimize ne sont importés
+# qu'à leur première utilisation : `import FlotMaxLinprog` reste rapide.
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    import networkx as nx
+    from rich.table import Table
 
 class LinprogGraph:
     """Classe de résolution du problème de flot maximal.
@@ -87,22 +96,172 @@ class LinprogGraph:
     └────────┴─────────┴──────────────┘
     """
     
-    def __init__(self, grapheOP: GrapheOP):
-        """Initialisation de la classe."""
-        self._nx_grapheOP = grapheOP.convertit_nx_graphe()
+    methodes = ("highs", "dinic", "push_relabel", "cout_minimal", "entier")
+    filtres = ("tous", "flot", "sature")
+    dispositions = ("auto", "dot", "couches")
+    seuil_graphviz = 500
+
+    def __init__(
+        self,
+        grapheOP: GrapheOP,
+        creux: bool = False,
+        methode: str = "highs",
+        source: Optional[Sommet] = None,
+        puits: Optional[Sommet] = None,
+        instrumentation: Union[bool, Rappel] = False,
+        reduction: bool = False
+    ):
+        """Initialisation de la classe.
+
+        Avec `creux=True`, les capacités sont passées en bornes des variables
+        et la matrice des contraintes égalités est une matrice CSR : la
+        mémoire et le temps de construction sont alors en O(E).
+
+        `methode` choisit le solveur : la programmation linéaire HiGHS ou un
+        algorithme combinatoire de flot maximal ("dinic", "push_relabel").
+        "cout_minimal" cherche, parmi les flots maximaux, celui de coût total
+        minimal pour les coûts unitaires du graphe ; les coûts peuvent être
+        négatifs, mais un cycle de coût négatif atteignable depuis la source
+        n'est pas traité et lève une ValueError. "entier" résout exactement
+        des capacités entières par Dinic en entiers 64 bits, sans programme
+        linéaire : la valeur et les flots sont des entiers.
+
+        Par défaut la source est le premier sommet et le puits le dernier.
+
+        Avec `instrumentation`, la solution porte des `Statistiques` (temps par
+        phase, matrices, solveur) ; si c'est une fonction, elle reçoit aussi
+        chaque mesure au fil de l'eau.
+
+        Avec `reduction=True`, le solveur travaille sur le réseau réduit
+        (sommets hors des chemins source-puits élagués, chaînes contractées,
+        arrêtes parallèles fusionnées) puis le flot est reporté sur les arrêtes
+        d'origine ; la valeur du flot maximal est inchangée.
+        """
+        if methode not in self.methodes:
+            raise ValueError(
+                f"Méthode {methode} inconnue, choisir parmi {self.methodes}."
+            )
+        if methode == "cout_minimal" and grapheOP.couts is None:
+            raise ValueError("La méthode cout_minimal demande des coûts sur les arrêtes.")
+        if methode == "cout_minimal" and reduction:
+            raise ValueError("La réduction ne conserve pas les coûts des arrêtes.")
+        self._grapheOP = grapheOP
+        self._version = None
+        self._solution = None
+        self._reseau = None
+        self._positions = None
+        self._creux = creux
+        self._methode = methode
+        self._source = source
+        self._puits = puits
+        self._instrumentation = bool(instrumentation)
+        self._rappel = instrumentation if callable(instrumentation) else None
+        self._temps_structure = 0.0
+        self._reduction = reduction
+        self._nx = None
+        self._cache_disposition = None
+
+    def _synchronise(self):
+        """Invalide le cache si le graphe orienté pondéré a changé."""
+        if self._version != self._grapheOP.version:
+            debut = perf_counter()
+            self._calcule_structure()
+            self._temps_structure = perf_counter() - debut
+            self._version = self._grapheOP.version
+            self._nx = None
+            self._solution = None
+            self._reseau = None
+            self._positions = None
+
+    def _calcule_structure(self):
+        """Sommets, arrêtes et capacités dans l'ordre du graphe networkx, sans networkx.
+
+        Les sommets sont pris dans leur ordre d'apparition dans la liste des
+        arrêtes, puis les arrêtes sont rangées par sommet de départ : c'est
+        l'ordre de `convertit_nx_graphe`, sur lequel reposent les colonnes.
+        """
+        voisinage = self._grapheOP._voisinage
+        indices: Dict[Sommet, int] = dict()
+        for depart, voisins in voisinage.items():
+            if voisins:
+                indices.setdefault(depart, len(indices))
+                for arrivee in voisins:
+                    indices.setdefault(arrivee, len(indices))
+        self._sommets: List[Sommet] = list(indices)
+        self._indices = indices
+        self._arretes: List[Tuple[Sommet, Sommet]] = [
+            (depart, arrivee)
+            for depart in self._sommets
+            for arrivee in voisinage.get(depart, dict())
+        ]
+        n_edges = len(self._arretes)
+        self._departs = np.fromiter(
+            (indices[depart] for depart, _ in self._arretes), dtype=np.int64, count=n_edges
+        )
+        self._arrivees = np.fromiter(
+            (indices[arrivee] for _, arrivee in self._arretes), dtype=np.int64, count=n_edges
+        )
+        self._tableau_capacites = np.array(
+            [voisinage[depart][arrivee] for depart, arrivee in self._arretes]
+        )
+
+    def _terminaux(self) -> Tuple[int, int]:
+        """Indices de la source et du puits parmi les sommets."""
+        self._synchronise()
+        if not self._sommets:
+            raise ValueError("Le graphe n'a aucune arrête.")
+        terminaux = []
+        for sommet, defaut in ((self._source, 0), (self._puits, len(self._sommets) - 1)):
+            if sommet is None:
+                terminaux.append(defaut)
+            elif sommet in self._indices:
+                terminaux.append(self._indices[sommet])
+            else:
+                raise ValueError(f"Le sommet {sommet} n'a aucune arrête.")
+        return terminaux[0], terminaux[1]
+
+    @property
+    def _nx_grapheOP(self) -> "nx.DiGraph":
+        """Graphe networkx à jour, construit seulement s'il est demandé."""
+        self._synchronise()
+        if self._nx is None:
+            self._nx = self._grapheOP.convertit_nx_graphe()
+        return self._nx
+
+    def _n_sommets(self) -> int:
+        """Nombre de sommets portant au moins une arrête."""
+        self._synchronise()
+        return len(self._sommets)
+
+    def _n_arretes(self) -> int:
+        """Nombre d'arrêtes, donc de colonnes hors source et puits."""
+        self._synchronise()
+        return len(self._arretes)
+
+    @property
+    def solution(self) -> Solution:
+        """Solution calculée à la première demande et gardée en cache."""
+        self._synchronise()
+        if self._solution is None:
+            self._verifie_capacites()
+            if self._reduction:
+                self._solution = self._resout_reduit()
+            elif self._methode == "highs":
+                self._solution = self._resout_highs()
+            else:
+                self._solution = self._resout_combinatoire()
+        return self._solution
 
     def _objectif(self) -> np.array:
         """Vecteurs des coefficients de la fonction à optimiser."""
-        graphe = self._nx_grapheOP
-        n_edges = len(graphe.edges)
+        n_edges = self._n_arretes()
         c = np.array([0] * (n_edges + 2))
         c[0] = -1
         return c
 
     def _calcule_A_ub(self) -> np.array:
         """Construction de la matrice des contraintes inégalités."""
-        graphe = self._nx_grapheOP
-        n_edges = len(graphe.edges)
+        n_edges = self._n_arretes()
         upper = []
         for up in range(n_edges + 2):
             ligne = [0] * (n_edges + 2)
@@ -122,71 +281,530 @@ class LinprogGraph:
 
     def _calcule_b_ub(self) -> np.array:
         """Construction du vecteur des contraintes inégalités."""
-        graphe = self._nx_grapheOP
-        n_edges = len(graphe.edges)
+        n_edges = self._n_arretes()
         vec = [0] * (n_edges + 2)
-        for n1 in graphe.nodes:
-            for n2 in graphe.neighbors(n1):
-                vec.append(
-                    graphe[n1][n2]["capacité"]
-                )
+        vec.extend(self._capacites().tolist())
         return np.array(vec)
 
+    def _indices_arretes(self) -> Tuple[np.array, np.array]:
+        """Indices des sommets de départ et d'arrivée de chaque arrête."""
+        self._synchronise()
+        return self._departs, self._arrivees
+
     def _calcule_A_eq(self) -> np.array:
         """"Construction de la matrice des contraintes égalités."""
-        graphe = self._nx_grapheOP
-        nodes = list(
-                graphe.nodes()
-        )
-        edges = list(
-            graphe.edges()
-        )
-        mat = []
-        for id1, n1 in enumerate(nodes):
-            ligne = [0] * (len(edges) + 2)
-            for edge_id, edge in enumerate(edges):
-                if edge in list(graphe.in_edges(n1)):
-                    ligne[edge_id + 1] = 1
-                else:
-                    if edge in list(graphe.out_edges(n1)):
-                        ligne[edge_id + 1] = -1
-            if id1 == 0:
-                ligne[0] = 1
-            else:
-                if id1 == len(nodes) - 1:
-                    ligne[-1] = -1
-            mat.append(ligne)
-        return np.array(mat)
+        n_nodes = self._n_sommets()
+        departs, arrivees = self._indices_arretes()
+        colonnes = np.arange(1, len(departs) + 1)
+        mat = np.zeros((n_nodes, len(departs) + 2), dtype=int)
+        mat[departs, colonnes] = -1
+        # Une boucle (u, u) est une arrête entrante : l'arrivée l'emporte.
+        mat[arrivees, colonnes] = 1
+        source, puits = self._terminaux()
+        if puits != source:
+            mat[puits, -1] = -1
+        mat[source, 0] = 1
+        return mat
+
+    def _calcule_A_eq_creux(self) -> sparse.csr_matrix:
+        """Matrice d'incidence des contraintes égalités au format CSR."""
+        departs, arrivees = self._indices_arretes()
+        return self._incidence_creuse(
+            self._n_sommets(), departs, arrivees, *self._terminaux()
+        )
+
+    @staticmethod
+    def _incidence_creuse(
+        n_nodes: int,
+        departs: np.array,
+        arrivees: np.array,
+        source: int,
+        puits: int
+    ) -> sparse.csr_matrix:
+        """Matrice d'incidence CSR d'un réseau donné par ses tableaux d'arrêtes."""
+        n_edges = len(departs)
+        colonnes = np.arange(1, n_edges + 1)
+        boucles = departs == arrivees
+        lignes = np.concatenate((departs[~boucles], arrivees, [source, puits]))
+        colonnes = np.concatenate((colonnes[~boucles], colonnes, [0, n_edges + 1]))
+        valeurs = np.concatenate(
+            (-np.ones((~boucles).sum(), dtype=int), np.ones(n_edges, dtype=int), [1, -1])
+        )
+        return sparse.csr_matrix(
+            (valeurs, (lignes, colonnes)),
+            shape=(n_nodes, n_edges + 2)
+        )
+
+    def _capacites(self) -> np.array:
+        """Capacités des arrêtes dans l'ordre des colonnes, à ne pas modifier."""
+        self._synchronise()
+        return self._tableau_capacites
+
+    @staticmethod
+    def _capacites_invalides(capacites: np.array) -> np.array:
+        """Indices des capacités qui ne sont pas des nombres positifs ou nuls (NaN compris)."""
+        capacites = np.asarray(capacites)
+        if capacites.dtype == bool or not (
+            np.issubdtype(capacites.dtype, np.integer)
+            or np.issubdtype(capacites.dtype, np.floating)
+        ):
+            return np.arange(capacites.size)
+        return np.flatnonzero(~(capacites >= 0))
+
+    def _verifie_capacites(self):
+        """Même erreur pour toutes les méthodes si une capacité est invalide."""
+        if len(self._capacites_invalides(self._capacites())) == 0:
+            return
+        voisinage = self._grapheOP._voisinage
+        for depart, arrivee in self._arretes:
+            capacite = voisinage[depart][arrivee]
+            if (
+                isinstance(capacite, bool)
+                or not isinstance(capacite, (int, float, np.integer, np.floating))
+                or not capacite >= 0
+            ):
+                raise ValueError(
+                    f"La capacité de l'arrête {depart} {arrivee} doit être un nombre "
+                    f"positif ou nul, pas {capacite!r}."
+                )
+        raise ValueError("Les capacités doivent être des nombres positifs ou nuls.")
+
+    def _capacites_entieres(self) -> np.array:
+        """Capacités en entiers 64 bits, pour la méthode "entier"."""
+        capacites = self._capacites()
+        if np.issubdtype(capacites.dtype, np.integer):
+            return capacites.astype(np.int64)
+        if (
+            np.issubdtype(capacites.dtype, np.floating)
+            and np.isfinite(capacites).all()
+            and (capacites == np.round(capacites)).all()
+            and (np.abs(capacites) < 2 ** 63).all()
+        ):
+            return capacites.astype(np.int64)
+        raise ValueError("La méthode entier demande des capacités entières.")
+
+    def _capacites_reseau(self) -> np.array:
+        """Capacités du graphe résiduel : entières en méthode "entier", flottantes sinon."""
+        if self._methode == "entier":
+            return self._capacites_entieres()
+        return self._capacites().astype(float)
+
+    def _couts(self) -> np.array:
+        """Coûts unitaires des arrêtes dans l'ordre des colonnes."""
+        self._synchronise()
+        return np.array(
+            [self._grapheOP.cout(depart, arrivee) for depart, arrivee in self._arretes],
+            dtype=float
+        )
+
+    def _cout_total(self, flots: Optional[np.array]) -> Optional[Poids]:
+        """Coût du flot si le graphe a des coûts."""
+        if flots is None or self._grapheOP.couts is None:
+            return None
+        return float(flots @ self._couts())
+
+    def _calcule_bornes(self) -> np.array:
+        """Bornes des variables : 0 <= x <= capacité, sans borne sur la source et le puits."""
+        return self._bornes(self._capacites())
+
+    @staticmethod
+    def _bornes(capacites: np.array) -> np.array:
+        """Bornes des variables pour des capacités données."""
+        bornes = np.zeros((len(capacites) + 2, 2))
+        bornes[:, 1] = np.inf
+        bornes[1:-1, 1] = capacites
+        return bornes
 
     def _calcule_b_eq(self) -> np.array:
         """Renvoie le vecteur nul de taille n = nombre de sommets."""
-        graphe = self._nx_grapheOP
-        n_nodes = len(graphe.nodes)
+        n_nodes = self._n_sommets()
         return np.array([0] * n_nodes)
 
 
     def solveur(self):
         """Résolution du problème de flot maximal."""
-        solution = linprog(
-            c = self._objectif(), 
-            A_eq = self._calcule_A_eq(),
-            b_eq = self._calcule_b_eq(), 
-            A_ub =  self._calcule_A_ub(),
-            b_ub = self._calcule_b_ub(),
-            method = "highs"
-        )
-        return [
-            (arrete, flot_max)
-            for arrete, flot_max in zip(self._nx_grapheOP.edges, solution.x[1:-1])
-        ] 
-    
-    def _genere_table_solution(self) -> Table:
+        return self.solution.en_liste()
+
+    def _nouvelles_statistiques(self) -> Statistiques:
+        """Mesures d'une résolution, en commençant par l'extraction des arrêtes."""
+        statistiques = Statistiques(self._rappel)
+        statistiques.ajoute_temps("structure", self._temps_structure)
+        return statistiques
+
+    def _resout_highs(self) -> Solution:
+        """Flot de chaque arrête par programmation linéaire."""
+        statistiques = self._nouvelles_statistiques()
+        with statistiques.phase("objectif"):
+            probleme = dict(c = self._objectif())
+        if self._creux:
+            with statistiques.phase("A_eq"):
+                probleme["A_eq"] = self._calcule_A_eq_creux()
+            with statistiques.phase("b_eq"):
+                probleme["b_eq"] = self._calcule_b_eq()
+            with statistiques.phase("bornes"):
+                probleme["bounds"] = self._calcule_bornes()
+        else:
+            with statistiques.phase("A_eq"):
+                probleme["A_eq"] = self._calcule_A_eq()
+            with statistiques.phase("b_eq"):
+                probleme["b_eq"] = self._calcule_b_eq()
+            with statistiques.phase("A_ub"):
+                probleme["A_ub"] = self._calcule_A_ub()
+            with statistiques.phase("b_ub"):
+                probleme["b_ub"] = self._calcule_b_ub()
+            statistiques.matrice("A_ub", probleme["A_ub"])
+        statistiques.matrice("A_eq", probleme["A_eq"])
+        construction = sum(statistiques.phases.values()) - self._temps_structure
+        from scipy.optimize import linprog
+        with statistiques.phase("resolution"):
+            solution = linprog(**probleme, method = "highs")
+        statistiques.compte_rendu(
+            methode="highs",
+            statut=solution.status,
+            iterations=solution.nit,
+            message=solution.message
+        )
+        if solution.x is None:
+            flots, valeur, criticite = None, None, None
+        else:
+            flots, valeur = solution.x[1:-1], solution.x[0]
+            # Coûts réduits des bornes supérieures : gain de flot par unité de capacité.
+            if self._creux:
+                criticite = -solution.upper.marginals[1:-1]
+            else:
+                criticite = -solution.ineqlin.marginals[len(flots) + 2:]
+        return Solution(
+            arretes=list(self._arretes),
+            flots=flots,
+            valeur=valeur,
+            statut=solution.status,
+            message=solution.message,
+            iterations=solution.nit,
+            temps={
+                "construction": construction,
+                "resolution": statistiques.phases["resolution"]
+            },
+            criticite=criticite,
+            statistiques=statistiques if self._instrumentation else None,
+            cout=self._cout_total(flots)
+        )
+
+    def _resout_combinatoire(self) -> Solution:
+        """Flot de chaque arrête par un algorithme combinatoire."""
+        statistiques = self._nouvelles_statistiques()
+        with statistiques.phase("reseau"):
+            departs, arrivees = self._indices_arretes()
+            reseau = ReseauResiduel(
+                n_sommets=self._n_sommets(),
+                departs=departs,
+                arrivees=arrivees,
+                capacites=self._capacites_reseau()
+            )
+        with statistiques.phase("resolution"):
+            if self._methode == "cout_minimal":
+                valeur, _ = reseau.cout_minimal(*self._terminaux(), self._couts())
+            elif self._methode == "entier":
+                valeur = reseau.dinic(*self._terminaux())
+            else:
+                valeur = getattr(reseau, self._methode)(*self._terminaux())
+        statistiques.compte_rendu(
+            methode=self._methode, statut=0, iterations=reseau.iterations
+        )
+        self._reseau = reseau
+        flots = reseau.flots()
+        with statistiques.phase("coupe"):
+            criticite = self._criticite_coupe(flots)
+        return Solution(
+            arretes=list(self._arretes),
+            flots=flots,
+            valeur=valeur,
+            message="Flot maximal trouvé.",
+            iterations=reseau.iterations,
+            temps={
+                "construction": statistiques.phases["reseau"],
+                "resolution": statistiques.phases["resolution"]
+            },
+            criticite=criticite,
+            statistiques=statistiques if self._instrumentation else None,
+            cout=self._cout_total(flots)
+        )
+
+    def _resout_reduit(self) -> Solution:
+        """Flot de chaque arrête par résolution du réseau réduit."""
+        statistiques = self._nouvelles_statistiques()
+        with statistiques.phase("reduction"):
+            departs, arrivees = self._indices_arretes()
+            reduction = Reduction(
+                n_sommets=self._n_sommets(),
+                departs=departs,
+                arrivees=arrivees,
+                capacites=self._capacites_reseau(),
+                source=self._terminaux()[0],
+                puits=self._terminaux()[1]
+            )
+        statut, message, iterations = 0, "Flot maximal trouvé.", 0
+        if reduction.n_arretes == 0:
+            valeur = 0 if self._methode == "entier" else 0.0
+            flots_reduits = np.zeros(0, dtype=reduction.capacites.dtype)
+        elif self._methode == "highs":
+            with statistiques.phase("A_eq"):
+                A_eq = self._incidence_creuse(
+                    reduction.n_sommets, reduction.departs, reduction.arrivees,
+                    reduction.source, reduction.puits
+                )
+            statistiques.matrice("A_eq", A_eq)
+            c = np.zeros(reduction.n_arretes + 2)
+            c[0] = -1
+            from scipy.optimize import linprog
+            with statistiques.phase("resolution"):
+                resultat = linprog(
+                    c,
+                    A_eq=A_eq,
+                    b_eq=np.zeros(reduction.n_sommets),
+                    bounds=self._bornes(reduction.capacites),
+                    method="highs"
+                )
+            statut, message, iterations = resultat.status, resultat.message, resultat.nit
+            if resultat.x is None:
+                valeur, flots_reduits = None, None
+            else:
+                valeur, flots_reduits = resultat.x[0], resultat.x[1:-1]
+        else:
+            reseau = ReseauResiduel(
+                n_sommets=reduction.n_sommets,
+                departs=reduction.departs,
+                arrivees=reduction.arrivees,
+                capacites=reduction.capacites
+            )
+            moteur = "dinic" if self._methode == "entier" else self._methode
+            with statistiques.phase("resolution"):
+                valeur = getattr(reseau, moteur)(reduction.source, reduction.puits)
+            iterations = reseau.iterations
+            flots_reduits = reseau.flots()
+        statistiques.compte_rendu(
+            methode=self._methode,
+            statut=statut,
+            iterations=iterations,
+            sommets_reduits=reduction.n_sommets,
+            arretes_reduites=reduction.n_arretes
+        )
+        flots, criticite = None, None
+        if flots_reduits is not None:
+            with statistiques.phase("extension"):
+                flots = reduction.etend(flots_reduits)
+            with statistiques.phase("coupe"):
+                criticite = self._criticite_coupe(flots)
+        return Solution(
+            arretes=list(self._arretes),
+            flots=flots,
+            valeur=valeur,
+            statut=statut,
+            message=message,
+            iterations=iterations,
+            temps={
+                "construction": statistiques.phases["reduction"],
+                "resolution": statistiques.phases.get("resolution", 0.0)
+            },
+            criticite=criticite,
+            statistiques=statistiques if self._instrumentation else None,
+            cout=self._cout_total(flots)
+        )
+
+    def maj_capacite(self, depart: Sommet, arrivee: Sommet, nouvelle_capacite: Poids):
+        """Modifie la capacité d'une arrête et répare la solution courante.
+
+        Le graphe résiduel de la solution précédente est conservé : une baisse
+        renvoie le surplus, une hausse augmente le flot existant. En mode
+        "cout_minimal" la réparation ne garantit pas le coût minimal, et avec
+        la réduction le réseau résolu n'est plus celui du graphe : le problème
+        est alors résolu de nouveau à la prochaine demande.
+        """
+        solution = self.solution
+        if self._positions is None:
+            self._positions = {
+                arrete: i for i, arrete in enumerate(solution.arretes)
+            }
+        if (depart, arrivee) not in self._positions:
+            raise ValueError(f"L'arrête {depart} {arrivee} n'existe pas.")
+        arrete = self._positions[(depart, arrivee)]
+        if len(self._capacites_invalides(np.array([nouvelle_capacite]))):
+            raise ValueError(
+                f"La capacité de l'arrête {depart} {arrivee} doit être un nombre "
+                f"positif ou nul, pas {nouvelle_capacite!r}."
+            )
+        if self._methode == "entier":
+            if not float(nouvelle_capacite).is_integer():
+                raise ValueError("La méthode entier demande des capacités entières.")
+            nouvelle_capacite = int(nouvelle_capacite)
+        if self._methode == "cout_minimal" or self._reduction:
+            self._grapheOP.ajoute_arrete(depart, arrivee, nouvelle_capacite)
+            return
+        statistiques = Statistiques(self._rappel)
+        debut = perf_counter()
+        if self._reseau is None:
+            departs, arrivees = self._indices_arretes()
+            self._reseau = ReseauResiduel(
+                n_sommets=self._n_sommets(),
+                departs=departs,
+                arrivees=arrivees,
+                capacites=self._capacites_reseau(),
+                flots=solution.flots
+            )
+        variation = self._reseau.modifie_capacite(
+            arrete, nouvelle_capacite, *self._terminaux()
+        )
+        fin = perf_counter()
+        statistiques.ajoute_temps("reparation", fin - debut)
+        statistiques.compte_rendu(
+            methode="reparation", statut=0, iterations=self._reseau.iterations
+        )
+        self._grapheOP.ajoute_arrete(depart, arrivee, nouvelle_capacite)
+        # Copie : les tableaux déjà renvoyés par `_capacites` restent valables ;
+        # une capacité flottante sur un graphe entier promeut le tableau.
+        self._tableau_capacites = np.array(
+            self._tableau_capacites,
+            dtype=np.result_type(self._tableau_capacites, nouvelle_capacite)
+        )
+        self._tableau_capacites[arrete] = nouvelle_capacite
+        if self._nx is not None:
+            self._nx[depart][arrivee]["capacité"] = nouvelle_capacite
+        self._version = self._grapheOP.version
+        flots = self._reseau.flots()
+        self._solution = Solution(
+            arretes=solution.arretes,
+            flots=flots,
+            valeur=solution.valeur + variation,
+            message="Flot maximal réparé après mise à jour de capacité.",
+            iterations=self._reseau.iterations,
+            temps={"resolution": fin - debut},
+            criticite=self._criticite_coupe(flots),
+            statistiques=statistiques if self._instrumentation else None,
+            cout=self._cout_total(flots)
+        )
+
+    def _tolerance(self, flots: np.array) -> float:
+        """Ecart sous lequel un flot est nul ou saturé : aucun pour des flots entiers."""
+        if np.issubdtype(np.asarray(flots).dtype, np.integer):
+            return 0
+        return 1e-9 * max(1.0, float(np.abs(self._capacites()).max(initial=0)))
+
+    def _cote_source(self, flots: np.array, tolerance: Optional[float] = None) -> np.array:
+        """Masque des sommets atteignables depuis la source dans le graphe résiduel.
+
+        Un seul parcours en largeur sur la matrice creuse des arcs résiduels.
+        """
+        from scipy.sparse.csgraph import breadth_first_order
+        departs, arrivees = self._indices_arretes()
+        capacites = self._capacites()
+        if tolerance is None:
+            tolerance = self._tolerance(flots)
+        avant = flots < capacites - tolerance
+        arriere = flots > tolerance
+        n_nodes = self._n_sommets()
+        residuel = sparse.csr_matrix(
+            (
+                np.ones(avant.sum() + arriere.sum(), dtype=np.int8),
+                (
+                    np.concatenate((departs[avant], arrivees[arriere])),
+                    np.concatenate((arrivees[avant], departs[arriere]))
+                )
+            ),
+            shape=(n_nodes, n_nodes)
+        )
+        source, _ = self._terminaux()
+        cote = np.zeros(n_nodes, dtype=bool)
+        cote[breadth_first_order(residuel, source, return_predecessors=False)] = True
+        return cote
+
+    def _criticite_coupe(self, flots: np.array) -> np.array:
+        """Indicatrice des arrêtes de la coupe minimale, solution duale du problème."""
+        cote = self._cote_source(flots)
+        departs, arrivees = self._indices_arretes()
+        return (cote[departs] & ~cote[arrivees]).astype(float)
+
+    def coupe_minimale(self) -> Coupe:
+        """Coupe minimale source-puits déduite du flot maximal.
+
+        Les arrêtes coupées sont les goulots d'étranglement du réseau, toutes
+        saturées ; leur capacité totale est égale à la valeur du flot.
+        """
+        return self._coupe(self._cote_source(self.solution.flots))
+
+    def _coupe(self, cote: np.array) -> Coupe:
+        """Coupe séparant les sommets de `cote` des autres."""
+        departs, arrivees = self._indices_arretes()
+        coupees = cote[departs] & ~cote[arrivees]
+        return Coupe(
+            cote_source={self._sommets[i] for i in np.flatnonzero(cote)},
+            arretes=[self._arretes[i] for i in np.flatnonzero(coupees)],
+            capacite=self._capacites()[coupees].sum()
+        )
+
+    def verifie_solution(
+        self, flots: Optional[np.array] = None, tolerance: Optional[float] = None
+    ) -> Verification:
+        """Vérifie un flot, donné dans l'ordre de `solution.arretes`, sans le résoudre.
+
+        Par défaut le flot vérifié est celui de la solution. Les bornes et le
+        bilan de chaque sommet (produit par la matrice d'incidence creuse) sont
+        calculés en O(E), puis un parcours du graphe résiduel donne la coupe
+        qui certifie l'optimalité. La tolérance par défaut est nulle pour des
+        flots entiers et relative à la plus grande capacité sinon.
+        """
+        if flots is None:
+            flots = self.solution.flots
+        flots = np.asarray(flots)
+        n_edges = self._n_arretes()
+        if flots.shape != (n_edges,):
+            raise ValueError(f"Il faut {n_edges} flots, pas {flots.shape}.")
+        if tolerance is None:
+            tolerance = self._tolerance(flots)
+        capacites = self._capacites()
+        departs, arrivees = self._indices_arretes()
+        n_nodes = self._n_sommets()
+        colonnes = np.arange(n_edges)
+        type_bilans = np.int64 if np.issubdtype(flots.dtype, np.integer) else float
+        # Les doublons sont sommés : une boucle a un bilan nul.
+        incidence = sparse.csr_matrix(
+            (
+                np.concatenate((
+                    -np.ones(n_edges, dtype=type_bilans), np.ones(n_edges, dtype=type_bilans)
+                )),
+                (np.concatenate((departs, arrivees)), np.concatenate((colonnes, colonnes)))
+            ),
+            shape=(n_nodes, n_edges)
+        )
+        bilans = incidence @ flots
+        source, puits = self._terminaux()
+        internes = np.ones(n_nodes, dtype=bool)
+        internes[[source, puits]] = False
+        # Les comparaisons négatives repèrent aussi les NaN.
+        hors_bornes = ~((flots >= -tolerance) & (flots <= capacites + tolerance))
+        desequilibres = internes & ~(np.abs(bilans) <= tolerance)
+        exces = np.where(flots < 0, flots, flots - capacites).tolist()
+        bilans = bilans.tolist()
+        cote = self._cote_source(flots, tolerance)
+        return Verification(
+            valeur=bilans[puits] if puits != source else 0,
+            coupe=self._coupe(cote),
+            depassements=[
+                (self._arretes[i], exces[i]) for i in np.flatnonzero(hors_bornes).tolist()
+            ],
+            desequilibres=[
+                (self._sommets[i], bilans[i]) for i in np.flatnonzero(desequilibres).tolist()
+            ],
+            puits_atteignable=bool(cote[puits]),
+            tolerance=tolerance
+        )
+
+    def _genere_table_solution(self) -> "Table":
         """Renvoie une table rich des prérequis."""
+        from rich.table import Table
         resultat = Table()
         resultat.add_column("Départ")
         resultat.add_column("Arrivée")
         resultat.add_column("Flot maximal")
-        for (depart, arrivee), flot_max in self.solveur():
+        for (depart, arrivee), flot_max in self.solution.en_liste():
             resultat.add_row(
                 depart, arrivee, str(flot_max)
             )
@@ -197,31 +815,157 @@ class LinprogGraph:
         from rich import print
         print(self._genere_table_solution())
         
-    def genere_graphique(self) -> plt.Figure:
-        """Visualisation du graphe obtenu."""
+    def _arretes_tracees(self, filtre: str, k: Optional[int]) -> np.array:
+        """Indices des arrêtes à tracer, limitées aux `k` plus grands flots."""
+        flots = self.solution.flots
+        capacites = self._capacites()
+        tolerance = self._tolerance(flots)
+        if filtre == "tous":
+            masque = np.ones(len(flots), dtype=bool)
+        elif filtre == "flot":
+            masque = flots > tolerance
+        elif filtre == "sature":
+            masque = (flots >= capacites - tolerance) & (capacites > tolerance)
+        else:
+            raise ValueError(
+                f"Filtre {filtre} inconnu, choisir parmi {self.filtres}."
+            )
+        indices = np.flatnonzero(masque)
+        if k is not None and k < len(indices):
+            plus_grands = np.argsort(-flots[indices], kind="stable")[:k]
+            indices = np.sort(indices[plus_grands])
+        return indices
+
+    def _disposition_couches(self) -> Dict[Sommet, Tuple[float, float]]:
+        """Disposition rapide en O(V + E) : une couche par distance à la source."""
+        from scipy.sparse.csgraph import breadth_first_order
+        n_nodes = self._n_sommets()
+        departs, arrivees = self._indices_arretes()
+        source, _ = self._terminaux()
+        adjacence = sparse.csr_matrix(
+            (np.ones(len(departs), dtype=np.int8), (departs, arrivees)),
+            shape=(n_nodes, n_nodes)
+        )
+        ordre, predecesseurs = breadth_first_order(adjacence, source)
+        couche = [-1] * n_nodes
+        couche[source] = 0
+        for sommet, predecesseur in zip(ordre[1:].tolist(), predecesseurs[ordre[1:]].tolist()):
+            couche[sommet] = couche[predecesseur] + 1
+        couche = np.array(couche)
+        couche[couche < 0] = couche.max() + 1
+        ordre = np.argsort(couche, kind="stable")
+        couches_triees = couche[ordre]
+        debut = np.searchsorted(couches_triees, couches_triees, side="left")
+        fin = np.searchsorted(couches_triees, couches_triees, side="right")
+        rang = np.empty(n_nodes)
+        rang[ordre] = np.arange(n_nodes) - debut - (fin - debut - 1) / 2
+        return {
+            sommet: (x, -y)
+            for sommet, x, y in zip(self._sommets, rang.tolist(), couche.tolist())
+        }
+
+    def _disposition(self, disposition: str) -> Dict[Sommet, Tuple[float, float]]:
+        """Positions de tous les sommets, gardées tant que les arrêtes ne changent pas."""
+        if disposition not in self.dispositions:
+            raise ValueError(
+                f"Disposition {disposition} inconnue, choisir parmi {self.dispositions}."
+            )
+        if disposition == "auto":
+            disposition = "couches"
+            if self._n_sommets() <= self.seuil_graphviz:
+                try:
+                    import pygraphviz  # noqa: F401
+                    disposition = "dot"
+                except ImportError:
+                    pass
+        self._synchronise()
+        if self._cache_disposition is not None:
+            methode, arretes, positions = self._cache_disposition
+            if methode == disposition and arretes == self._arretes:
+                return positions
+        if disposition == "dot":
+            import networkx as nx
+            positions = nx.nx_agraph.graphviz_layout(self._nx_grapheOP, prog='dot')
+        else:
+            positions = self._disposition_couches()
+        self._cache_disposition = (disposition, self._arretes, positions)
+        return positions
+
+    def genere_graphique(
+        self,
+        fichier: Optional[Union[str, Path]] = None,
+        filtre: str = "tous",
+        k: Optional[int] = None,
+        disposition: str = "auto",
+        etiquettes: Optional[bool] = None
+    ) -> "Figure":
+        """Visualisation du graphe obtenu.
+
+        Sans `fichier`, la figure est affichée par `plt.show()`. Avec un
+        fichier (.png, .svg...), elle y est écrite sans passer par pyplot ni
+        par une interface graphique, ce qui convient à un serveur.
+
+        `filtre` ne garde que les arrêtes qui portent un flot ("flot") ou
+        qui sont saturées ("sature"), et `k` les k plus grands flots. La
+        disposition "dot" (graphviz) est lente sur les grands réseaux :
+        "auto" ne l'utilise que jusqu'à `seuil_graphviz` sommets et sinon
+        range les sommets en couches par distance à la source ("couches").
+        Les positions sont réutilisées d'un tracé à l'autre tant que les
+        arrêtes du graphe ne changent pas. Les étiquettes ne sont écrites
+        par défaut que s'il y a au plus 100 arrêtes tracées.
+        """
+        import networkx as nx
+        solution = self.solution
+        indices = self._arretes_tracees(filtre, k)
+        positions = self._disposition(disposition)
         flot_max_graph = nx.DiGraph()
         flot_max_graph.add_weighted_edges_from(
             [
-                (depart, arrivee, flot_max)
-                for (depart, arrivee), flot_max in self.solveur()
+                (*solution.arretes[i], flot_max)
+                for i, flot_max in zip(indices.tolist(), solution.flots[indices].tolist())
             ],
             weight="flot"
         )
-        figure, repere = plt.subplots(figsize=(12, 8))
-        positions = nx.nx_agraph.graphviz_layout(flot_max_graph, prog='dot')
-        nx.draw_networkx(
-            G=flot_max_graph, 
-            pos=positions, 
-            ax=repere,
-            font_size = 14,
-            node_color = "skyblue"
-        )
+        if etiquettes is None:
+            etiquettes = len(indices) <= 100
+        if fichier is None:
+            import matplotlib.pyplot as plt
+            figure, repere = plt.subplots(figsize=(12, 8))
+        else:
+            from matplotlib.figure import Figure
+            figure = Figure(figsize=(12, 8))
+            repere = figure.subplots()
         flots = nx.get_edge_attributes(G=flot_max_graph, name="flot")
-        nx.draw_networkx_edge_labels(
-            G=flot_max_graph,
-            pos=positions,
-            edge_labels=flots,
-            font_size = 12
-        )
+        if etiquettes:
+            nx.draw_networkx(
+                G=flot_max_graph, 
+                pos=positions, 
+                ax=repere,
+                font_size = 14,
+                node_color = "skyblue"
+            )
+            nx.draw_networkx_edge_labels(
+                G=flot_max_graph,
+                pos=positions,
+                edge_labels=flots,
+                font_size = 12,
+                ax=repere
+            )
+        else:
+            plus_grand = max(flots.values(), default=0) or 1
+            nx.draw_networkx(
+                G=flot_max_graph,
+                pos=positions,
+                ax=repere,
+                with_labels=False,
+                node_size=10,
+                node_color="skyblue",
+                arrows=False,
+                width=[0.2 + 2 * flot / plus_grand for flot in flots.values()]
+            )
         repere.set_title("Visualisation du flot maximal", fontsize = 14)
-        plt.show()
\ No newline at end of file
+        if fichier is None:
+            plt.show()
+        else:
+            figure.savefig(fichier)
+        return figure
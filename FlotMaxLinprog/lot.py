@@ -0,0 +1,98 @@
+"""Description.
+
+Résolution en parallèle d'un grand nombre de problèmes de flot maximal
+indépendants sur un pool de processus.
+
+Les graphes sont envoyés aux processus sous forme de tableaux CSR (ou de
+simples chemins de fichiers), jamais sous forme de graphes networkx. Un
+graphe sauvegardé par `GrapheCSR.sauvegarde` est relu en mémoire projetée :
+les processus partagent alors les pages du fichier.
+"""
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .graphe_csr import GrapheCSR
+from .graphe_op import GrapheOP
+from .linprog_graph import LinprogGraph
+from .solution import Solution
+
+Paquet = List[Tuple[int, Union[str, tuple]]]
+
+
+def _charge_utile(graphe: Union[GrapheOP, str, Path]) -> Union[str, tuple]:
+    """Forme compacte envoyée au processus : chemin ou tableaux CSR."""
+    if isinstance(graphe, (str, Path)):
+        return str(graphe)
+    csr = GrapheCSR.par_grapheOP(graphe)
+    return (csr.noms, csr.indptr, csr.indices, csr.capacites)
+
+
+def _resout_paquet(paquet: Paquet, methode: str, creux: bool) -> List[Tuple[int, Solution]]:
+    """Résout un paquet de problèmes dans un processus du pool."""
+    resultats = []
+    for indice, charge in paquet:
+        if isinstance(charge, str) and GrapheCSR.est_sauvegarde(charge):
+            csr = GrapheCSR.charge(charge)
+        elif isinstance(charge, str):
+            csr = GrapheCSR.par_fichier(charge)
+        else:
+            csr = GrapheCSR(*charge)
+        linprog_graph = LinprogGraph(csr.en_grapheOP(), creux=creux, methode=methode)
+        resultats.append((indice, linprog_graph.solution))
+    return resultats
+
+
+def resout_lot(
+    graphes: Union[Iterable[Union[GrapheOP, str, Path]], str, Path],
+    methode: str = "highs",
+    creux: bool = False,
+    n_processus: Optional[int] = None,
+    taille_paquet: int = 1,
+    ordonne: bool = True
+) -> Iterator[Tuple[int, Solution]]:
+    """Résout chaque graphe et renvoie les couples (indice, solution) au fil de l'eau.
+
+    `graphes` est un itérable de `GrapheOP` ou de chemins de fichiers, ou bien
+    un répertoire dont tous les fichiers sont lus par `GrapheCSR.par_fichier`
+    et tous les sous-répertoires par `GrapheCSR.charge`.
+    Les graphes sont envoyés par paquets de `taille_paquet`, au plus deux
+    paquets par processus étant en attente. Avec `ordonne=False` les
+    solutions sont renvoyées dès qu'elles sont prêtes.
+    """
+    if methode not in LinprogGraph.methodes:
+        raise ValueError(
+            f"Méthode {methode} inconnue, choisir parmi {LinprogGraph.methodes}."
+        )
+    if isinstance(graphes, (str, Path)):
+        graphes = sorted(
+            chemin for chemin in Path(graphes).iterdir()
+            if chemin.is_file() or GrapheCSR.est_sauvegarde(chemin)
+        )
+    charges = ((indice, _charge_utile(graphe)) for indice, graphe in enumerate(graphes))
+    paquets = iter(lambda: list(islice(charges, taille_paquet)), [])
+    with ProcessPoolExecutor(max_workers=n_processus) as executeur:
+        fenetre = 2 * (n_processus or os.cpu_count() or 1)
+        if ordonne:
+            en_cours: Deque[Future] = deque()
+            for paquet in paquets:
+                en_cours.append(executeur.submit(_resout_paquet, paquet, methode, creux))
+                if len(en_cours) >= fenetre:
+                    yield from en_cours.popleft().result()
+            while en_cours:
+                yield from en_cours.popleft().result()
+        else:
+            attente: Set[Future] = set()
+            for paquet in paquets:
+                attente.add(executeur.submit(_resout_paquet, paquet, methode, creux))
+                if len(attente) >= fenetre:
+                    finis, attente = wait(attente, return_when=FIRST_COMPLETED)
+                    for futur in finis:
+                        yield from futur.result()
+            while attente:
+                finis, attente = wait(attente, return_when=FIRST_COMPLETED)
+                for futur in finis:
+                    yield from futur.result()
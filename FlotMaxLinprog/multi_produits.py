@@ -0,0 +1,195 @@
+"""Description.
+
+Flot multi-produits : plusieurs produits, chacun avec sa source, son puits
+et sa demande, partagent les capacités des arrêtes.
+
+Le programme linéaire est creux par blocs : un bloc de conservation par
+produit (la matrice d'incidence du graphe) et des lignes de couplage qui
+bornent la somme des flots de chaque arrête par sa capacité. Deux modes :
+    - "maximal" maximise le flot total, chaque produit étant borné par sa
+      demande (une demande None est illimitée),
+    - "concurrent" maximise la fraction λ des demandes acheminée pour tous
+      les produits à la fois ; λ >= 1 signifie que toutes sont satisfaites.
+
+Exemple :
+
+>>> graphe = GrapheOP(voisinage={'A': {'B': 4, 'C': 5}, 'B': {'D': 5}, 'C': {'B': 2, 'D': 4}, 'D': {}})
+>>> probleme = FlotMultiProduits(graphe, [('A', 'D', 6), ('C', 'B', 2)])
+>>> probleme.solution.valeurs
+array([6., 2.])
+>>> concurrent = FlotMultiProduits(graphe, [('A', 'D', 12), ('C', 'B', 1)], mode="concurrent")
+>>> round(concurrent.solution.taux, 6)
+0.75
+"""
+from time import perf_counter
+from typing import List, Optional, Tuple
+import numpy as np
+from scipy import sparse
+
+from .graphe_csr import GrapheCSR
+from .graphe_op import GrapheOP, Sommet, Poids
+from .solution import SolutionMultiProduits
+
+Produit = Tuple[Sommet, Sommet, Optional[Poids]]
+
+
+class FlotMultiProduits:
+    """Flot maximal ou concurrent de plusieurs produits sur un même réseau.
+
+    Les colonnes sont, produit par produit, les E flots des arrêtes dans
+    l'ordre de `grapheOP.arretes`, puis la valeur de chaque produit et,
+    en mode concurrent, la fraction λ.
+    """
+
+    modes = ("maximal", "concurrent")
+
+    def __init__(self, grapheOP: GrapheOP, produits: List[Produit], mode: str = "maximal"):
+        """Initialisation de la classe."""
+        if mode not in self.modes:
+            raise ValueError(f"Mode {mode} inconnu, choisir parmi {self.modes}.")
+        if not produits:
+            raise ValueError("Il faut au moins un produit.")
+        self._csr = GrapheCSR.par_grapheOP(grapheOP)
+        self._mode = mode
+        self._produits = list(produits)
+        self._terminaux = []
+        for source, puits, demande in self._produits:
+            for sommet in (source, puits):
+                try:
+                    self._csr.identifiant(sommet)
+                except KeyError:
+                    raise ValueError(f"Le sommet {sommet} n'existe pas.") from None
+            if source == puits:
+                raise ValueError("La source et le puits doivent être distincts.")
+            if mode == "concurrent" and (demande is None or not demande > 0):
+                raise ValueError("Le mode concurrent demande des demandes positives.")
+            self._terminaux.append(
+                (self._csr.identifiant(source), self._csr.identifiant(puits))
+            )
+        self._solution = None
+
+    @property
+    def n_produits(self) -> int:
+        """Nombre de produits."""
+        return len(self._produits)
+
+    def _n_variables(self) -> int:
+        """K * E flots, K valeurs et λ en mode concurrent."""
+        return self.n_produits * (self._csr.n_arretes + 1) + (self._mode == "concurrent")
+
+    def _incidence(self) -> sparse.csr_matrix:
+        """Matrice d'incidence V × E : -1 au départ, +1 à l'arrivée, 0 pour une boucle."""
+        departs, arrivees, _ = self._csr.arretes
+        n_arretes = self._csr.n_arretes
+        colonnes = np.arange(n_arretes)
+        incidence = sparse.csr_matrix(
+            (
+                np.concatenate((-np.ones(n_arretes), np.ones(n_arretes))),
+                (np.concatenate((departs, arrivees)), np.concatenate((colonnes, colonnes)))
+            ),
+            shape=(self._csr.n_sommets, n_arretes)
+        )
+        incidence.eliminate_zeros()
+        return incidence
+
+    def _calcule_A_eq(self) -> sparse.csr_matrix:
+        """Un bloc de conservation par produit, plus v_k = λ d_k en mode concurrent."""
+        k = self.n_produits
+        n = self._csr.n_sommets
+        lignes = np.array([
+            rang * n + sommet
+            for rang, terminaux in enumerate(self._terminaux)
+            for sommet in terminaux
+        ])
+        valeurs = sparse.csr_matrix(
+            (np.tile([1.0, -1.0], k), (lignes, np.repeat(np.arange(k), 2))),
+            shape=(k * n, k)
+        )
+        blocs = [sparse.block_diag([self._incidence()] * k, format="csr"), valeurs]
+        if self._mode == "maximal":
+            return sparse.hstack(blocs, format="csr")
+        blocs.append(sparse.csr_matrix((k * n, 1)))
+        demandes = np.array([demande for _, _, demande in self._produits], dtype=float)
+        liens = sparse.hstack(
+            [
+                sparse.csr_matrix((k, k * self._csr.n_arretes)),
+                sparse.identity(k),
+                sparse.csr_matrix(-demandes[:, None])
+            ]
+        )
+        return sparse.vstack([sparse.hstack(blocs), liens], format="csr")
+
+    def _calcule_A_ub(self) -> sparse.csr_matrix:
+        """Lignes de couplage : somme des flots des produits sur chaque arrête."""
+        n_arretes = self._csr.n_arretes
+        return sparse.hstack(
+            [
+                *[sparse.identity(n_arretes, format="csr")] * self.n_produits,
+                sparse.csr_matrix((n_arretes, self._n_variables() - self.n_produits * n_arretes))
+            ],
+            format="csr"
+        )
+
+    def _objectif(self) -> np.array:
+        """Somme des valeurs, ou λ en mode concurrent, à maximiser."""
+        c = np.zeros(self._n_variables())
+        if self._mode == "maximal":
+            c[self.n_produits * self._csr.n_arretes:] = -1
+        else:
+            c[-1] = -1
+        return c
+
+    def _calcule_bornes(self) -> np.array:
+        """Flots et valeurs positifs, valeurs bornées par les demandes en mode maximal."""
+        bornes = np.zeros((self._n_variables(), 2))
+        bornes[:, 1] = np.inf
+        if self._mode == "maximal":
+            debut = self.n_produits * self._csr.n_arretes
+            for rang, (_, _, demande) in enumerate(self._produits):
+                if demande is not None:
+                    bornes[debut + rang, 1] = demande
+        return bornes
+
+    @property
+    def solution(self) -> SolutionMultiProduits:
+        """Solution calculée à la première demande et gardée en cache."""
+        if self._solution is None:
+            self._solution = self._resout()
+        return self._solution
+
+    def _resout(self) -> SolutionMultiProduits:
+        """Résolution du programme linéaire par HiGHS."""
+        from scipy.optimize import linprog
+        debut = perf_counter()
+        probleme = dict(
+            c=self._objectif(),
+            A_eq=self._calcule_A_eq(),
+            b_eq=np.zeros(self._csr.n_sommets * self.n_produits
+                          + self.n_produits * (self._mode == "concurrent")),
+            A_ub=self._calcule_A_ub(),
+            b_ub=self._csr.capacites.astype(float),
+            bounds=self._calcule_bornes()
+        )
+        construction = perf_counter() - debut
+        resultat = linprog(**probleme, method="highs")
+        resolution = perf_counter() - debut - construction
+        flots, valeurs, taux = None, None, None
+        if resultat.x is not None:
+            n_flots = self.n_produits * self._csr.n_arretes
+            flots = resultat.x[:n_flots].reshape(self.n_produits, self._csr.n_arretes)
+            valeurs = resultat.x[n_flots:n_flots + self.n_produits]
+            if self._mode == "concurrent":
+                taux = float(resultat.x[-1])
+        departs, arrivees, _ = self._csr.arretes
+        noms = self._csr.noms
+        return SolutionMultiProduits(
+            produits=self._produits,
+            arretes=list(zip(noms[departs].tolist(), noms[arrivees].tolist())),
+            flots=flots,
+            valeurs=valeurs,
+            taux=taux,
+            statut=resultat.status,
+            message=resultat.message,
+            iterations=resultat.nit,
+            temps={"construction": construction, "resolution": resolution}
+        )
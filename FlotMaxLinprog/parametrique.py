@@ -0,0 +1,139 @@
+"""Description.
+
+Flot maximal paramétrique : les capacités dépendent d'un paramètre λ,
+soit la capacité d'une seule arrête (c_e = λ), soit toutes les capacités
+à la fois (c = λ c). La valeur du flot maximal est alors le minimum des
+capacités des coupes, fonctions affines de λ : une fonction concave et
+affine par morceaux dont on calcule les points de rupture.
+
+Les capacités croissent avec λ, donc un flot maximal pour un λ plus petit
+reste admissible : chaque nouveau calcul repart de ce flot dans le graphe
+résiduel au lieu de partir du flot nul.
+
+Exemple :
+
+>>> graphe = GrapheOP(voisinage={'A': {'B': 4, 'C': 5}, 'B': {'D': 5}, 'C': {'B': 2, 'D': 4}, 'D': {}})
+>>> courbe = courbe_parametrique(graphe, 0, 10, arrete=('A', 'B'))
+>>> courbe.parametres, courbe.valeurs
+(array([ 0.,  4., 10.]), array([5., 9., 9.]))
+>>> courbe.valeur(1.5)
+6.5
+"""
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from .flot_combinatoire import ReseauResiduel
+from .graphe_op import GrapheOP, Sommet
+from .linprog_graph import LinprogGraph
+from .solution import CourbeParametrique
+
+Droite = Tuple[float, float]
+
+
+class _FlotParametrique:
+    """Capacités a + λ b (b >= 0) et flots maximaux déjà calculés."""
+
+    def __init__(
+        self,
+        grapheOP: GrapheOP,
+        arrete: Optional[Tuple[Sommet, Sommet]],
+        source: Optional[Sommet],
+        puits: Optional[Sommet]
+    ):
+        """Prépare le graphe résiduel, construit une seule fois."""
+        probleme = LinprogGraph(grapheOP, source=source, puits=puits)
+        probleme._verifie_capacites()
+        self.source, self.puits = probleme._terminaux()
+        self.arretes = list(probleme._arretes)
+        capacites = probleme._capacites().astype(float)
+        if arrete is None:
+            self._a, self._b = np.zeros_like(capacites), capacites
+        elif arrete in self.arretes:
+            indice = self.arretes.index(arrete)
+            self._a, self._b = capacites.copy(), np.zeros_like(capacites)
+            self._a[indice], self._b[indice] = 0.0, 1.0
+        else:
+            raise ValueError(f"L'arrête {arrete[0]} {arrete[1]} n'existe pas.")
+        self._departs, self._arrivees = probleme._indices_arretes()
+        self._reseau = ReseauResiduel(
+            n_sommets=probleme._n_sommets(),
+            departs=self._departs,
+            arrivees=self._arrivees,
+            capacites=self._a
+        )
+        self.flots: Dict[float, np.array] = dict()
+        self.valeurs: Dict[float, float] = dict()
+
+    def evalue(self, parametre: float) -> Droite:
+        """Flot maximal en λ et droite (ordonnée, pente) de la coupe minimale trouvée."""
+        precedents = [λ for λ in self.flots if λ < parametre]
+        depart = self.flots[max(precedents)] if precedents else None
+        self._reseau.reinitialise(self._a + parametre * self._b, flots=depart)
+        self._reseau.dinic(self.source, self.puits)
+        flots = self._reseau.flots()
+        cote = self._reseau.atteignables(self.source)
+        coupees = cote[self._departs] & ~cote[self._arrivees]
+        self.flots[parametre] = flots
+        droite = (float(self._a[coupees].sum()), float(self._b[coupees].sum()))
+        self.valeurs[parametre] = droite[0] + parametre * droite[1]
+        return droite
+
+    def ruptures(self, gauche: float, droite_gauche: Droite, droit: float, droite_droit: Droite):
+        """Explore [gauche, droit] entre deux coupes minimales (Eisner et Severance)."""
+        (a1, b1), (a2, b2) = droite_gauche, droite_droit
+        if b1 <= b2:
+            return
+        milieu = (a2 - a1) / (b1 - b2)
+        if not gauche < milieu < droit:
+            return
+        droite_milieu = self.evalue(milieu)
+        tolerance = 1e-9 * max(1.0, abs(self.valeurs[milieu]))
+        if self.valeurs[milieu] >= a1 + b1 * milieu - tolerance:
+            return
+        self.ruptures(gauche, droite_gauche, milieu, droite_milieu)
+        self.ruptures(milieu, droite_milieu, droit, droite_droit)
+
+
+def courbe_parametrique(
+    grapheOP: GrapheOP,
+    debut: float,
+    fin: float,
+    arrete: Optional[Tuple[Sommet, Sommet]] = None,
+    source: Optional[Sommet] = None,
+    puits: Optional[Sommet] = None
+) -> CourbeParametrique:
+    """Courbe du flot maximal pour λ entre `debut` et `fin`.
+
+    Avec `arrete`, seule la capacité de cette arrête vaut λ ; sinon toutes
+    les capacités sont multipliées par λ. Le nombre de calculs de flot est
+    au plus 2 r + 3 pour r points de rupture. Les points de rupture sont
+    les intersections des coupes minimales et sont donc exacts, à l'arrondi
+    flottant près.
+    """
+    if not 0 <= debut <= fin:
+        raise ValueError("Il faut 0 <= debut <= fin.")
+    debut, fin = float(debut), float(fin)
+    flot = _FlotParametrique(grapheOP, arrete, source, puits)
+    droite_debut = flot.evalue(debut)
+    droite_fin = flot.evalue(fin)
+    flot.ruptures(debut, droite_debut, fin, droite_fin)
+    evaluations = len(flot.flots)
+    # Les λ évalués sans rupture sont sur un segment : on ne garde que les sommets.
+    parametres: List[float] = [debut]
+    for parametre in sorted(flot.flots)[1:]:
+        parametres.append(parametre)
+        if len(parametres) >= 3:
+            (x0, x1, x2) = parametres[-3:]
+            y0, y1, y2 = (flot.valeurs[x] for x in (x0, x1, x2))
+            tolerance = 1e-9 * max(1.0, abs(y1))
+            if x2 > x0 and abs(y0 + (y2 - y0) * (x1 - x0) / (x2 - x0) - y1) <= tolerance:
+                del parametres[-2]
+    if fin not in parametres:
+        parametres.append(fin)
+    return CourbeParametrique(
+        parametres=np.array(parametres, dtype=float),
+        valeurs=np.array([flot.valeurs[parametre] for parametre in parametres]),
+        arretes=flot.arretes,
+        flots=np.array([flot.flots[parametre] for parametre in parametres]),
+        evaluations=evaluations
+    )
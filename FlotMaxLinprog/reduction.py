@@ -0,0 +1,193 @@
+"""Description.
+
+Réduction d'un réseau de flot avant sa résolution : les sommets hors de
+tout chemin source-puits sont élagués, les chaînes de sommets de degré 2
+sont contractées en une arrête de capacité minimale et les arrêtes
+parallèles sont fusionnées en une arrête de capacité totale. Le flot du
+réseau réduit se reporte ensuite sur les arrêtes d'origine.
+
+Exemple :
+
+>>> import numpy as np
+>>> reduction = Reduction(
+...     n_sommets=5,
+...     departs=np.array([0, 1, 0, 2, 4]),
+...     arrivees=np.array([1, 3, 2, 3, 0]),
+...     capacites=np.array([4., 3., 5., 2., 1.]),
+...     source=0,
+...     puits=3
+... )
+>>> reduction.n_sommets, reduction.departs, reduction.capacites
+(2, array([0]), array([5.]))
+>>> reduction.etend(np.array([5.]))
+array([3., 3., 2., 2., 0.])
+"""
+from typing import List
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import breadth_first_order
+
+_SERIE, _PARALLELE = 0, 1
+
+
+class Reduction:
+    """Réseau réduit, renuméroté, et correspondance avec le réseau d'origine.
+
+    Chaque arrête du réseau réduit est un arbre série-parallèle d'arrêtes
+    d'origine : les feuilles sont les arrêtes 0 à E - 1, les nœuds suivants
+    sont créés au fil des contractions et des fusions.
+    """
+
+    def __init__(
+        self,
+        n_sommets: int,
+        departs: np.array,
+        arrivees: np.array,
+        capacites: np.array,
+        source: int,
+        puits: int
+    ):
+        """Réduit le réseau jusqu'à ce qu'aucune règle ne s'applique plus."""
+        departs = np.asarray(departs, dtype=np.int64)
+        arrivees = np.asarray(arrivees, dtype=np.int64)
+        self._n_origine = len(departs)
+        capacites = np.asarray(capacites)
+        # Des capacités entières restent entières : les sommes sont alors exactes.
+        self._type = np.int64 if np.issubdtype(capacites.dtype, np.integer) else float
+        self._capacites: List[float] = capacites.astype(self._type).tolist()
+        self._genres: List[int] = []
+        self._enfants: List[List[int]] = []
+        self._entrants = [dict() for _ in range(n_sommets)]
+        self._sortants = [dict() for _ in range(n_sommets)]
+        utiles = self._utiles(n_sommets, departs, arrivees, source, puits)
+        candidats = []
+        for arrete in np.flatnonzero(utiles).tolist():
+            self._ajoute(int(departs[arrete]), int(arrivees[arrete]), arrete, candidats)
+        candidats.extend(range(n_sommets))
+        while candidats:
+            sommet = candidats.pop()
+            if (
+                sommet != source and sommet != puits
+                and len(self._entrants[sommet]) == 1
+                and len(self._sortants[sommet]) == 1
+            ):
+                self._contracte(sommet, candidats)
+        self._finalise(n_sommets, source, puits)
+
+    @staticmethod
+    def _utiles(
+        n_sommets: int,
+        departs: np.array,
+        arrivees: np.array,
+        source: int,
+        puits: int
+    ) -> np.array:
+        """Masque des arrêtes situées sur un chemin de la source au puits."""
+        adjacence = sparse.csr_matrix(
+            (np.ones(len(departs), dtype=np.int8), (departs, arrivees)),
+            shape=(n_sommets, n_sommets)
+        )
+        avant = np.zeros(n_sommets, dtype=bool)
+        avant[breadth_first_order(adjacence, source, return_predecessors=False)] = True
+        arriere = np.zeros(n_sommets, dtype=bool)
+        arriere[
+            breadth_first_order(adjacence.T.tocsr(), puits, return_predecessors=False)
+        ] = True
+        return avant[departs] & arriere[arrivees] & (departs != arrivees)
+
+    def _compose(self, genre: int, gauche: int, droite: int) -> int:
+        """Nouveau nœud série ou parallèle, aplati si un enfant est du même genre.
+
+        Un enfant aplati perd ses propres enfants pour ne pas être reporté deux fois.
+        """
+        enfants = []
+        for noeud in (gauche, droite):
+            composite = noeud - self._n_origine
+            if composite >= 0 and self._genres[composite] == genre:
+                enfants.extend(self._enfants[composite])
+                self._enfants[composite] = []
+            else:
+                enfants.append(noeud)
+        capacites = [self._capacites[enfant] for enfant in enfants]
+        self._capacites.append(min(capacites) if genre == _SERIE else sum(capacites))
+        self._genres.append(genre)
+        self._enfants.append(enfants)
+        return len(self._capacites) - 1
+
+    def _ajoute(self, depart: int, arrivee: int, noeud: int, candidats: List[int]):
+        """Ajoute une arrête, fusionnée avec l'arrête parallèle existante.
+
+        Une boucle, qui ne peut porter qu'une circulation, est abandonnée.
+        """
+        if depart == arrivee:
+            candidats.append(depart)
+            return
+        existant = self._sortants[depart].get(arrivee)
+        if existant is not None:
+            noeud = self._compose(_PARALLELE, existant, noeud)
+            candidats.extend((depart, arrivee))
+        self._sortants[depart][arrivee] = noeud
+        self._entrants[arrivee][depart] = noeud
+
+    def _contracte(self, sommet: int, candidats: List[int]):
+        """Remplace u -> sommet -> w par une arrête u -> w."""
+        (depart, entrant), = self._entrants[sommet].items()
+        (arrivee, sortant), = self._sortants[sommet].items()
+        self._entrants[sommet].clear()
+        self._sortants[sommet].clear()
+        del self._sortants[depart][sommet]
+        del self._entrants[arrivee][sommet]
+        self._ajoute(depart, arrivee, self._compose(_SERIE, entrant, sortant), candidats)
+
+    def _finalise(self, n_sommets: int, source: int, puits: int):
+        """Tableaux du réseau réduit, les sommets restants étant renumérotés."""
+        departs, arrivees, racines = [], [], []
+        for depart in range(n_sommets):
+            for arrivee, noeud in self._sortants[depart].items():
+                departs.append(depart)
+                arrivees.append(arrivee)
+                racines.append(noeud)
+        self._entrants, self._sortants = None, None
+        departs = np.array(departs, dtype=np.int64)
+        arrivees = np.array(arrivees, dtype=np.int64)
+        self.sommets, indices = np.unique(
+            np.concatenate(([source, puits], departs, arrivees)), return_inverse=True
+        )
+        self.source, self.puits = int(indices[0]), int(indices[1])
+        self.departs = indices[2:2 + len(departs)]
+        self.arrivees = indices[2 + len(departs):]
+        self._racines = np.array(racines, dtype=np.int64)
+        self.capacites = np.array(self._capacites, dtype=self._type)[self._racines]
+
+    @property
+    def n_sommets(self) -> int:
+        """Nombre de sommets du réseau réduit."""
+        return len(self.sommets)
+
+    @property
+    def n_arretes(self) -> int:
+        """Nombre d'arrêtes du réseau réduit."""
+        return len(self._racines)
+
+    def etend(self, flots: np.array) -> np.array:
+        """Flot des arrêtes d'origine à partir du flot du réseau réduit.
+
+        Une chaîne transmet son flot à chacune de ses arrêtes ; des arrêtes
+        parallèles se le partagent dans l'ordre, chacune jusqu'à sa capacité.
+        """
+        flots = np.asarray(flots)
+        resultat = [0] * len(self._capacites)
+        for noeud, flot in zip(self._racines.tolist(), flots.tolist()):
+            resultat[noeud] = flot
+        # Les enfants sont toujours créés avant leur parent.
+        for composite in range(len(self._genres) - 1, -1, -1):
+            flot = resultat[self._n_origine + composite]
+            if self._genres[composite] == _SERIE:
+                for enfant in self._enfants[composite]:
+                    resultat[enfant] = flot
+            else:
+                for enfant in self._enfants[composite]:
+                    part = min(flot, self._capacites[enfant])
+                    resultat[enfant] = part
+                    flot -= part
+        return np.array(resultat[:self._n_origine], dtype=flots.dtype)
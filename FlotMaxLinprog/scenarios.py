@@ -0,0 +1,120 @@
+"""Description.
+
+Résolution d'un même réseau pour de nombreux vecteurs de capacités
+(scénarios de Monte-Carlo) : la structure du problème (matrice
+d'incidence, graphe résiduel) est construite une seule fois, seules les
+bornes changent d'un scénario à l'autre.
+
+Exemple :
+
+>>> graphe = GrapheOP(voisinage={'A': {'B': 4, 'C': 5}, 'B': {'D': 5}, 'C': {'B': 2, 'D': 4}, 'D': {}})
+>>> capacites = np.array([[4, 5, 5, 2, 4], [1, 5, 5, 2, 0]])
+>>> flots, valeurs = resout_scenarios(graphe, capacites, methode="dinic")
+>>> valeurs
+array([9., 3.])
+>>> flots[1]
+array([1., 2., 3., 2., 0.])
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+import numpy as np
+
+from .flot_combinatoire import ReseauResiduel
+from .graphe_op import GrapheOP, Sommet
+from .linprog_graph import LinprogGraph
+
+
+def _resout_bloc(
+    grapheOP: GrapheOP,
+    capacites: np.array,
+    methode: str,
+    source: Optional[Sommet],
+    puits: Optional[Sommet]
+) -> Tuple[np.array, np.array]:
+    """Résout des scénarios consécutifs avec une seule construction du problème."""
+    probleme = LinprogGraph(grapheOP, creux=True, source=source, puits=puits)
+    probleme._synchronise()
+    positions = {
+        (depart, arrivee): i for i, (depart, arrivee, _) in enumerate(grapheOP.arretes)
+    }
+    # Colonne de `capacites` correspondant à chaque colonne du problème.
+    ordre = np.array(
+        [positions[arrete] for arrete in probleme._arretes], dtype=np.int64
+    )
+    internes = np.asarray(capacites, dtype=float)[:, ordre]
+    flots = np.full(internes.shape, np.nan)
+    valeurs = np.full(len(internes), np.nan)
+    source_idx, puits_idx = probleme._terminaux()
+    if methode == "highs":
+        from scipy.optimize import linprog
+        c = probleme._objectif()
+        A_eq = probleme._calcule_A_eq_creux()
+        b_eq = probleme._calcule_b_eq()
+        for scenario, capacites_scenario in enumerate(internes):
+            resultat = linprog(
+                c, A_eq=A_eq, b_eq=b_eq,
+                bounds=probleme._bornes(capacites_scenario), method="highs"
+            )
+            if resultat.x is not None:
+                valeurs[scenario] = resultat.x[0]
+                flots[scenario] = resultat.x[1:-1]
+    else:
+        departs, arrivees = probleme._indices_arretes()
+        reseau = ReseauResiduel(
+            n_sommets=probleme._n_sommets(),
+            departs=departs,
+            arrivees=arrivees,
+            capacites=internes[0] if len(internes) else np.zeros(len(ordre))
+        )
+        for scenario, capacites_scenario in enumerate(internes):
+            reseau.reinitialise(capacites_scenario)
+            valeurs[scenario] = getattr(reseau, methode)(source_idx, puits_idx)
+            flots[scenario] = reseau.flots()
+    resultat = np.empty_like(flots)
+    resultat[:, ordre] = flots
+    return resultat, valeurs
+
+
+def resout_scenarios(
+    grapheOP: GrapheOP,
+    capacites: np.array,
+    methode: str = "highs",
+    source: Optional[Sommet] = None,
+    puits: Optional[Sommet] = None,
+    n_processus: Optional[int] = 1
+) -> Tuple[np.array, np.array]:
+    """Flots (scénarios × arrêtes) et valeurs du flot maximal de chaque scénario.
+
+    La colonne j de `capacites` est la capacité de la j-ième arrête de
+    `grapheOP.arretes` ; les flots sont rendus dans le même ordre. Un
+    scénario sans solution a des flots et une valeur NaN. Avec
+    `n_processus` différent de 1 (None pour tous les processeurs), les
+    scénarios sont répartis en blocs contigus sur un pool de processus.
+    """
+    methodes = ("highs", "dinic", "push_relabel")
+    if methode not in methodes:
+        raise ValueError(f"Méthode {methode} inconnue, choisir parmi {methodes}.")
+    capacites = np.atleast_2d(np.asarray(capacites))
+    n_arretes = len(grapheOP.arretes)
+    if capacites.ndim != 2 or capacites.shape[1] != n_arretes:
+        raise ValueError(
+            f"Il faut un tableau (scénarios × {n_arretes}) de capacités, "
+            f"pas {capacites.shape}."
+        )
+    if len(LinprogGraph._capacites_invalides(capacites)):
+        raise ValueError("Les capacités doivent être des nombres positifs ou nuls.")
+    n_blocs = min(len(capacites), n_processus or os.cpu_count() or 1)
+    if n_blocs <= 1:
+        return _resout_bloc(grapheOP, capacites, methode, source, puits)
+    blocs = np.array_split(capacites, n_blocs)
+    with ProcessPoolExecutor(max_workers=n_blocs) as executeur:
+        resultats = list(executeur.map(
+            _resout_bloc,
+            [grapheOP] * n_blocs, blocs,
+            [methode] * n_blocs, [source] * n_blocs, [puits] * n_blocs
+        ))
+    return (
+        np.concatenate([flots for flots, _ in resultats]),
+        np.concatenate([valeurs for _, valeurs in resultats])
+    )
@@ -0,0 +1,185 @@
+"""Description.
+
+Résultat d'une résolution du problème de flot maximal.
+"""
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+import numpy as np
+
+from .graphe_op import Sommet, Poids
+from .instrumentation import Statistiques
+
+
+@dataclass(eq=False)
+class Solution:
+    """Flot maximal calculé une seule fois puis réutilisé.
+
+    Exemple :
+
+    >>> solution = Solution(
+    ...     arretes=[('A', 'B'), ('B', 'C')],
+    ...     flots=np.array([1.0, 1.0]),
+    ...     valeur=1.0
+    ... )
+    >>> solution.en_liste()
+    [(('A', 'B'), 1.0), (('B', 'C'), 1.0)]
+    """
+
+    arretes: List[Tuple[Sommet, Sommet]]
+    flots: np.array
+    valeur: Poids
+    statut: int = 0
+    message: str = ""
+    iterations: int = 0
+    temps: Dict[str, float] = field(default_factory=dict)
+    criticite: Optional[np.array] = None
+    statistiques: Optional[Statistiques] = None
+    cout: Optional[Poids] = None
+
+    def en_liste(self) -> List[Tuple[Tuple[Sommet, Sommet], Poids]]:
+        """Forme renvoyée par `LinprogGraph.solveur`."""
+        return [
+            (arrete, flot_max)
+            for arrete, flot_max in zip(self.arretes, self.flots.tolist())
+        ]
+
+    def sauvegarde(self, repertoire: Union[str, Path]):
+        """Ecrit les tableaux en .npy et le reste dans `solution.json`.
+
+        Les statistiques ne sont pas sauvegardées.
+        """
+        repertoire = Path(repertoire)
+        repertoire.mkdir(parents=True, exist_ok=True)
+        departs, arrivees = zip(*self.arretes) if self.arretes else ((), ())
+        np.save(repertoire / "departs.npy", np.array(departs, dtype=str), allow_pickle=False)
+        np.save(repertoire / "arrivees.npy", np.array(arrivees, dtype=str), allow_pickle=False)
+        for nom in ("flots", "criticite"):
+            if getattr(self, nom) is not None:
+                np.save(repertoire / f"{nom}.npy", getattr(self, nom), allow_pickle=False)
+        (repertoire / "solution.json").write_text(json.dumps({
+            "valeur": None if self.valeur is None else float(self.valeur),
+            "statut": int(self.statut),
+            "message": str(self.message),
+            "iterations": int(self.iterations),
+            "temps": {nom: float(duree) for nom, duree in self.temps.items()},
+            "cout": None if self.cout is None else float(self.cout),
+        }))
+
+    @classmethod
+    def charge(cls, repertoire: Union[str, Path], projete: bool = True) -> "Solution":
+        """Relit une solution sauvegardée, les flots en mémoire projetée par défaut."""
+        repertoire = Path(repertoire)
+        if not (repertoire / "solution.json").is_file():
+            raise ValueError(f"Le répertoire {repertoire} ne contient pas de solution.")
+        mode = "r" if projete else None
+        tableaux = {
+            nom: np.load(repertoire / f"{nom}.npy", mmap_mode=mode)
+            for nom in ("flots", "criticite")
+            if (repertoire / f"{nom}.npy").is_file()
+        }
+        return cls(
+            arretes=list(zip(
+                np.load(repertoire / "departs.npy").tolist(),
+                np.load(repertoire / "arrivees.npy").tolist()
+            )),
+            flots=tableaux.get("flots"),
+            criticite=tableaux.get("criticite"),
+            **json.loads((repertoire / "solution.json").read_text())
+        )
+
+
+@dataclass(eq=False)
+class Coupe:
+    """Coupe minimale entre une source et un puits."""
+
+    cote_source: Set[Sommet]
+    arretes: List[Tuple[Sommet, Sommet]]
+    capacite: Poids
+
+
+@dataclass(eq=False)
+class Verification:
+    """Certificat d'un flot : admissibilité et optimalité, à `tolerance` près.
+
+    `depassements` liste les arrêtes dont le flot sort de [0, capacité],
+    avec leur écart, et `desequilibres` les sommets autres que la source et
+    le puits dont le bilan entrant - sortant n'est pas nul. `coupe` est
+    formée des sommets atteignables depuis la source dans le graphe
+    résiduel : le flot est optimal s'il est admissible, si le puits n'y est
+    pas et si la capacité de la coupe est égale à la valeur du flot.
+    """
+
+    valeur: Poids
+    coupe: Coupe
+    depassements: List[Tuple[Tuple[Sommet, Sommet], Poids]]
+    desequilibres: List[Tuple[Sommet, Poids]]
+    puits_atteignable: bool
+    tolerance: float = 0.0
+
+    @property
+    def admissible(self) -> bool:
+        """Capacités et conservation respectées."""
+        return not self.depassements and not self.desequilibres
+
+    @property
+    def ecart(self) -> Poids:
+        """Capacité de la coupe moins valeur du flot, nul pour un flot maximal."""
+        return self.coupe.capacite - self.valeur
+
+    @property
+    def optimal(self) -> bool:
+        """Flot admissible et maximal, l'écart étant toléré par sommet et arrête de la coupe."""
+        marge = self.tolerance * (len(self.coupe.cote_source) + len(self.coupe.arretes))
+        return self.admissible and not self.puits_atteignable and abs(self.ecart) <= marge
+
+
+@dataclass(eq=False)
+class SolutionMultiProduits:
+    """Flots de plusieurs produits partageant les capacités des arrêtes.
+
+    `flots` a une ligne par produit et une colonne par arrête ; `taux` est
+    la fraction des demandes acheminée en mode concurrent, None sinon.
+    """
+
+    produits: List[Tuple[Sommet, Sommet, Optional[Poids]]]
+    arretes: List[Tuple[Sommet, Sommet]]
+    flots: np.array
+    valeurs: np.array
+    taux: Optional[float] = None
+    statut: int = 0
+    message: str = ""
+    iterations: int = 0
+    temps: Dict[str, float] = field(default_factory=dict)
+
+    def en_liste(self, produit: int) -> List[Tuple[Tuple[Sommet, Sommet], Poids]]:
+        """Flot d'un produit sur chaque arrête, sous la forme de `Solution.en_liste`."""
+        return [
+            (arrete, flot)
+            for arrete, flot in zip(self.arretes, self.flots[produit].tolist())
+        ]
+
+
+@dataclass(eq=False)
+class CourbeParametrique:
+    """Valeur du flot maximal, affine par morceaux, en fonction d'un paramètre λ.
+
+    `parametres` contient les bornes de l'intervalle et les points de
+    rupture, `flots` un flot maximal en chacun de ces points.
+    """
+
+    parametres: np.array
+    valeurs: np.array
+    arretes: List[Tuple[Sommet, Sommet]]
+    flots: np.array
+    evaluations: int = 0
+
+    def valeur(self, parametre: float) -> float:
+        """Valeur du flot maximal pour λ dans l'intervalle, par interpolation exacte."""
+        return float(np.interp(parametre, self.parametres, self.valeurs))
+
+    @property
+    def ruptures(self) -> np.array:
+        """Points de rupture strictement à l'intérieur de l'intervalle."""
+        return self.parametres[1:-1]
@@ -0,0 +1,5 @@
+"""Description.
+
+Mesures de performance du module FlotMaxLinprog sur des réseaux synthétiques.
+On pourra lancer python -m benchmarks.bench_flot --help.
+"""
@@ -0,0 +1,165 @@
+"""Description.
+
+Temps et pic mémoire de chaque phase (lecture, conversion networkx,
+construction des matrices, résolution) sur les réseaux synthétiques.
+
+Exemple :
+
+    python -m benchmarks.bench_flot --tailles 100 1000 10000 --sortie bench.json
+
+Les phases dont le coût est quadratique (lecture par chaîne, matrices
+denses) sont sautées au-delà des seuils `--max-str` et `--max-dense`.
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import scipy
+
+from FlotMaxLinprog import GrapheOP, LinprogGraph
+from .generateurs import FORMES, genere
+
+
+def mesure(fonction: Callable[[], Any], memoire: bool = True) -> Tuple[float, Optional[int]]:
+    """Temps d'un appel, puis pic mémoire d'un second appel sous tracemalloc."""
+    debut = perf_counter()
+    fonction()
+    temps = perf_counter() - debut
+    pic = None
+    if memoire:
+        tracemalloc.start()
+        try:
+            fonction()
+            _, pic = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return temps, pic
+
+
+# Les graphes générés n'ont pas de coûts : "cout_minimal" ne s'y applique pas.
+METHODES = [methode for methode in LinprogGraph.methodes if methode != "cout_minimal"]
+
+
+def phases(
+    graphe: GrapheOP,
+    chemin: Path,
+    methodes: List[str],
+    max_str: int,
+    max_dense: int
+) -> Dict[str, Callable[[], Any]]:
+    """Fonctions à mesurer pour un graphe, dans l'ordre d'exécution."""
+    arretes = graphe.arretes
+    texte = "\n".join(f"{depart} {arrivee} {poids}" for depart, arrivee, poids in arretes)
+    chemin.write_text(texte)
+    source, puits = graphe.sommets[0], graphe.sommets[-1]
+
+    def probleme(**options) -> LinprogGraph:
+        return LinprogGraph(graphe, source=source, puits=puits, **options)
+
+    resultat: Dict[str, Callable[[], Any]] = dict()
+    if len(arretes) <= max_str:
+        resultat["lecture_str"] = lambda: GrapheOP.par_str_ordonne(texte)
+    resultat["lecture_fichier"] = lambda: GrapheOP.par_fichier(chemin)
+    resultat["networkx"] = graphe.convertit_nx_graphe
+    if len(arretes) <= max_dense:
+        resultat["A_eq"] = lambda: probleme()._calcule_A_eq()
+        resultat["A_ub"] = lambda: probleme()._calcule_A_ub()
+    resultat["A_eq_creux"] = lambda: probleme(creux=True)._calcule_A_eq_creux()
+    for methode in methodes:
+        resultat[f"resolution_{methode}"] = (
+            lambda methode=methode: probleme(creux=True, methode=methode).solution
+        )
+    return resultat
+
+
+def lance(
+    formes: List[str],
+    tailles: List[int],
+    methodes: List[str],
+    graine: int,
+    memoire: bool,
+    max_str: int,
+    max_dense: int
+) -> Dict[str, Any]:
+    """Exécute toutes les mesures et renvoie un dictionnaire sérialisable."""
+    resultats = []
+    with tempfile.TemporaryDirectory() as repertoire:
+        chemin = Path(repertoire) / "arretes.txt"
+        for forme in formes:
+            for taille in tailles:
+                graphe = genere(forme, taille, graine)
+                n_sommets, n_arretes = len(graphe.sommets), len(graphe.arretes)
+                for phase, fonction in phases(
+                    graphe, chemin, methodes, max_str, max_dense
+                ).items():
+                    temps, pic = mesure(fonction, memoire)
+                    resultats.append({
+                        "forme": forme,
+                        "taille": taille,
+                        "n_sommets": n_sommets,
+                        "n_arretes": n_arretes,
+                        "phase": phase,
+                        "temps_s": temps,
+                        "pic_memoire_octets": pic,
+                    })
+                    print(
+                        f"{forme:>18} {n_arretes:>9} {phase:>24} {temps:10.4f} s"
+                        + ("" if pic is None else f" {pic / 2**20:10.1f} Mio"),
+                        file=sys.stderr
+                    )
+    return {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "scipy": scipy.__version__,
+            "plateforme": platform.platform(),
+            "graine": graine,
+        },
+        "resultats": resultats,
+    }
+
+
+def main(arguments: Optional[List[str]] = None):
+    """Point d'entrée en ligne de commande."""
+    analyseur = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    analyseur.add_argument("--formes", nargs="+", default=list(FORMES), choices=list(FORMES))
+    analyseur.add_argument(
+        "--tailles", nargs="+", type=int, default=[10**2, 10**3, 10**4, 10**5, 10**6],
+        help="nombres d'arrêtes visés"
+    )
+    analyseur.add_argument(
+        "--methodes", nargs="+", default=METHODES, choices=METHODES
+    )
+    analyseur.add_argument("--graine", type=int, default=0)
+    analyseur.add_argument("--sans-memoire", action="store_true", help="ne pas mesurer le pic mémoire")
+    analyseur.add_argument("--max-str", type=int, default=10**4)
+    analyseur.add_argument("--max-dense", type=int, default=5 * 10**3)
+    analyseur.add_argument("--sortie", type=Path, help="fichier JSON, sinon la sortie standard")
+    options = analyseur.parse_args(arguments)
+    rapport = lance(
+        formes=options.formes,
+        tailles=options.tailles,
+        methodes=options.methodes,
+        graine=options.graine,
+        memoire=not options.sans_memoire,
+        max_str=options.max_str,
+        max_dense=options.max_dense,
+    )
+    texte = json.dumps(rapport, indent=2)
+    if options.sortie is None:
+        print(texte)
+    else:
+        options.sortie.write_text(texte)
+
+
+if __name__ == "__main__":
+    main()
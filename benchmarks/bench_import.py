@@ -0,0 +1,92 @@
+"""Description.
+
+Temps d'import du paquet dans un interpréteur neuf, et modules lourds
+(tracé, affichage, optimisation) chargés au passage.
+
+Exemple :
+
+    python -m benchmarks.bench_import --repetitions 5 --sortie import.json
+
+Les modules de `MODULES_DIFFERES` ne doivent être importés qu'au premier
+tracé, au premier affichage ou à la première résolution par HiGHS.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+MODULES_DIFFERES = (
+    "networkx",
+    "matplotlib",
+    "pygraphviz",
+    "rich",
+    "scipy.optimize",
+)
+
+_SCRIPT = """
+import json, sys
+from time import perf_counter
+debut = perf_counter()
+import FlotMaxLinprog
+duree = perf_counter() - debut
+print(json.dumps({
+    "temps_s": duree,
+    "charges": [nom for nom in %r if nom in sys.modules],
+}))
+"""
+
+
+def mesure_import(racine: Optional[Path] = None) -> Dict[str, Any]:
+    """Temps d'import et modules différés chargés, dans un nouveau processus."""
+    racine = racine or Path(__file__).resolve().parent.parent
+    sortie = subprocess.run(
+        [sys.executable, "-c", _SCRIPT % (MODULES_DIFFERES,)],
+        cwd=racine,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(sortie.stdout)
+
+
+def lance(repetitions: int) -> Dict[str, Any]:
+    """Répète la mesure et renvoie un dictionnaire sérialisable."""
+    mesures = [mesure_import() for _ in range(repetitions)]
+    temps = [mesure["temps_s"] for mesure in mesures]
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "plateforme": platform.platform(),
+            "repetitions": repetitions,
+        },
+        "temps_s": temps,
+        "mediane_s": statistics.median(temps),
+        "charges": sorted({nom for mesure in mesures for nom in mesure["charges"]}),
+    }
+
+
+def main(arguments: Optional[List[str]] = None):
+    """Point d'entrée en ligne de commande."""
+    analyseur = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    analyseur.add_argument("--repetitions", type=int, default=5)
+    analyseur.add_argument("--sortie", type=Path, help="fichier JSON, sinon la sortie standard")
+    options = analyseur.parse_args(arguments)
+    rapport = lance(options.repetitions)
+    print(
+        f"import FlotMaxLinprog : {rapport['mediane_s']:.3f} s, "
+        f"modules différés chargés : {rapport['charges'] or 'aucun'}",
+        file=sys.stderr
+    )
+    texte = json.dumps(rapport, indent=2)
+    if options.sortie is None:
+        print(texte)
+    else:
+        options.sortie.write_text(texte)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Description.
+
+Générateurs reproductibles (graine) de réseaux de flot synthétiques.
+
+Chaque générateur renvoie un `GrapheOP` dont le premier sommet est la
+source et le dernier le puits.
+
+Exemple :
+
+>>> graphe = grille(lignes=2, colonnes=3, graine=0)
+>>> len(graphe.arretes)
+7
+>>> graphe.sommets[0], graphe.sommets[-1]
+('g0_0', 'g1_2')
+"""
+from typing import Callable, Dict, List
+import numpy as np
+
+from FlotMaxLinprog import GrapheOP
+
+
+def _graphe(
+    noms: List[str],
+    departs: np.array,
+    arrivees: np.array,
+    capacites: np.array
+) -> GrapheOP:
+    """Graphe dont les sommets sont rangés dans l'ordre de `noms`."""
+    voisinage: Dict[str, Dict[str, int]] = {nom: dict() for nom in noms}
+    for depart, arrivee, capacite in zip(
+        departs.tolist(), arrivees.tolist(), capacites.tolist()
+    ):
+        voisinage[noms[depart]][noms[arrivee]] = capacite
+    return GrapheOP(voisinage=voisinage)
+
+
+def chaine_logistique(
+    n_couches: int, largeur: int, degre: int, graine: int = 0
+) -> GrapheOP:
+    """Réseau en couches : source, `n_couches` couches de `largeur` dépôts, puits.
+
+    Chaque dépôt dessert `degre` dépôts distincts de la couche suivante.
+    """
+    generateur = np.random.default_rng(graine)
+    degre = min(degre, largeur)
+    noms = ["source"] + [
+        f"c{couche}_{i}" for couche in range(n_couches) for i in range(largeur)
+    ] + ["puits"]
+    departs, arrivees = [np.zeros(largeur, dtype=np.int64)], [np.arange(1, largeur + 1)]
+    for couche in range(n_couches - 1):
+        debut = 1 + couche * largeur
+        voisins = np.argsort(generateur.random((largeur, largeur)), axis=1)[:, :degre]
+        departs.append(np.repeat(np.arange(debut, debut + largeur), degre))
+        arrivees.append((debut + largeur + voisins).ravel())
+    derniere = 1 + (n_couches - 1) * largeur
+    departs.append(np.arange(derniere, derniere + largeur))
+    arrivees.append(np.full(largeur, len(noms) - 1))
+    departs, arrivees = np.concatenate(departs), np.concatenate(arrivees)
+    capacites = generateur.integers(1, 100, size=len(departs))
+    return _graphe(noms, departs, arrivees, capacites)
+
+
+def grille(lignes: int, colonnes: int, graine: int = 0) -> GrapheOP:
+    """Grille orientée vers la droite et vers le bas, du coin haut gauche au coin bas droit."""
+    generateur = np.random.default_rng(graine)
+    noms = [f"g{i}_{j}" for i in range(lignes) for j in range(colonnes)]
+    indices = np.arange(lignes * colonnes).reshape(lignes, colonnes)
+    departs = np.concatenate((indices[:, :-1].ravel(), indices[:-1, :].ravel()))
+    arrivees = np.concatenate((indices[:, 1:].ravel(), indices[1:, :].ravel()))
+    capacites = generateur.integers(1, 100, size=len(departs))
+    return _graphe(noms, departs, arrivees, capacites)
+
+
+def dag_aleatoire(n_sommets: int, n_arretes: int, graine: int = 0) -> GrapheOP:
+    """Graphe orienté acyclique creux, arrêtes i -> j avec i < j tirées uniformément.
+
+    Les arrêtes 0 -> 1 et n - 2 -> n - 1 sont toujours présentes pour que la
+    source et le puits ne soient pas isolés.
+    """
+    generateur = np.random.default_rng(graine)
+    n_arretes = max(2, min(n_arretes, n_sommets * (n_sommets - 1) // 2))
+    imposees = np.array([1, (n_sommets - 2) * n_sommets + n_sommets - 1])
+    cles = imposees
+    while len(cles) < n_arretes:
+        paires = np.sort(generateur.integers(0, n_sommets, size=(2 * n_arretes, 2)), axis=1)
+        paires = paires[paires[:, 0] < paires[:, 1]]
+        cles = np.unique(np.concatenate((cles, paires[:, 0] * n_sommets + paires[:, 1])))
+    autres = generateur.permutation(np.setdiff1d(cles, imposees))
+    cles = np.concatenate((imposees, autres[:n_arretes - 2]))
+    departs, arrivees = np.divmod(cles, n_sommets)
+    capacites = generateur.integers(1, 100, size=n_arretes)
+    noms = [f"v{i}" for i in range(n_sommets)]
+    return _graphe(noms, departs, arrivees, capacites)
+
+
+def biparti_dense(n_gauche: int, n_droite: int, graine: int = 0) -> GrapheOP:
+    """Source, deux groupes entièrement reliés entre eux, puits."""
+    generateur = np.random.default_rng(graine)
+    noms = ["source"] + [f"o{i}" for i in range(n_gauche)] + [
+        f"d{j}" for j in range(n_droite)
+    ] + ["puits"]
+    puits = len(noms) - 1
+    gauche = np.arange(1, n_gauche + 1)
+    droite = np.arange(n_gauche + 1, n_gauche + n_droite + 1)
+    departs = np.concatenate((
+        np.zeros(n_gauche, dtype=np.int64), np.repeat(gauche, n_droite), droite
+    ))
+    arrivees = np.concatenate((gauche, np.tile(droite, n_gauche), np.full(n_droite, puits)))
+    capacites = generateur.integers(1, 100, size=len(departs))
+    return _graphe(noms, departs, arrivees, capacites)
+
+
+def _par_taille_chaine(n_arretes: int, graine: int) -> GrapheOP:
+    largeur = max(2, int(np.sqrt(n_arretes / 4)))
+    n_couches = max(2, n_arretes // (4 * largeur))
+    return chaine_logistique(n_couches, largeur, 4, graine)
+
+
+def _par_taille_grille(n_arretes: int, graine: int) -> GrapheOP:
+    cote = max(2, int(np.sqrt(n_arretes / 2)))
+    return grille(cote, cote, graine)
+
+
+def _par_taille_dag(n_arretes: int, graine: int) -> GrapheOP:
+    return dag_aleatoire(max(4, n_arretes // 4), n_arretes, graine)
+
+
+def _par_taille_biparti(n_arretes: int, graine: int) -> GrapheOP:
+    cote = max(1, int(np.sqrt(n_arretes)))
+    return biparti_dense(cote, cote, graine)
+
+
+FORMES: Dict[str, Callable[[int, int], GrapheOP]] = {
+    "chaine_logistique": _par_taille_chaine,
+    "grille": _par_taille_grille,
+    "dag_aleatoire": _par_taille_dag,
+    "biparti_dense": _par_taille_biparti,
+}
+
+
+def genere(forme: str, n_arretes: int, graine: int = 0) -> GrapheOP:
+    """Graphe de la forme demandée avec environ `n_arretes` arrêtes."""
+    if forme not in FORMES:
+        raise ValueError(f"Forme {forme} inconnue, choisir parmi {list(FORMES)}.")
+    return FORMES[forme](n_arretes, graine)
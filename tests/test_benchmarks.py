@@ -0,0 +1,48 @@
+"""Description.
+
+Tests des générateurs et de la suite de mesures de performance.
+"""
+
+import json
+import pytest
+from FlotMaxLinprog import *
+from benchmarks.bench_flot import METHODES, main
+from benchmarks.bench_import import mesure_import
+from benchmarks.generateurs import FORMES, genere
+
+
+@pytest.mark.parametrize("forme", list(FORMES))
+def test_genere_reproductible(forme):
+    """Même graine, même graphe ; taille proche de celle demandée."""
+    graphe = genere(forme, 500, graine=3)
+    assert graphe == genere(forme, 500, graine=3)
+    assert 250 <= len(graphe.arretes) <= 1000
+    linprog_graph = LinprogGraph(
+        graphe, methode="dinic", source=graphe.sommets[0], puits=graphe.sommets[-1]
+    )
+    assert linprog_graph.solution.valeur > 0
+
+def test_main(tmp_path):
+    """Rapport JSON lisible."""
+    sortie = tmp_path / "bench.json"
+    main(["--formes", "grille", "--tailles", "50", "--methodes", "dinic", "--sortie", str(sortie)])
+    rapport = json.loads(sortie.read_text())
+    phases = [ligne["phase"] for ligne in rapport["resultats"]]
+    assert phases == [
+        "lecture_str", "lecture_fichier", "networkx", "A_eq", "A_ub",
+        "A_eq_creux", "resolution_dinic"
+    ]
+    assert all(ligne["pic_memoire_octets"] >= 0 for ligne in rapport["resultats"])
+
+def test_main_methodes_par_defaut(tmp_path):
+    """Toutes les méthodes par défaut s'appliquent aux graphes générés, sans coûts."""
+    sortie = tmp_path / "bench.json"
+    main(["--formes", "grille", "--tailles", "50", "--sans-memoire", "--sortie", str(sortie)])
+    phases = [ligne["phase"] for ligne in json.loads(sortie.read_text())["resultats"]]
+    assert [phase for phase in phases if phase.startswith("resolution_")] == [
+        f"resolution_{methode}" for methode in METHODES
+    ]
+
+def test_import_differe():
+    """`import FlotMaxLinprog` ne charge ni tracé, ni affichage, ni HiGHS."""
+    assert mesure_import()["charges"] == []
@@ -0,0 +1,48 @@
+"""Description.
+
+Tests pour la classe ArbreGomoryHu.
+"""
+
+import pytest
+from FlotMaxLinprog import *
+
+
+@pytest.fixture
+def arbre():
+    return ArbreGomoryHu(
+        GrapheOP(
+            voisinage={
+                'A': {'B': 3, 'C': 1},
+                'B': {'A': 3, 'C': 2},
+                'C': {'A': 1, 'B': 2, 'D': 4},
+                'D': {'C': 4}
+            }
+        )
+    )
+
+def test_arretes(arbre):
+    """V - 1 arrêtes."""
+    assert len(arbre.arretes) == 3
+
+@pytest.mark.parametrize(
+    "x, y, attendu",
+    [('A', 'B', 4), ('A', 'C', 3), ('A', 'D', 3), ('B', 'D', 3), ('C', 'D', 4)]
+)
+def test_valeur_coupe(arbre, x, y, attendu):
+    """Mêmes valeurs qu'un calcul de flot maximal."""
+    assert arbre.valeur_coupe(x, y) == attendu
+    assert arbre.valeur_coupe(y, x) == attendu
+    linprog_graph = LinprogGraph(arbre._csr.en_grapheOP(), source=x, puits=y)
+    assert linprog_graph.solution.valeur == pytest.approx(attendu)
+
+def test_coupe_min(arbre):
+    """Le côté source contient x, la capacité est celle des arrêtes coupées."""
+    coupe = arbre.coupe_min('D', 'A')
+    assert coupe.cote_source == {'C', 'D'}
+    assert sorted(coupe.arretes) == [('C', 'A'), ('C', 'B')]
+    assert coupe.capacite == 3
+
+def test_graphe_ordonne():
+    """Doit boguer."""
+    with pytest.raises(ValueError):
+        ArbreGomoryHu(GrapheOP(voisinage={'A': {'B': 1}, 'B': {}}))
@@ -0,0 +1,100 @@
+"""Description.
+
+Tests pour la classe GrapheCSR.
+"""
+
+import pytest
+import numpy as np
+from FlotMaxLinprog import *
+
+
+@pytest.fixture
+def voisinage():
+    return {
+        'A': {'B': 4, 'C': 5},
+        'B': {'D': 5},
+        'C': {'B': 2, 'D': 4},
+        'D': {}
+    }
+
+def test_par_voisinage(voisinage):
+    """Tableaux CSR attendus."""
+    g = GrapheCSR.par_voisinage(voisinage)
+    assert g.noms.tolist() == ['A', 'B', 'C', 'D']
+    assert g.indptr.tolist() == [0, 2, 3, 5, 5]
+    assert g.indices.dtype == np.int32
+    assert g.indices.tolist() == [1, 2, 3, 1, 3]
+    assert g.capacites.tolist() == [4, 5, 5, 2, 4]
+
+def test_aller_retour(voisinage):
+    """Conversion dans les deux sens."""
+    graphe = GrapheOP(voisinage=voisinage)
+    g = GrapheCSR.par_grapheOP(graphe)
+    assert g.voisinage == voisinage
+    assert g.en_grapheOP() == graphe
+
+def test_arrivee_sans_voisinage():
+    """Un sommet d'arrivée absent des clés est ajouté."""
+    g = GrapheCSR.par_voisinage({'A': {'B': 1}})
+    assert g.noms.tolist() == ['A', 'B']
+    assert g.voisinage == {'A': {'B': 1}, 'B': {}}
+
+def test_arretes(voisinage):
+    """Les indices et capacités sont des vues des tableaux CSR."""
+    g = GrapheCSR.par_voisinage(voisinage)
+    departs, arrivees, capacites = g.arretes
+    assert departs.tolist() == [0, 0, 1, 2, 2]
+    assert arrivees is g.indices
+    assert capacites is g.capacites
+    assert [
+        (g.noms[d], g.noms[a], c) for d, a, c in zip(departs, arrivees, capacites)
+    ] == GrapheOP(voisinage=voisinage).arretes
+
+def test_adjacence(voisinage):
+    """Matrice creuse sans copie."""
+    g = GrapheCSR.par_voisinage(voisinage)
+    adjacence = g.adjacence
+    assert adjacence.toarray().tolist() == GrapheOP(voisinage=voisinage).adjacence
+    assert np.shares_memory(adjacence.data, g.capacites)
+
+def test_voisins(voisinage):
+    g = GrapheCSR.par_voisinage(voisinage)
+    assert g["A"] == {'B': 4, 'C': 5}
+    assert g.identifiant("D") == 3
+
+def test_par_fichier(tmp_path, voisinage):
+    """Lecture par blocs, ordre d'apparition des sommets."""
+    chemin = tmp_path / "arretes.txt"
+    chemin.write_text("# départ arrivée capacité\nA B 4\nA C 5\nB D 5\n\nC B 2\nC D 4\n")
+    g = GrapheCSR.par_fichier(chemin, taille_bloc=2)
+    assert g.noms.tolist() == ['A', 'B', 'C', 'D']
+    assert g.voisinage == voisinage
+    assert GrapheOP.par_fichier(chemin) == GrapheOP(voisinage=voisinage)
+
+def test_par_fichier_csv_gzip(tmp_path):
+    """Séparateur virgule, compression gzip et capacités flottantes."""
+    import gzip
+    chemin = tmp_path / "arretes.csv.gz"
+    with gzip.open(chemin, "wt") as fichier:
+        fichier.write("X,Y,1.5\nY,Z,2\n")
+    g = GrapheCSR.par_fichier(chemin, separateur=",")
+    assert g.voisinage == {'X': {'Y': 1.5}, 'Y': {'Z': 2.0}, 'Z': {}}
+
+def test_par_fichier_doublon(tmp_path):
+    """Doit boguer."""
+    chemin = tmp_path / "arretes.txt"
+    chemin.write_text("A B 1\nB C 1\nA B 2\n")
+    with pytest.raises(ValueError):
+        GrapheCSR.par_fichier(chemin, taille_bloc=1)
+
+def test_sauvegarde(voisinage, tmp_path):
+    """Aller-retour binaire, en mémoire projetée."""
+    g = GrapheCSR.par_voisinage(voisinage)
+    g.sauvegarde(tmp_path / "graphe")
+    relu = GrapheCSR.charge(tmp_path / "graphe")
+    assert relu == g
+    assert isinstance(relu.indices.base, np.memmap)
+    assert relu["C"] == {'B': 2, 'D': 4}
+    assert GrapheCSR.charge(tmp_path / "graphe", projete=False) == g
+    with pytest.raises(ValueError):
+        GrapheCSR.charge(tmp_path)
@@ -168,3 +168,98 @@ def test_convertit_nx_graphe():
     assert arretes == arretes_attendues
     
 
+def test_ajoute_arrete():
+    """La version augmente à chaque modification."""
+    g = GrapheOP(voisinage={"A": {"B": 1}, "B": {}})
+    g.ajoute_arrete("B", "C", 2)
+    g.ajoute_arrete("A", "B", 3)
+    assert g == GrapheOP(voisinage={"A": {"B": 3}, "B": {"C": 2}, "C": {}})
+    assert g.version == 2
+
+def test_par_str_couts():
+    """Quatrième colonne facultative pour les coûts."""
+    essai = GrapheOP.par_str_ordonne(
+        """
+A B 1 3
+B C 2
+"""
+    )
+    assert essai.couts == {"A": {"B": 3}}
+    assert essai.cout("A", "B") == 3
+    assert essai.cout("B", "C") == 0
+    assert repr(GrapheOP(voisinage={"A": {}}, couts={})) == "GrapheOP(voisinage={'A': {}}, couts={})"
+
+def test_sauvegarde(tmp_path):
+    """Aller-retour binaire avec les coûts."""
+    essai = GrapheOP.par_str_ordonne(
+        """
+A B 1 3
+B C 2.5
+"""
+    )
+    essai.sauvegarde(tmp_path / "graphe")
+    assert GrapheOP.charge(tmp_path / "graphe") == essai
+
+def test_adjacence_creuse():
+    """Même matrice que la forme dense, recalculée après modification."""
+    g = GrapheOP(voisinage={"A": {"B": 1}, "B": {"A": 1, "C": 2}, "C": {}})
+    assert g.adjacence_creuse.toarray().tolist() == g.adjacence
+    assert g.adjacence_creuse is g.adjacence_creuse
+    assert g.est_ordonne
+    g.ajoute_arrete("C", "B", 2)
+    assert g.adjacence_creuse.toarray().tolist() == g.adjacence
+    assert not g.est_ordonne
+
+def test_adjacence_creuse_arrivees_seules():
+    """Les sommets qui ne sont qu'arrivées suivent ceux de `sommets`."""
+    g = GrapheOP(voisinage={"A": {"Z": 1, "B": 2}, "B": {"Y": 3}})
+    assert g.sommets == ["A", "B"]
+    assert g.adjacence_creuse.toarray().tolist() == [
+        [0, 2, 1, 0], [0, 0, 0, 3], [0, 0, 0, 0], [0, 0, 0, 0]
+    ]
+
+def test_est_ordonne_capacite_nulle():
+    """Une capacité nulle vaut une arrête absente."""
+    g = GrapheOP(voisinage={"A": {"B": 0}, "B": {"C": 1}, "C": {"B": 1}})
+    assert not g.est_ordonne
+
+def test_est_ordonne_modification_directe():
+    """Une modification par `graphe[sommet]` est vue par `est_ordonne`."""
+    g = GrapheOP(voisinage={"A": {"B": 1}, "B": {"A": 1}})
+    assert not g.est_ordonne
+    g["B"]["A"] = 2
+    assert g.est_ordonne
+
+@pytest.mark.parametrize(
+    "aggregation, capacite", [("somme", 7), ("max", 4)]
+)
+def test_par_tableaux(aggregation, capacite):
+    """Arrêtes parallèles fusionnées à la place de leur première occurrence."""
+    import numpy as np
+    depart = np.array(["A", "A", "B", "C", "C", "A"])
+    arrivee = np.array(["B", "C", "D", "B", "D", "B"])
+    g = GrapheOP.par_tableaux(depart, arrivee, np.array([4, 5, 5, 2, 4, 3]), aggregation=aggregation)
+    assert g == GrapheOP(
+        voisinage={"A": {"B": capacite, "C": 5}, "B": {"D": 5}, "C": {"B": 2, "D": 4}, "D": {}}
+    )
+    structure = np.array(
+        list(zip(depart, arrivee, [4.0, 5.0, 5.0, 2.0, 4.0, 3.0])),
+        dtype=[("depart", "U1"), ("arrivee", "U1"), ("capacite", float)]
+    )
+    assert GrapheOP.par_tableaux(structure, aggregation=aggregation)["A"] == {"B": capacite, "C": 5.0}
+    assert GrapheOP.par_tableaux(np.array([2, 1]), np.array([1, 3]), np.array([1, 1])).sommets == ["2", "1", "3"]
+
+def test_par_tableaux_erreurs():
+    """Doit boguer."""
+    import numpy as np
+    depart, arrivee = np.array(["A", "A"]), np.array(["B", "B"])
+    with pytest.raises(ValueError):
+        GrapheOP.par_tableaux(depart, arrivee, np.array([1, 2]), aggregation="erreur")
+    with pytest.raises(ValueError):
+        GrapheOP.par_tableaux(depart, arrivee, np.array([1, 2]), aggregation="moyenne")
+    with pytest.raises(ValueError):
+        GrapheOP.par_tableaux(depart, arrivee, np.array([1]))
+    with pytest.raises(ValueError):
+        GrapheOP.par_tableaux(depart, arrivee)
+    with pytest.raises(ValueError):
+        GrapheOP.par_tableaux(np.array([(1, 2)], dtype=[("u", int), ("v", int)]))
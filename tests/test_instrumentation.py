@@ -0,0 +1,54 @@
+"""Description.
+
+Tests pour la classe Statistiques.
+"""
+
+import pytest
+import numpy as np
+from scipy import sparse
+from FlotMaxLinprog import *
+
+
+def test_phase():
+    """Les durées d'une même phase s'additionnent."""
+    statistiques = Statistiques()
+    with statistiques.phase("A"):
+        pass
+    premiere = statistiques.phases["A"]
+    with statistiques.phase("A"):
+        pass
+    assert statistiques.phases["A"] >= premiere
+
+def test_matrice_creuse():
+    """Forme, coefficients non nuls et octets."""
+    statistiques = Statistiques()
+    matrice = sparse.csr_matrix(np.eye(4))
+    statistiques.matrice("M", matrice)
+    assert statistiques.matrices["M"]["forme"] == (4, 4)
+    assert statistiques.matrices["M"]["nnz"] == 4
+    assert statistiques.octets == (
+        matrice.data.nbytes + matrice.indices.nbytes + matrice.indptr.nbytes
+    )
+
+@pytest.mark.parametrize("creux", [False, True])
+def test_linprog_graph_instrumente(creux):
+    """Le rappel reçoit les mesures, la solution porte les statistiques."""
+    evenements = []
+    linprog_graph = LinprogGraph(
+        GrapheOP(voisinage={'A': {'B': 4, 'C': 5}, 'B': {'D': 5}, 'C': {'B': 2, 'D': 4}, 'D': {}}),
+        creux=creux,
+        instrumentation=lambda evenement, donnees: evenements.append(evenement)
+    )
+    statistiques = linprog_graph.solution.statistiques
+    assert {"structure", "A_eq", "resolution"} <= set(statistiques.phases)
+    assert statistiques.matrices["A_eq"]["forme"] == (4, 7)
+    assert statistiques.solveur["statut"] == 0
+    assert statistiques.solveur["iterations"] == linprog_graph.solution.iterations
+    assert "solveur.iterations" in statistiques.metriques()
+    assert evenements.count("solveur") == 1
+    assert "phase" in evenements and "matrice" in evenements
+
+def test_sans_instrumentation():
+    """Par défaut rien n'est attaché à la solution."""
+    linprog_graph = LinprogGraph(GrapheOP(voisinage={'A': {'B': 1}, 'B': {}}), methode="dinic")
+    assert linprog_graph.solution.statistiques is None
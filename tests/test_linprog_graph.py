@@ -87,3 +87,363 @@ def test_solveur(linprog_graph_test):
         (('C', 'D'), 4.0)
     ]
     assert (sortie == attendu)
+
+@pytest.fixture
+def linprog_graph_creux():
+    return LinprogGraph(
+        GrapheOP(
+            voisinage={
+                'A': {'B': 4, 'C': 5}, 
+                'B': {'D': 5}, 
+                'C': {'B': 2, 'D': 4},
+                'D': {}
+            }
+        ),
+        creux=True
+    )
+
+def test_calcule_A_eq_creux(linprog_graph_creux):
+    """La matrice CSR doit coïncider avec la matrice dense."""
+    sortie = linprog_graph_creux._calcule_A_eq_creux()
+    assert sortie.format == "csr"
+    assert (sortie.toarray() == linprog_graph_creux._calcule_A_eq()).all()
+
+def test_calcule_bornes(linprog_graph_creux):
+    """Test."""
+    sortie = linprog_graph_creux._calcule_bornes()
+    attendu = np.array(
+        [
+            [0, np.inf],
+            [0, 4],
+            [0, 5],
+            [0, 5],
+            [0, 2],
+            [0, 4],
+            [0, np.inf]
+        ]
+    )
+    assert (sortie == attendu).all()
+
+def test_solveur_creux(linprog_graph_creux, linprog_graph_test):
+    """Les deux formulations donnent le même flot."""
+    assert linprog_graph_creux.solveur() == linprog_graph_test.solveur()
+
+def test_indices_arretes(linprog_graph_test):
+    """Indices des extrémités de chaque arrête."""
+    departs, arrivees = linprog_graph_test._indices_arretes()
+    assert departs.tolist() == [0, 0, 1, 2, 2]
+    assert arrivees.tolist() == [1, 2, 3, 1, 3]
+
+@pytest.mark.parametrize("methode", ["dinic", "push_relabel"])
+def test_solveur_combinatoire(methode, linprog_graph_test):
+    """Les algorithmes combinatoires donnent le même flot que HiGHS."""
+    graphe = LinprogGraph(
+        GrapheOP(
+            voisinage={
+                'A': {'B': 4, 'C': 5}, 
+                'B': {'D': 5}, 
+                'C': {'B': 2, 'D': 4},
+                'D': {}
+            }
+        ),
+        methode=methode
+    )
+    assert graphe.solveur() == linprog_graph_test.solveur()
+
+def test_push_relabel_grille():
+    """Grille de quelques milliers d'arrêtes : même valeur que Dinic et HiGHS."""
+    cote = 40
+    rng = np.random.default_rng(0)
+    numeros = np.arange(cote * cote).reshape(cote, cote)
+    departs = np.concatenate((numeros[:, :-1].ravel(), numeros[:-1, :].ravel()))
+    arrivees = np.concatenate((numeros[:, 1:].ravel(), numeros[1:, :].ravel()))
+    graphe = GrapheOP.par_tableaux(
+        departs, arrivees, rng.integers(1, 100, size=len(departs))
+    )
+    source, puits = "0", str(cote * cote - 1)
+    valeurs = [
+        LinprogGraph(graphe, methode=methode, creux=True, source=source, puits=puits).solution.valeur
+        for methode in ("push_relabel", "dinic", "highs")
+    ]
+    assert len(graphe.arretes) > 3000
+    assert valeurs[0] == pytest.approx(valeurs[1]) == pytest.approx(valeurs[2])
+
+@pytest.mark.parametrize("methode", ["highs", "dinic", "push_relabel", "entier"])
+@pytest.mark.parametrize("creux", [False, True])
+def test_graphe_sans_arrete(methode, creux):
+    """Erreur explicite plutôt qu'un puits d'indice -1."""
+    for graphe in (GrapheOP(voisinage={}), GrapheOP(voisinage={'A': {}, 'B': {}})):
+        with pytest.raises(ValueError, match="aucune arrête"):
+            LinprogGraph(graphe, methode=methode, creux=creux).solution
+    with pytest.raises(ValueError, match="aucune arrête"):
+        LinprogGraph(GrapheOP(voisinage={}), reduction=True).solution
+
+@pytest.mark.parametrize("methode", ["highs", "dinic", "push_relabel", "entier"])
+@pytest.mark.parametrize("capacite", ["4", -1, float("nan"), None])
+def test_capacite_invalide(methode, capacite):
+    """Même erreur pour toutes les méthodes."""
+    graphe = GrapheOP(voisinage={'A': {'B': capacite, 'C': 1}, 'B': {}, 'C': {}})
+    with pytest.raises(ValueError, match="A B doit être un nombre positif ou nul"):
+        LinprogGraph(graphe, methode=methode).solution
+    linprog_graph = LinprogGraph(GrapheOP(voisinage={'A': {'B': 1}, 'B': {}}), methode=methode)
+    linprog_graph.solution
+    with pytest.raises(ValueError, match="positif ou nul"):
+        linprog_graph.maj_capacite('A', 'B', -2)
+
+def test_methode_inconnue():
+    """Doit boguer."""
+    with pytest.raises(ValueError):
+        LinprogGraph(GrapheOP(voisinage={'A': {'B': 1}, 'B': {}}), methode="simplexe")
+
+def test_solution_en_cache(linprog_graph_test):
+    """La solution n'est calculée qu'une fois."""
+    solution = linprog_graph_test.solution
+    assert isinstance(solution, Solution)
+    assert solution.valeur == pytest.approx(9)
+    assert solution.statut == 0
+    assert set(solution.temps) == {"construction", "resolution"}
+    linprog_graph_test.solveur()
+    assert linprog_graph_test.solution is solution
+
+def test_solution_invalidee():
+    """Une modification du graphe invalide la solution."""
+    graphe = GrapheOP(voisinage={'A': {'B': 4}, 'B': {'C': 2}, 'C': {}})
+    linprog_graph = LinprogGraph(graphe, methode="dinic")
+    assert linprog_graph.solution.valeur == 2
+    graphe.ajoute_arrete('B', 'C', 3)
+    assert linprog_graph.solution.valeur == 3
+    assert linprog_graph.solveur() == [(('A', 'B'), 3.0), (('B', 'C'), 3.0)]
+
+@pytest.mark.parametrize("methode", ["highs", "dinic", "push_relabel"])
+def test_maj_capacite(methode):
+    """La solution réparée est celle d'une résolution complète."""
+    voisinage = {
+        'A': {'B': 4, 'C': 5},
+        'B': {'D': 5},
+        'C': {'B': 2, 'D': 4},
+        'D': {}
+    }
+    linprog_graph = LinprogGraph(GrapheOP(voisinage=voisinage), methode=methode)
+    assert linprog_graph.solution.valeur == pytest.approx(9)
+    linprog_graph.maj_capacite('C', 'D', 1)
+    assert linprog_graph.solution.valeur == pytest.approx(6)
+    flots = dict(linprog_graph.solveur())
+    assert flots[('B', 'D')] == pytest.approx(5)
+    assert flots[('C', 'D')] == pytest.approx(1)
+    assert flots[('A', 'B')] + flots[('C', 'B')] == pytest.approx(5)
+    linprog_graph.maj_capacite('B', 'D', 8)
+    assert linprog_graph.solution.valeur == pytest.approx(7)
+    assert linprog_graph._grapheOP['B'] == {'D': 8}
+
+@pytest.mark.parametrize("methode", ["highs", "dinic"])
+def test_maj_capacite_flottante(methode):
+    """Une capacité fractionnaire sur un graphe entier n'est pas tronquée."""
+    graphe = GrapheOP(voisinage={'A': {'B': 4, 'C': 5}, 'B': {'D': 5}, 'C': {'B': 2, 'D': 4}, 'D': {}})
+    linprog_graph = LinprogGraph(graphe, methode=methode)
+    linprog_graph.solution
+    linprog_graph.maj_capacite('A', 'B', 2.5)
+    assert linprog_graph.solution.valeur == pytest.approx(7.5)
+    assert linprog_graph.coupe_minimale().capacite == pytest.approx(7.5)
+    verification = linprog_graph.verifie_solution()
+    assert verification.optimal and not verification.depassements
+
+def test_maj_capacite_inconnue(linprog_graph_test):
+    """Doit boguer."""
+    with pytest.raises(ValueError):
+        linprog_graph_test.maj_capacite('D', 'A', 1)
+
+@pytest.mark.parametrize("methode", ["highs", "dinic"])
+def test_source_puits(methode):
+    """Source et puits explicites."""
+    graphe = GrapheOP(
+        voisinage={
+            'A': {'B': 4, 'C': 5},
+            'B': {'D': 5},
+            'C': {'B': 2, 'D': 4},
+            'D': {}
+        }
+    )
+    linprog_graph = LinprogGraph(graphe, methode=methode, source='C', puits='D')
+    assert linprog_graph.solution.valeur == pytest.approx(6)
+    assert linprog_graph._calcule_A_eq()[2, 0] == 1
+    with pytest.raises(ValueError):
+        LinprogGraph(graphe, source='E').solution
+
+@pytest.mark.parametrize("creux", [False, True])
+@pytest.mark.parametrize("methode", ["highs", "dinic"])
+def test_coupe_minimale(creux, methode):
+    """Coupe minimale et criticité des arrêtes."""
+    linprog_graph = LinprogGraph(
+        GrapheOP(
+            voisinage={
+                'A': {'B': 4, 'C': 5},
+                'B': {'D': 5},
+                'C': {'B': 2, 'D': 4},
+                'D': {}
+            }
+        ),
+        creux=creux,
+        methode=methode
+    )
+    coupe = linprog_graph.coupe_minimale()
+    assert coupe.cote_source == {'A'}
+    assert coupe.arretes == [('A', 'B'), ('A', 'C')]
+    assert coupe.capacite == 9
+    assert linprog_graph.solution.criticite.tolist() == [1, 1, 0, 0, 0]
+
+def test_cout_minimal():
+    """Le flot maximal passe par le chemin le moins cher."""
+    graphe = GrapheOP.par_str_ordonne(
+        """
+S A 4 1
+S B 4 5
+A T 3 1
+B T 4 1
+A B 2 1
+"""
+    )
+    linprog_graph = LinprogGraph(graphe, methode="cout_minimal", source="S", puits="T")
+    solution = linprog_graph.solution
+    assert solution.valeur == 7
+    assert solution.cout == 4 * 1 + 3 * 1 + 1 * 1 + 3 * 5 + 4 * 1
+    assert dict(linprog_graph.solveur())[('S', 'A')] == 4
+    highs = LinprogGraph(graphe, source="S", puits="T")
+    assert highs.solution.cout >= solution.cout
+
+def test_cout_minimal_cycle_negatif():
+    """Coûts négatifs acceptés, mais pas un cycle de coût négatif."""
+    graphe = GrapheOP.par_str_ordonne(
+        """
+S A 2 1
+A T 2 -1
+"""
+    )
+    assert LinprogGraph(graphe, methode="cout_minimal", source="S", puits="T").solution.cout == 0
+    graphe.ajoute_arrete("A", "B", 1, -3)
+    graphe.ajoute_arrete("B", "A", 1, 1)
+    with pytest.raises(ValueError, match="cycle de coût négatif"):
+        LinprogGraph(graphe, methode="cout_minimal", source="S", puits="T").solution
+
+def test_cout_minimal_sans_couts(linprog_graph_test):
+    """Doit boguer."""
+    with pytest.raises(ValueError):
+        LinprogGraph(GrapheOP(voisinage={'A': {'B': 1}, 'B': {}}), methode="cout_minimal")
+
+@pytest.mark.parametrize("methode", ["highs", "dinic", "push_relabel"])
+def test_reduction(methode):
+    """Même valeur sur le réseau réduit, flot reporté sur toutes les arrêtes."""
+    graphe = GrapheOP.par_str_ordonne(
+        """
+S A 4
+A B 3
+B T 5
+S C 2
+C T 6
+E S 3
+A F 1
+"""
+    )
+    linprog_graph = LinprogGraph(
+        graphe, methode=methode, source="S", puits="T",
+        reduction=True, instrumentation=True
+    )
+    solution = linprog_graph.solution
+    assert solution.valeur == pytest.approx(5)
+    assert solution.statistiques.solveur["arretes_reduites"] == 1
+    flots = dict(linprog_graph.solveur())
+    assert flots[('S', 'A')] == flots[('A', 'B')] == flots[('B', 'T')] == pytest.approx(3)
+    assert flots[('S', 'C')] == flots[('C', 'T')] == pytest.approx(2)
+    assert flots[('E', 'S')] == flots[('A', 'F')] == 0
+    avec_couts = GrapheOP(voisinage={'A': {'B': 1}, 'B': {}}, couts={'A': {'B': 2}})
+    with pytest.raises(ValueError):
+        LinprogGraph(avec_couts, methode="cout_minimal", reduction=True)
+
+@pytest.mark.parametrize("reduction", [False, True])
+def test_entier(reduction):
+    """Flots entiers exacts, même au-delà de la précision des flottants."""
+    grand = 2 ** 60
+    graphe = GrapheOP(
+        voisinage={'A': {'B': grand + 1, 'C': 3}, 'B': {'D': grand}, 'C': {'B': 2, 'D': 1}, 'D': {}}
+    )
+    linprog_graph = LinprogGraph(graphe, methode="entier", reduction=reduction)
+    solution = linprog_graph.solution
+    assert solution.flots.dtype == np.int64
+    assert solution.valeur == grand + 1
+    flots = dict(linprog_graph.solveur())
+    assert flots[('A', 'B')] + flots[('C', 'B')] == flots[('B', 'D')] == grand
+    assert linprog_graph.coupe_minimale().capacite == grand + 1
+    linprog_graph.maj_capacite('C', 'D', 3)
+    assert linprog_graph.solution.valeur == grand + 3
+    with pytest.raises(ValueError):
+        linprog_graph.maj_capacite('C', 'D', 2.5)
+    flottant = GrapheOP(voisinage={'A': {'B': 1.5}, 'B': {}})
+    with pytest.raises(ValueError):
+        LinprogGraph(flottant, methode="entier").solution
+
+@pytest.mark.parametrize("methode", ["highs", "dinic", "entier"])
+def test_verifie_solution(methode, linprog_graph_test):
+    """Le flot calculé est certifié maximal par une coupe de même capacité."""
+    linprog_graph = LinprogGraph(linprog_graph_test._grapheOP, methode=methode)
+    verification = linprog_graph.verifie_solution()
+    assert verification.admissible and verification.optimal
+    assert verification.valeur == pytest.approx(9)
+    assert verification.coupe.capacite == 9
+    assert verification.ecart == pytest.approx(0)
+
+def test_verifie_solution_violations(linprog_graph_test):
+    """Dépassements, déséquilibres et flot non maximal."""
+    # Arrêtes : A-B, A-C, B-D, C-B, C-D.
+    verification = linprog_graph_test.verifie_solution(np.array([4, 5, 5, 1, 3]))
+    assert verification.desequilibres == [('C', 1)]
+    assert not verification.admissible and not verification.optimal
+    verification = linprog_graph_test.verifie_solution(np.array([4, 5, 6, 2, 3]))
+    assert verification.depassements == [(('B', 'D'), 1)]
+    assert verification.desequilibres == []
+    verification = linprog_graph_test.verifie_solution(np.array([3, 4, 3, 0, 4]))
+    assert verification.admissible and not verification.optimal
+    assert verification.puits_atteignable and verification.valeur == 7
+    verification = linprog_graph_test.verifie_solution(
+        np.array([4, 5, 5, 1, 4 + 1e-3]), tolerance=1e-2
+    )
+    assert verification.optimal
+    with pytest.raises(ValueError):
+        linprog_graph_test.verifie_solution(np.zeros(4))
+
+def test_solution_sauvegarde(linprog_graph_test, tmp_path):
+    """Aller-retour binaire de la solution."""
+    solution = linprog_graph_test.solution
+    solution.sauvegarde(tmp_path / "solution")
+    relue = Solution.charge(tmp_path / "solution")
+    assert relue.en_liste() == solution.en_liste()
+    assert relue.valeur == solution.valeur
+    assert relue.criticite.tolist() == solution.criticite.tolist()
+    assert relue.temps == solution.temps
+    assert relue.cout is None
+
+@pytest.mark.parametrize("extension", ["png", "svg"])
+def test_genere_graphique_fichier(linprog_graph_test, tmp_path, extension):
+    """Ecriture directe dans un fichier, sans affichage."""
+    fichier = tmp_path / f"flot.{extension}"
+    figure = linprog_graph_test.genere_graphique(fichier=fichier, disposition="couches")
+    assert fichier.stat().st_size > 0
+    assert figure.axes[0].get_title() == "Visualisation du flot maximal"
+
+def test_arretes_tracees(linprog_graph_test):
+    """Filtres sur le flot, la saturation et les k plus grands flots."""
+    assert linprog_graph_test._arretes_tracees("tous", None).tolist() == [0, 1, 2, 3, 4]
+    assert linprog_graph_test._arretes_tracees("sature", None).tolist() == [0, 1, 2, 4]
+    assert linprog_graph_test._arretes_tracees("flot", 2).tolist() == [1, 2]
+    with pytest.raises(ValueError):
+        linprog_graph_test._arretes_tracees("vide", None)
+
+def test_disposition_en_cache(linprog_graph_test, tmp_path):
+    """La disposition est réutilisée tant que les arrêtes ne changent pas."""
+    positions = linprog_graph_test._disposition("couches")
+    assert positions['A'] == (0.0, 0)
+    assert positions['D'][1] == -2
+    linprog_graph_test.maj_capacite('C', 'D', 1)
+    assert linprog_graph_test._disposition("couches") is positions
+    linprog_graph_test._grapheOP.ajoute_arrete('D', 'E', 1)
+    assert linprog_graph_test._disposition("couches") is not positions
+    with pytest.raises(ValueError):
+        linprog_graph_test._disposition("cercle")
@@ -0,0 +1,43 @@
+"""Description.
+
+Tests pour la résolution par lots.
+"""
+
+import pytest
+from FlotMaxLinprog import *
+
+
+@pytest.fixture
+def graphes():
+    return [
+        GrapheOP(voisinage={'A': {'B': capacite}, 'B': {'C': 3}, 'C': {}})
+        for capacite in range(1, 6)
+    ]
+
+def test_resout_lot_ordonne(graphes):
+    """Les solutions arrivent dans l'ordre des graphes."""
+    resultats = list(resout_lot(graphes, methode="dinic", n_processus=2, taille_paquet=2))
+    assert [indice for indice, _ in resultats] == [0, 1, 2, 3, 4]
+    assert [solution.valeur for _, solution in resultats] == [1, 2, 3, 3, 3]
+    assert resultats[0][1].en_liste() == [(('A', 'B'), 1.0), (('B', 'C'), 1.0)]
+
+def test_resout_lot_desordonne(graphes):
+    """Toutes les solutions arrivent, dans un ordre quelconque."""
+    resultats = dict(resout_lot(graphes, n_processus=2, ordonne=False))
+    assert sorted(resultats) == [0, 1, 2, 3, 4]
+    assert resultats[4].valeur == pytest.approx(3)
+
+def test_resout_lot_repertoire(tmp_path):
+    """Lecture d'un répertoire de listes d'arrêtes."""
+    (tmp_path / "a.txt").write_text("A B 4\nA C 5\nB D 5\nC B 2\nC D 4\n")
+    (tmp_path / "b.txt").write_text("X Y 2\n")
+    resultats = list(resout_lot(tmp_path, methode="push_relabel", n_processus=1))
+    assert [solution.valeur for _, solution in resultats] == [9, 2]
+
+def test_resout_lot_binaire(graphes, tmp_path):
+    """Les sous-répertoires sauvegardés sont relus en mémoire projetée."""
+    for indice, graphe in enumerate(graphes[:2]):
+        GrapheCSR.par_grapheOP(graphe).sauvegarde(tmp_path / f"g{indice}")
+    (tmp_path / "h.txt").write_text("X Y 2\n")
+    resultats = list(resout_lot(tmp_path, methode="dinic", n_processus=1))
+    assert [solution.valeur for _, solution in resultats] == [1, 2, 2]
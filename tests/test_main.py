@@ -0,0 +1,110 @@
+"""Description.
+
+Tests de la ligne de commande.
+"""
+
+import io
+import json
+import pytest
+from FlotMaxLinprog import *
+from FlotMaxLinprog.__main__ import main
+
+
+def lignes(sortie: str):
+    return [json.loads(ligne) for ligne in sortie.splitlines()]
+
+def test_jsonl_entree_standard(monkeypatch, capsys):
+    """Une ligne de résultat par instance, erreurs comprises."""
+    monkeypatch.setattr("sys.stdin", io.StringIO(
+        '{"id": "a", "arretes": [["A", "B", 4], ["B", "C", 3]]}\n'
+        '\n'
+        '{"voisinage": {"X": {"Y": 2}, "Y": {}}, "source": "X", "puits": "Y"}\n'
+        '{"arretes": [["A", "B", 1], ["A", "B", 2]]}\n'
+        'pas du json\n'
+    ))
+    main(["-", "--methode", "dinic"])
+    resultats = lignes(capsys.readouterr().out)
+    assert [resultat["id"] for resultat in resultats] == ["a", "-:3", "-:4", "-:5"]
+    assert resultats[0]["valeur"] == 3
+    assert resultats[0]["flots"] == [["A", "B", 3.0], ["B", "C", 3.0]]
+    assert "total" in resultats[0]["temps"]
+    assert resultats[1]["valeur"] == 2
+    assert "erreur" in resultats[2] and "erreur" in resultats[3]
+
+def test_liste_arretes_entree_standard(monkeypatch, capsys):
+    """Liste d'arrêtes sur l'entrée standard, sans les flots."""
+    monkeypatch.setattr("sys.stdin", io.StringIO("A B 4\nA C 5\nB D 5\nC B 2\nC D 4\n"))
+    main(["-", "--format", "arretes", "--sans-flots", "--creux"])
+    resultat, = lignes(capsys.readouterr().out)
+    assert resultat["valeur"] == pytest.approx(9)
+    assert "flots" not in resultat
+
+def test_repertoire(tmp_path, capsys):
+    """Fichiers, graphes sauvegardés et JSON Lines d'un répertoire."""
+    (tmp_path / "a.txt").write_text("A B 4\nA C 5\nB D 5\nC B 2\nC D 4\n")
+    GrapheOP(voisinage={'X': {'Y': 2}, 'Y': {}}).sauvegarde(tmp_path / "b")
+    (tmp_path / "c.jsonl").write_text('{"arretes": [["U", "V", 7]]}\n')
+    main([str(tmp_path), "--methode", "push_relabel"])
+    resultats = lignes(capsys.readouterr().out)
+    assert [resultat["valeur"] for resultat in resultats] == [9, 2, 7]
+    assert resultats[2]["id"] == f"{tmp_path / 'c.jsonl'}:1"
+
+@pytest.mark.parametrize("methode", ["highs", "dinic"])
+def test_instances_invalides(monkeypatch, capsys, methode):
+    """Une ligne invalide ou une résolution qui échoue n'arrête pas le traitement."""
+    monkeypatch.setattr("sys.stdin", io.StringIO(
+        '[1, 2]\n'
+        '{"arretes": [["A", "B", null]]}\n'
+        '{"arretes": [["A", "B", 4]]}\n'
+    ))
+    main(["-", "--methode", methode])
+    resultats = lignes(capsys.readouterr().out)
+    assert [resultat["id"] for resultat in resultats] == ["-:1", "-:2", "-:3"]
+    assert set(resultats[0]) == set(resultats[1]) == {"id", "erreur"}
+    assert resultats[2]["valeur"] == 4
+
+def test_couts(monkeypatch, capsys):
+    """Coûts en quatrième colonne des arrêtes ou en champ `couts`."""
+    monkeypatch.setattr("sys.stdin", io.StringIO(
+        '{"arretes": [["A", "B", 2, 1], ["B", "D", 2, 1], ["A", "C", 2, 5], ["C", "D", 2, 5], ["A", "D", 1]]}\n'
+        '{"voisinage": {"A": {"B": 1}, "B": {}}, "couts": {"A": {"B": 3}}}\n'
+        '{"arretes": [["A", "B", 1]]}\n'
+    ))
+    main(["-", "--methode", "cout_minimal"])
+    resultats = lignes(capsys.readouterr().out)
+    assert resultats[0]["valeur"] == pytest.approx(5)
+    assert resultats[1]["valeur"] == pytest.approx(1)
+    assert "erreur" in resultats[2]
+
+@pytest.mark.parametrize("methode", ["highs", "cout_minimal"])
+def test_formes_invalides(monkeypatch, capsys, methode):
+    """Arrêtes vides ou mal formées, coûts qui ne sont pas un objet d'objets."""
+    monkeypatch.setattr("sys.stdin", io.StringIO(
+        '{"arretes": []}\n'
+        '{"arretes": [["s", "t", 3]], "couts": 3}\n'
+        '{"arretes": [["s", "t"]]}\n'
+        '{"voisinage": {"s": 3}}\n'
+        '{"arretes": [["s", "t", 3, 1]]}\n'
+    ))
+    main(["-", "--methode", methode])
+    resultats = lignes(capsys.readouterr().out)
+    assert [resultat["id"] for resultat in resultats] == ["-:1", "-:2", "-:3", "-:4", "-:5"]
+    assert all(set(resultat) == {"id", "erreur"} for resultat in resultats[:4])
+    assert "`couts`" in resultats[1]["erreur"]
+    assert resultats[4]["valeur"] == pytest.approx(3)
+
+def test_liste_arretes_invalide(monkeypatch, capsys):
+    """Une liste d'arrêtes mal formée sur l'entrée standard donne une ligne d'erreur."""
+    monkeypatch.setattr("sys.stdin", io.StringIO("A B\nB C 2\n"))
+    main(["-", "--format", "arretes"])
+    resultat, = lignes(capsys.readouterr().out)
+    assert set(resultat) == {"id", "erreur"} and resultat["id"] == "-"
+
+def test_repertoire_fichier_vide(tmp_path, capsys):
+    """Un fichier vide dans un répertoire n'interrompt pas les suivants."""
+    (tmp_path / "a.txt").write_text("")
+    (tmp_path / "b.txt").write_text("A B 4\n")
+    main([str(tmp_path)])
+    resultats = lignes(capsys.readouterr().out)
+    assert set(resultats[0]) == {"id", "erreur"}
+    assert resultats[1]["valeur"] == 4
@@ -0,0 +1,67 @@
+"""Description.
+
+Tests pour la classe FlotMultiProduits.
+"""
+
+import pytest
+import numpy as np
+from FlotMaxLinprog import *
+
+
+@pytest.fixture
+def graphe():
+    return GrapheOP(
+        voisinage={
+            'A': {'B': 4, 'C': 5},
+            'B': {'D': 5},
+            'C': {'B': 2, 'D': 4},
+            'D': {}
+        }
+    )
+
+def test_un_produit(graphe):
+    """Un seul produit sans demande : le flot maximal."""
+    solution = FlotMultiProduits(graphe, [('A', 'D', None)]).solution
+    assert solution.valeurs.tolist() == pytest.approx([9])
+    assert solution.arretes == [(d, a) for d, a, _ in graphe.arretes]
+    assert dict(solution.en_liste(0))[('A', 'B')] == pytest.approx(4)
+
+def test_capacites_partagees(graphe):
+    """La somme des flots des produits respecte chaque capacité."""
+    probleme = FlotMultiProduits(graphe, [('A', 'D', None), ('C', 'D', None), ('A', 'B', 3)])
+    solution = probleme.solution
+    capacites = np.array([capacite for _, _, capacite in graphe.arretes])
+    assert (solution.flots.sum(axis=0) <= capacites + 1e-9).all()
+    assert solution.valeurs.sum() == pytest.approx(10)
+    assert solution.valeurs[2] <= 3 + 1e-9
+
+def test_blocs_creux(graphe):
+    """Un bloc d'incidence par produit, sans matrice dense."""
+    probleme = FlotMultiProduits(graphe, [('A', 'D', 1), ('C', 'B', 1), ('B', 'D', 1)])
+    A_eq = probleme._calcule_A_eq()
+    assert A_eq.shape == (3 * 4, 3 * 5 + 3)
+    assert A_eq.nnz == 3 * 2 * 5 + 3 * 2
+    assert probleme._calcule_A_ub().nnz == 3 * 5
+
+def test_concurrent(graphe):
+    """Fraction commune des demandes, et flots proportionnels aux demandes."""
+    solution = FlotMultiProduits(
+        graphe, [('A', 'D', 12), ('C', 'B', 1)], mode="concurrent"
+    ).solution
+    assert solution.taux == pytest.approx(0.75)
+    assert solution.valeurs.tolist() == pytest.approx([9, 0.75])
+
+@pytest.mark.parametrize(
+    "produits, mode",
+    [
+        ([('A', 'E', 1)], "maximal"),
+        ([('A', 'A', 1)], "maximal"),
+        ([('A', 'D', None)], "concurrent"),
+        ([], "maximal"),
+        ([('A', 'D', 1)], "inconnu"),
+    ]
+)
+def test_erreurs(graphe, produits, mode):
+    """Doit boguer."""
+    with pytest.raises(ValueError):
+        FlotMultiProduits(graphe, produits, mode=mode)
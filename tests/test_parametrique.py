@@ -0,0 +1,61 @@
+"""Description.
+
+Tests pour le flot maximal paramétrique.
+"""
+
+import pytest
+import numpy as np
+from FlotMaxLinprog import *
+
+
+@pytest.fixture
+def graphe():
+    return GrapheOP(
+        voisinage={'A': {'B': 4, 'C': 5}, 'B': {'D': 5}, 'C': {'B': 2, 'D': 4}, 'D': {}}
+    )
+
+@pytest.mark.parametrize("arrete", [('A', 'B'), ('A', 'C'), ('C', 'B'), ('C', 'D')])
+def test_capacite_arrete(graphe, arrete):
+    """La courbe interpole exactement les résolutions complètes."""
+    courbe = courbe_parametrique(graphe, 0, 12, arrete=arrete)
+    assert courbe.evaluations <= 2 * len(courbe.ruptures) + 3
+    for parametre in np.linspace(0, 12, 25):
+        modifie = GrapheOP.par_sommets_arretes(
+            sommets=[],
+            arretes=[
+                (depart, arrivee, parametre if (depart, arrivee) == arrete else capacite)
+                for depart, arrivee, capacite in graphe.arretes
+            ]
+        )
+        attendu = LinprogGraph(modifie, methode="dinic").solution.valeur
+        assert courbe.valeur(parametre) == pytest.approx(attendu)
+
+def test_flots(graphe):
+    """Un flot maximal admissible en chaque point de la courbe."""
+    courbe = courbe_parametrique(graphe, 0, 10, arrete=('A', 'B'))
+    assert courbe.ruptures.tolist() == [4.0]
+    capacites = dict(((depart, arrivee), capacite) for depart, arrivee, capacite in graphe.arretes)
+    for parametre, flots, valeur in zip(courbe.parametres, courbe.flots, courbe.valeurs):
+        capacites[('A', 'B')] = parametre
+        assert all(
+            0 <= flot <= capacites[arrete] + 1e-9
+            for arrete, flot in zip(courbe.arretes, flots)
+        )
+        sortant = sum(flot for (depart, _), flot in zip(courbe.arretes, flots) if depart == 'A')
+        assert sortant == pytest.approx(valeur)
+
+def test_echelle(graphe):
+    """Multiplier toutes les capacités par λ multiplie le flot par λ."""
+    courbe = courbe_parametrique(graphe, 0, 3)
+    assert courbe.parametres.tolist() == [0.0, 3.0]
+    assert courbe.valeur(2) == pytest.approx(18)
+    assert courbe.evaluations == 2
+
+def test_erreurs(graphe):
+    """Doit boguer."""
+    with pytest.raises(ValueError):
+        courbe_parametrique(graphe, 2, 1)
+    with pytest.raises(ValueError):
+        courbe_parametrique(graphe, -1, 1)
+    with pytest.raises(ValueError):
+        courbe_parametrique(graphe, 0, 1, arrete=('D', 'A'))
@@ -0,0 +1,53 @@
+"""Description.
+
+Tests pour la classe Reduction.
+"""
+
+import numpy as np
+from FlotMaxLinprog.reduction import Reduction
+
+
+def test_elagage():
+    """Les arrêtes hors des chemins source-puits et les boucles disparaissent."""
+    reduction = Reduction(
+        n_sommets=5,
+        departs=np.array([0, 0, 1, 4, 2]),
+        arrivees=np.array([1, 2, 3, 1, 2]),
+        capacites=np.array([4., 5., 5., 2., 3.]),
+        source=0,
+        puits=3
+    )
+    assert reduction.n_arretes == 1
+    assert reduction.capacites.tolist() == [4]
+    assert reduction.etend(np.array([4.])).tolist() == [4, 0, 4, 0, 0]
+
+def test_serie_parallele():
+    """Deux chaînes parallèles donnent une seule arrête."""
+    reduction = Reduction(
+        n_sommets=4,
+        departs=np.array([0, 1, 0, 2]),
+        arrivees=np.array([1, 3, 2, 3]),
+        capacites=np.array([4., 3., 5., 2.]),
+        source=0,
+        puits=3
+    )
+    assert (reduction.n_sommets, reduction.n_arretes) == (2, 1)
+    assert (reduction.source, reduction.puits) == (0, 1)
+    assert reduction.capacites.tolist() == [5]
+    flots = reduction.etend(np.array([4.]))
+    assert flots[0] == flots[1]
+    assert flots[2] == flots[3]
+    assert flots[0] + flots[2] == 4
+
+def test_sans_chemin():
+    """Aucune arrête ne reste si le puits n'est pas atteignable."""
+    reduction = Reduction(
+        n_sommets=3,
+        departs=np.array([0, 2]),
+        arrivees=np.array([1, 1]),
+        capacites=np.array([1., 1.]),
+        source=0,
+        puits=2
+    )
+    assert reduction.n_arretes == 0
+    assert reduction.etend(np.zeros(0)).tolist() == [0, 0]
@@ -0,0 +1,52 @@
+"""Description.
+
+Tests pour la résolution par scénarios de capacités.
+"""
+
+import pytest
+import numpy as np
+from FlotMaxLinprog import *
+
+
+@pytest.fixture
+def graphe():
+    # 'D' apparaît avant 'C' : l'ordre des colonnes du problème diffère de `arretes`.
+    return GrapheOP(
+        voisinage={'A': {'D': 3, 'B': 4}, 'C': {'D': 6}, 'B': {'C': 5}, 'D': {}}
+    )
+
+@pytest.mark.parametrize("methode", ["highs", "dinic", "push_relabel"])
+def test_memes_valeurs(graphe, methode):
+    """Chaque scénario donne la valeur d'une résolution complète."""
+    capacites = np.random.default_rng(0).integers(0, 10, size=(6, 4))
+    flots, valeurs = resout_scenarios(
+        graphe, capacites, methode=methode, source='A', puits='D'
+    )
+    assert flots.shape == (6, 4)
+    for capacites_scenario, flots_scenario, valeur in zip(capacites, flots, valeurs):
+        scenario = GrapheOP(voisinage={'A': {}, 'B': {}, 'C': {}, 'D': {}})
+        for (depart, arrivee, _), capacite in zip(graphe.arretes, capacites_scenario):
+            scenario.ajoute_arrete(depart, arrivee, int(capacite))
+        attendu = LinprogGraph(scenario, methode="dinic", source='A', puits='D').solution
+        assert valeur == pytest.approx(attendu.valeur)
+        assert (flots_scenario <= capacites_scenario + 1e-9).all()
+        assert flots_scenario[0] + flots_scenario[1] == pytest.approx(valeur)
+
+def test_parallele(graphe):
+    """Mêmes résultats répartis sur deux processus."""
+    capacites = np.random.default_rng(1).integers(0, 10, size=(5, 4))
+    flots, valeurs = resout_scenarios(graphe, capacites, methode="dinic")
+    flots_pool, valeurs_pool = resout_scenarios(
+        graphe, capacites, methode="dinic", n_processus=2
+    )
+    assert np.array_equal(valeurs, valeurs_pool)
+    assert np.array_equal(flots, flots_pool)
+
+def test_erreurs(graphe):
+    """Doit boguer."""
+    with pytest.raises(ValueError):
+        resout_scenarios(graphe, np.ones((2, 3)))
+    with pytest.raises(ValueError):
+        resout_scenarios(graphe, np.ones((2, 4)), methode="cout_minimal")
+    with pytest.raises(ValueError):
+        resout_scenarios(graphe, -np.ones((2, 4)), methode="dinic")